@@ -0,0 +1,67 @@
+"""
+Memory benchmark for Matches string storages.
+
+    python src/benchmarks/matches_memory.py
+
+Compares the current layout (python strings in object columns) with
+Matches.with_string_storage. "pyarrow" is skipped if pyarrow is not installed.
+"""
+
+import numpy as np
+
+from tournament_simulations.data_structures import Matches
+
+from matches_per_id import create_matches
+
+NUM_TOURNAMENTS = (1_000, 10_000)
+STORAGES = ("python", "pyarrow")
+
+
+def create_matches_with_strings(num_tournaments: int) -> Matches:
+
+    matches = create_matches(num_tournaments)
+    num_matches = len(matches.df)
+
+    rng = np.random.default_rng(0)
+    home_goals, away_goals = rng.integers(0, 5, size=(2, num_matches))
+
+    # unique python strings per match, as if they had been read from a file
+    matches.df["result"] = [f"{h}:{a}" for h, a in zip(home_goals, away_goals)]
+    matches.df["winner"] = np.select(
+        [home_goals > away_goals, home_goals == away_goals], ["h", "d"], "a"
+    ).astype(object)
+    matches.df["date"] = [f"{day % 28 + 1:02d}.08.2022" for day in range(num_matches)]
+
+    return matches
+
+
+def memory(matches: Matches) -> int:
+    return int(matches.df.memory_usage(deep=True).sum())
+
+
+def main() -> None:
+
+    for num_tournaments in NUM_TOURNAMENTS:
+        matches = create_matches_with_strings(num_tournaments)
+        baseline = memory(matches)
+
+        print(
+            f"{num_tournaments:>7} tournaments | {'object':<8} | "
+            f"{baseline / 1e6:8.1f} MB"
+        )
+
+        for storage in STORAGES:
+            try:
+                stored = memory(matches.with_string_storage(storage))
+            except ImportError:
+                print(f"{num_tournaments:>7} tournaments | {storage:<8} | skipped")
+                continue
+
+            print(
+                f"{num_tournaments:>7} tournaments | {storage:<8} | "
+                f"{stored / 1e6:8.1f} MB | {stored / baseline:6.1%} of object"
+            )
+
+
+if __name__ == "__main__":
+    main()
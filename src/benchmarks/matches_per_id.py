@@ -0,0 +1,71 @@
+"""
+Benchmark for Matches per-id properties.
+
+    python src/benchmarks/matches_per_id.py
+
+Each tournament is a double round-robin with 20 teams (380 matches).
+Time per tournament should stay roughly constant as the number of
+tournaments grows, that is, properties scale linearly.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from tournament_simulations.data_structures import Matches
+
+NUM_TOURNAMENTS = (1_000, 10_000, 100_000)
+NUM_TEAMS = 20
+
+PROPERTIES = (
+    "team_names_per_id",
+    "number_of_matches_per_id",
+    "home_vs_away_count_per_id",
+)
+
+
+def create_matches(num_tournaments: int) -> Matches:
+
+    home, away = np.array(
+        [(h, a) for h in range(NUM_TEAMS) for a in range(NUM_TEAMS) if h != a]
+    ).T
+    num_matches = len(home)
+
+    teams = pd.Categorical.from_codes(
+        np.tile(home, num_tournaments), [f"team {i}" for i in range(NUM_TEAMS)]
+    )
+    df = pd.DataFrame(
+        {
+            "id": pd.Categorical.from_codes(
+                np.repeat(np.arange(num_tournaments), num_matches),
+                [f"id {i:06d}" for i in range(num_tournaments)],
+            ),
+            "date number": np.tile(np.arange(num_matches) // 10, num_tournaments),
+            "home": teams,
+            "away": teams.from_codes(np.tile(away, num_tournaments), teams.categories),
+            "winner": "h",
+        }
+    )
+    return Matches(df)
+
+
+def main() -> None:
+
+    for num_tournaments in NUM_TOURNAMENTS:
+        matches = create_matches(num_tournaments)
+
+        for name in PROPERTIES:
+            start = time.perf_counter()
+            getattr(matches, name)
+            elapsed = time.perf_counter() - start
+
+            per_tournament = elapsed / num_tournaments * 1e6
+            print(
+                f"{num_tournaments:>7} tournaments | {name:<26} | "
+                f"{elapsed:8.3f} s | {per_tournament:6.2f} us per tournament"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+from data_structures.utils import compact
+
+
+@pytest.mark.parametrize(
+    "values, expected",
+    [
+        (np.array([0, 127, -128]), np.int8),
+        (np.array([0, 128]), np.int16),
+        (np.array([0, 2**31]), np.int64),
+        (np.array([1.5, 2.25, np.nan]), np.float32),
+        (np.array([1e300]), np.float64),
+        (np.array([1e-50]), np.float64),
+        (np.array([0.1, 2.5]), np.float64),  # 0.1 would be rounded
+        (np.array(["a"], dtype=object), object),
+    ],
+)
+def test_smallest_safe_dtype(values: np.ndarray, expected: type):
+    assert compact.smallest_safe_dtype(values) == np.dtype(expected)
+
+
+def test_compact_frame():
+
+    df = pd.DataFrame(
+        {
+            "date number": np.arange(300),
+            "winner": ["h", "h", "d"] * 100,
+            "date": [f"{day}.01.2022" for day in range(300)],
+            "odds": [1.5, 2.0, np.nan] * 100,
+        },
+        index=pd.Index(np.arange(300) * 10, name="index"),
+    )
+    compacted, bytes_saved = compact.compact_frame(df)
+
+    assert compacted.dtypes.to_dict() == {
+        "date number": np.dtype(np.int16),
+        "winner": pd.CategoricalDtype(["d", "h"]),
+        "date": np.dtype(object),
+        "odds": np.dtype(np.float32),
+    }
+    assert bytes_saved > 0
+    assert bytes_saved == (
+        df.memory_usage(deep=True).sum() - compacted.memory_usage(deep=True).sum()
+    )
+    assert compacted.index.equals(df.index)
+    assert compacted.astype(df.dtypes).equals(df)
+
+
+def test_cast_like():
+
+    reference = pd.DataFrame(
+        {
+            "date number": np.array([0, 1], dtype=np.int8),
+            "winner": pd.Categorical(["h", "d"]),
+        }
+    )
+    df = pd.DataFrame({"date number": [2, 300], "winner": ["h", "a"]})
+
+    cast = compact.cast_like(df.iloc[:1], reference)
+    assert cast.dtypes.astype(str).equals(reference.dtypes.astype(str))
+    assert cast.astype(object).equals(df.iloc[:1].astype(object))
+
+    # 300 does not fit in int8
+    cast = compact.cast_like(df, reference)
+    assert cast["date number"].dtype == np.int64
+    assert isinstance(cast["winner"].dtype, pd.CategoricalDtype)
+    assert cast["winner"].tolist() == ["h", "a"]
+
+
+def test_compact_frame__lossy_columns():
+
+    df = pd.DataFrame({"odds": [1.85, 2.1, np.nan], "other": [1.85, 2.1, np.nan]})
+
+    compacted, _ = compact.compact_frame(df, lossy_columns=["odds"])
+
+    assert compacted["odds"].dtype == np.float32
+    assert compacted["other"].dtype == np.float64
+    assert np.allclose(compacted["odds"], df["odds"], rtol=1e-6, equal_nan=True)
+
+    # overflowing values are never downcast
+    compacted, _ = compact.compact_frame(pd.DataFrame({"odds": [1e300]}), ["odds"])
+    assert compacted["odds"].dtype == np.float64
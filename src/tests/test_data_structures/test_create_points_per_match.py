@@ -3,7 +3,7 @@ import data_structures.points_per_match.create_points_per_match as cppm
 import pandas as pd
 
 
-def test_get_teams_points_per_match_first():
+def test_get_teams_points_columns_first():
 
     values = [("A", "B", "a"), ("B", "C", "h"), ("a", "b", "d")]
     index = ["1", "1", "2"]
@@ -11,22 +11,20 @@ def test_get_teams_points_per_match_first():
 
     result_to_points = {"h": (3, 0), "d": (1, 1), "a": (0, 3)}
 
-    expected_values = [("A", 0), ("B", 3), ("B", 3), ("C", 0), ("a", 1), ("b", 1)]
-    expected_index = ["1", "1", "1", "1", "2", "2"]
-    expected = pd.Series(expected_values, expected_index)
-
-    assert cppm._get_teams_points_per_match(test, result_to_points).equals(expected)
+    index, teams, points = cppm._get_teams_points_columns(test, result_to_points)
+    assert index.tolist() == ["1", "1", "1", "1", "2", "2"]
+    assert teams.tolist() == ["A", "B", "B", "C", "a", "b"]
+    assert points.tolist() == [0, 3, 3, 0, 1, 1]
 
     result_to_points = {"h": (2, 1), "d": (0, 0), "a": (1, 2)}
 
-    expected_values = [("A", 1), ("B", 2), ("B", 2), ("C", 1), ("a", 0), ("b", 0)]
-    expected_index = ["1", "1", "1", "1", "2", "2"]
-    expected = pd.Series(expected_values, expected_index)
-
-    assert cppm._get_teams_points_per_match(test, result_to_points).equals(expected)
+    index, teams, points = cppm._get_teams_points_columns(test, result_to_points)
+    assert index.tolist() == ["1", "1", "1", "1", "2", "2"]
+    assert teams.tolist() == ["A", "B", "B", "C", "a", "b"]
+    assert points.tolist() == [1, 2, 2, 1, 0, 0]
 
 
-def test_get_teams_points_per_match_second():
+def test_get_teams_points_columns_second():
 
     values = [("A", "C", "2-3"), ("B", "C", "1-1"), ("a", "d", "1-3"), ("a", "b", "n")]
     index = ["1", "1", "2", "2"]
@@ -34,11 +32,11 @@ def test_get_teams_points_per_match_second():
 
     result_to_points = {"2-3": (1, 2), "1-1": (1, 1), "1-3": (0, 3)}
 
-    expected_values = [("A", 1), ("C", 2), ("B", 1), ("C", 1), ("a", 0), ("d", 3)]
-    expected_index = ["1", "1", "1", "1", "2", "2"]
-    expected = pd.Series(expected_values, expected_index)
-
-    assert cppm._get_teams_points_per_match(test, result_to_points).equals(expected)
+    # invalid results are ignored
+    index, teams, points = cppm._get_teams_points_columns(test, result_to_points)
+    assert index.tolist() == ["1", "1", "1", "1", "2", "2"]
+    assert teams.tolist() == ["A", "C", "B", "C", "a", "d"]
+    assert points.tolist() == [1, 2, 1, 1, 0, 3]
 
 
 def test_create_points_per_match_first():
@@ -128,3 +126,46 @@ def test_create_points_per_match_second():
     result_to_points = {"3:0": (3, 0), "1:1": (1, 1), "0:3": (0, 3)}
     ppm = cppm.get_kwargs_from_home_away_winner(test, result_to_points)["df"]
     assert ppm.equals(expected)
+
+
+def test_create_points_per_match_from_columns():
+
+    test_cols = {
+        "id": ["1", "1", "2", "2"],
+        "date number": [0, 1, 0, 1],
+        "home": ["A", "B", "a", "a"],
+        "away": ["C", "C", "d", "b"],
+        "winner": ["d", "a", "n", "h"],
+    }
+    matches = ds.Matches(pd.DataFrame(data=test_cols))
+
+    result_to_points = {"h": (3, 0), "d": (1, 1), "a": (0, 3)}
+    from_tuples = cppm.get_kwargs_from_home_away_winner(
+        matches.home_away_winner(), result_to_points
+    )["df"]
+    from_columns = cppm.get_kwargs_from_home_away_winner(
+        matches.df[["home", "away", "winner"]], result_to_points
+    )["df"]
+
+    expected_cols = {
+        "id": ["1", "1", "1", "1", "2", "2"],
+        "date number": [0, 0, 1, 1, 1, 1],
+        "team": ["A", "C", "B", "C", "a", "b"],
+        "points": [1, 1, 0, 3, 3, 0],
+    }
+    expected = (
+        pd.DataFrame(expected_cols)
+        .astype({"id": "category"})
+        .set_index(["id", "date number"])
+    )
+
+    assert from_tuples.equals(expected)
+
+    # categorical teams are interleaved by their codes
+    assert isinstance(from_columns["team"].dtype, pd.CategoricalDtype)
+    assert from_columns.astype({"team": object}).equals(expected)
+
+    from_view = cppm.get_kwargs_from_home_away_winner(
+        matches.home_away_winner_columns(), result_to_points
+    )["df"]
+    assert from_view.equals(from_columns)
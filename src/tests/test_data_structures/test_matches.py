@@ -1,4 +1,5 @@
 import data_structures as ds
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -149,6 +150,21 @@ def test_home_away_winner_second_matches(second_matches: ds.Matches):
     assert second_matches.home_away_winner(winner_type="result").equals(expected)
 
 
+def test_home_away_winner_columns(second_matches: ds.Matches):
+
+    for winner_type in ["winner", "result"]:
+        columns = second_matches.home_away_winner_columns(winner_type)
+
+        assert columns.index.equals(second_matches.df.index)
+        assert all(isinstance(dtype, pd.CategoricalDtype) for dtype in columns.dtypes)
+
+        as_tuples = pd.Series(
+            list(columns.astype(object).itertuples(index=False, name=None)),
+            columns.index,
+        )
+        assert as_tuples.equals(second_matches.home_away_winner(winner_type))
+
+
 def test_home_vs_away_count_per_id_first_matches(first_matches: ds.Matches):
 
     expected = pd.Series(
@@ -183,3 +199,237 @@ def test_home_vs_away_count_per_id_second_matches(second_matches: ds.Matches):
     ).rename("match count")
 
     assert second_matches.home_vs_away_count_per_id.equals(expected)
+
+
+def test_post_init_already_normalized(second_matches: ds.Matches):
+
+    normalized_df = second_matches.df
+    matches = ds.Matches(normalized_df)
+
+    # nothing to do, so nothing is copied
+    assert matches.df is normalized_df
+
+
+def test_post_init_not_normalized(second_matches: ds.Matches):
+
+    unsorted_df = second_matches.df.iloc[::-1]
+    matches = ds.Matches(unsorted_df)
+
+    assert matches.df is not unsorted_df
+    assert matches.df.index.equals(second_matches.df.index)
+
+    object_df = second_matches.df.astype({"home": object})
+    assert ds.Matches(object_df).df.dtypes.equals(second_matches.df.dtypes)
+
+
+def test_from_normalized(second_matches: ds.Matches):
+
+    matches = ds.Matches.from_normalized(second_matches.df)
+
+    assert matches.df is second_matches.df
+    assert matches.number_of_matches_per_id.equals(
+        second_matches.number_of_matches_per_id
+    )
+
+
+def test_probability_matrix_per_id(second_matches: ds.Matches):
+
+    expected = pd.DataFrame(
+        [[0, 1, 0], [1 / 3, 1 / 3, 1 / 3]],
+        index=pd.Index(["1", "2"], name="id"),
+        columns=["h", "d", "a"],
+    )
+    matrix = second_matches.probability_matrix_per_id()
+
+    assert np.allclose(matrix, expected)
+    assert matrix.index.equals(expected.index)
+    assert matrix.columns.equals(expected.columns)
+
+    # same as probabilities_per_id
+    for id_, probabilities in second_matches.probabilities_per_id().items():
+        assert np.allclose(matrix.loc[id_], pd.Series(probabilities))
+
+    matrix = second_matches.probability_matrix_per_id("result", results=["1-1"])
+    assert np.allclose(matrix, [[1], [1 / 3]])
+
+
+def test_append(second_matches: ds.Matches):
+
+    new_matches = pd.DataFrame(
+        {
+            "id": ["2", "3"],
+            "date number": [2, 0],
+            "home": ["D", "x"],
+            "away": ["A", "y"],
+            "winner": ["h", "a"],
+            "result": ["1-0", "0-1"],
+        }
+    )
+    expected = ds.Matches(
+        pd.concat(
+            [
+                second_matches.df.reset_index().astype({"home": str, "away": str}),
+                new_matches,
+            ]
+        )
+    )
+
+    # computing cached properties before appending
+    for name in [
+        "team_names_per_id",
+        "number_of_matches_per_id",
+        "home_vs_away_count_per_id",
+    ]:
+        getattr(second_matches, name)
+
+    second_matches.append(new_matches)
+
+    assert second_matches.df.equals(expected.df)
+    assert second_matches.team_names_per_id.equals(expected.team_names_per_id)
+    assert second_matches.number_of_matches_per_id.equals(
+        expected.number_of_matches_per_id
+    )
+    assert second_matches.home_vs_away_count_per_id.equals(
+        expected.home_vs_away_count_per_id
+    )
+    assert second_matches.team_names_per_id["2"] == ["A", "B", "C", "D"]
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_load(second_matches: ds.Matches, tmp_path, mmap: bool):
+
+    second_matches.save(tmp_path / "matches")
+    loaded = ds.Matches.load(tmp_path / "matches", mmap=mmap)
+
+    assert loaded.df.equals(second_matches.df)
+    assert loaded.df.dtypes.equals(second_matches.df.dtypes)
+    assert loaded.df.index.equals(second_matches.df.index)
+
+    # codes are views of the memory-mapped file
+    codes = loaded.df["home"].array.codes
+    while codes.base is not None and not isinstance(codes, np.memmap):
+        codes = codes.base
+    assert isinstance(codes, np.memmap) == mmap
+
+    assert loaded.team_names_per_id.equals(second_matches.team_names_per_id)
+
+
+def test_view(second_matches: ds.Matches):
+
+    assert second_matches.id_to_rows == {"1": slice(0, 2), "2": slice(2, 5)}
+
+    for id_ in ["1", "2"]:
+        assert second_matches.view(id_).equals(second_matches.df.loc[[id_]])
+
+    with pytest.raises(KeyError):
+        second_matches.view("3")
+
+    second_matches.append(
+        pd.DataFrame(
+            {
+                "id": ["0"],
+                "date number": [0],
+                "home": ["x"],
+                "away": ["y"],
+                "winner": ["h"],
+                "result": ["1-0"],
+            }
+        )
+    )
+    assert second_matches.view("2").equals(second_matches.df.loc[["2"]])
+
+
+@pytest.mark.parametrize("storage", ["python", "pyarrow"])
+def test_with_string_storage(second_matches: ds.Matches, storage: str):
+
+    if storage == "pyarrow":
+        pytest.importorskip("pyarrow")
+
+    stored = second_matches.with_string_storage(storage)
+
+    for name in ["winner", "result"]:
+        assert stored.df[name].dtype == pd.StringDtype(storage)
+        assert stored.df[name].tolist() == second_matches.df[name].tolist()
+
+    for name in ["home", "away"]:
+        assert stored.df[name].equals(second_matches.df[name])
+
+    assert stored.probability_matrix_per_id().equals(
+        second_matches.probability_matrix_per_id()
+    )
+
+
+def test_compact(second_matches: ds.Matches):
+
+    compacted = ds.Matches(second_matches.df, compact=True)
+
+    assert isinstance(compacted.df["winner"].dtype, pd.CategoricalDtype)
+    assert compacted.bytes_saved > 0
+    assert second_matches.bytes_saved == 0
+    assert compacted.df.index.equals(second_matches.df.index)
+    assert compacted.df.astype(object).equals(second_matches.df.astype(object))
+    assert compacted.probability_matrix_per_id().equals(
+        second_matches.probability_matrix_per_id()
+    )
+
+
+def test_compact_append(second_matches: ds.Matches):
+
+    new_matches = pd.DataFrame(
+        {
+            "id": ["1", "3"],
+            "date number": [5, 0],
+            "home": ["D", "x"],
+            "away": ["A", "y"],
+            "winner": ["h", "a"],
+            "result": ["1-0", "0-1"],
+        }
+    )
+    compacted = ds.Matches(second_matches.df, compact=True)
+    dtypes = compacted.df.dtypes.astype(str)
+
+    compacted.append(new_matches)
+    second_matches.append(new_matches)
+
+    assert compacted.df.dtypes.astype(str).equals(dtypes)
+    assert compacted.df.index.equals(second_matches.df.index)
+    assert compacted.df.astype(object).equals(second_matches.df.astype(object))
+
+
+def test_compact_odds():
+
+    rng = np.random.default_rng(0)
+    num_matches = 300
+    odds = rng.uniform(1.01, 15, size=(num_matches, 3)).round(2)
+
+    df = pd.DataFrame(
+        {
+            "id": np.repeat(["1", "2", "3"], num_matches // 3),
+            "date number": np.tile(np.arange(num_matches // 3), 3),
+            "home": rng.choice(list("ABCDEF"), num_matches),
+            "away": rng.choice(list("ABCDEF"), num_matches),
+            "winner": rng.choice(["h", "d", "a"], num_matches),
+            "odds home": odds[:, 0],
+            "odds tie": odds[:, 1],
+            "odds away": odds[:, 2],
+        }
+    )
+    original = ds.Matches(df)
+    compacted = ds.Matches(df, compact=True)
+
+    # realistic odds (such as 1.85) are not exact in float32, but still downcast
+    assert compacted.df.dtypes.astype(str).to_dict() == {
+        "home": "category",
+        "away": "category",
+        "winner": "category",
+        "odds home": "float32",
+        "odds tie": "float32",
+        "odds away": "float32",
+    }
+    assert [codes.dtype for codes in compacted.df.index.codes] == [np.int8, np.int8]
+    assert compacted.bytes_saved > 0
+    assert np.allclose(compacted.df["odds home"], original.df["odds home"], rtol=1e-6)
+
+    # appended odds are rounded the same way
+    compacted.append(df.iloc[:3].assign(id="4"))
+    assert compacted.df["odds home"].dtype == np.float32
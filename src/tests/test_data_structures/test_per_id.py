@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+from data_structures.utils import per_id
+
+
+def _frame(ids: list[str], date_numbers: list[int], values: list[int]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "id": pd.Categorical(ids),
+            "date number": date_numbers,
+            "value": values,
+        }
+    ).set_index(["id", "date number"])
+
+
+@pytest.mark.parametrize(
+    "new_ids, new_date_numbers",
+    [
+        (["b", "c", "c"], [5, 0, 1]),  # after all existing rows
+        (["c", "a", "b"], [0, 1, 1]),  # interleaved and unsorted
+        (["a", "a", "b"], [0, 0, 2]),  # same index as existing rows
+    ],
+)
+def test_merge_sorted(new_ids: list[str], new_date_numbers: list[int]):
+
+    existing = _frame(["a", "a", "b", "b"], [0, 2, 1, 2], [0, 1, 2, 3])
+    new = _frame(new_ids, new_date_numbers, [10, 11, 12])
+
+    merged = per_id.merge_sorted(existing, new)
+
+    # same as sorting everything, existing rows first among equal indexes
+    expected = pd.concat(
+        [existing.reset_index(), new.reset_index()], ignore_index=True
+    ).astype({"id": "category"})
+    expected = expected.set_index(["id", "date number"]).sort_index(kind="stable")
+
+    assert merged.equals(expected)
+    assert merged.index.is_monotonic_increasing
+
+    series = per_id.merge_sorted(existing["value"], new["value"])
+    assert series.equals(expected["value"])
+
+
+def test_merge_sorted__new_categories():
+
+    existing = _frame(["b", "b"], [0, 1], [0, 1])
+    new = _frame(["a"], [3], [2])
+
+    merged = per_id.merge_sorted(existing, new)
+
+    assert merged.index.get_level_values("id").tolist() == ["a", "b", "b"]
+    assert merged.index.levels[0].categories.tolist() == ["a", "b"]
+    assert np.array_equal(merged["value"], [2, 0, 1])
+
+
+def test_id_sizes():
+
+    frame = _frame(["a", "a", "b", "c", "c", "c"], [0, 1, 0, 0, 1, 2], [0] * 6)
+    frame = frame.iloc[2:]  # "a" is not observed anymore
+
+    sizes = per_id.id_sizes(per_id.id_slices(frame.index), frame.index)
+    expected = frame.groupby("id", observed=True).size()
+
+    assert sizes.equals(expected)
+    assert sizes.index.dtype == expected.index.dtype
+    assert sizes.tolist() == [1, 3]
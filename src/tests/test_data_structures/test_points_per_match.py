@@ -149,3 +149,48 @@ def test_rankings_ppm_two(ppm_two: ds.PointsPerMatch):
         .set_index(["id", "team"])
     )
     assert ppm_two.rankings.equals(expected)
+
+
+def test_append(ppm_one: ds.PointsPerMatch):
+
+    new_points = pd.DataFrame(
+        {
+            "id": ["2", "2", "4", "4"],
+            "date number": [2, 2, 0, 0],
+            "team": ["a", "e", "x", "y"],
+            "points": [3, 0, 1, 1],
+        }
+    ).set_index(["id", "date number"])
+
+    expected = ds.PointsPerMatch(
+        pd.concat([ppm_one.df.astype({"team": str}), new_points])
+    )
+
+    # computing cached properties before appending
+    ppm_one.rankings, ppm_one.team_names_per_id, ppm_one.number_of_matches_per_id
+    ppm_one.append(new_points)
+
+    assert ppm_one.df.equals(expected.df)
+    assert ppm_one.rankings.equals(expected.rankings)
+    assert ppm_one.team_names_per_id.equals(expected.team_names_per_id)
+    assert ppm_one.number_of_matches_per_id.equals(expected.number_of_matches_per_id)
+    assert ppm_one.rankings.loc[("2", "a"), "points"] == 3
+
+
+def test_save_load(ppm_two: ds.PointsPerMatch, tmp_path):
+
+    ppm_two.save(tmp_path / "ppm")
+    loaded = ds.PointsPerMatch.load(tmp_path / "ppm")
+
+    assert loaded.df.equals(ppm_two.df)
+    assert loaded.df.dtypes.equals(ppm_two.df.dtypes)
+    assert loaded.rankings.equals(ppm_two.rankings)
+
+
+def test_compact(ppm_two: ds.PointsPerMatch):
+
+    compacted = ds.PointsPerMatch(ppm_two.df, compact=True)
+
+    assert compacted.df["points"].dtype == np.int8
+    assert compacted.bytes_saved > 0
+    assert compacted.rankings.equals(ppm_two.rankings)
@@ -95,3 +95,10 @@ def test_get_kwargs_from_matches():
     )
 
     assert cmd.get_kwargs_from_matches(matches)["series"].equals(expected)
+
+    # row positions of the same matches, in the same order
+    positions = cmd.get_kwargs_from_matches(matches)["positions"]
+    expected_positions = [[0, 2, 3], [1, -1, -1], [4], [5, 9, -1], [6, 7, 8]]
+
+    assert positions.index.equals(expected.index)
+    assert positions.tolist() == expected_positions
@@ -1,5 +1,4 @@
-import random
-
+import numpy as np
 import pandas as pd
 
 import tournament_simulations.permutations.one_permutation.match_date_numbers as md
@@ -7,8 +6,6 @@ import tournament_simulations.permutations.one_permutation.match_date_numbers as
 
 def test_create_shuffled_matches_dates_copy():
 
-    random.seed(1)
-
     test = md.MatchDateNumbers(
         pd.Series(
             index=pd.MultiIndex.from_arrays(
@@ -24,7 +21,7 @@ def test_create_shuffled_matches_dates_copy():
         )
     )
 
-    shuffled = test.create_shuffled_copy().series
+    shuffled = test.create_shuffled_copy(np.random.default_rng(1)).series
 
     # check that all elements are there
     assert shuffled.apply(sorted).equals(test.series.apply(sorted))
@@ -33,3 +30,85 @@ def test_create_shuffled_matches_dates_copy():
     assert any(
         list_shuffled != list_ for list_, list_shuffled in zip(test.series, shuffled)
     )
+
+
+def test_create_shuffled_matches_dates_copy__same_rng_seed():
+
+    test = md.MatchDateNumbers(
+        pd.Series(
+            index=pd.MultiIndex.from_arrays(
+                [["1", "1"], ["a", "b"], ["b", "a"]],
+                names=["id", "home", "away"],
+            ),
+            data=[list(range(10)), list(range(10, 20))],
+        )
+    )
+
+    first = test.create_shuffled_copy(np.random.default_rng(3)).series
+    second = test.create_shuffled_copy(np.random.default_rng(3)).series
+
+    assert first.equals(second)
+
+
+def test_create_shuffled_matches_dates_copy__positions():
+
+    index = pd.MultiIndex.from_arrays(
+        [["1", "1"], ["a", "b"], ["b", "a"]], names=["id", "home", "away"]
+    )
+    test = md.MatchDateNumbers(
+        pd.Series(index=index, data=[list(range(10)), list(range(10, 20))]),
+        pd.Series(index=index, data=[list(range(100, 110)), list(range(110, 120))]),
+    )
+
+    shuffled = test.create_shuffled_copy(np.random.default_rng(3))
+
+    # positions are shuffled exactly like their date numbers
+    for dates, positions in zip(shuffled.series, shuffled.positions):
+        assert [position - 100 for position in positions] == dates
+
+    without_positions = md.MatchDateNumbers(test.series)
+    shuffled_dates = without_positions.create_shuffled_copy(np.random.default_rng(3))
+
+    assert shuffled_dates.positions is None
+    assert shuffled_dates.series.equals(shuffled.series)
+
+
+def test_id_to_rows():
+
+    index = pd.MultiIndex.from_arrays(
+        [["2", "1", "1"], ["a", "a", "b"], ["b", "b", "a"]],
+        names=["id", "home", "away"],
+    )
+    test = md.MatchDateNumbers(pd.Series(index=index, data=[[0], [1], [2]]))
+
+    assert test.id_to_rows == {"1": slice(0, 2), "2": slice(2, 3)}
+
+    # shuffled copies have the same index, so they share offsets
+    shuffled = test.create_shuffled_copy(np.random.default_rng(3))
+    assert shuffled.id_to_rows is test.id_to_rows
+
+
+def test_shuffle_dense():
+
+    test = md.MatchDateNumbers(
+        pd.Series(
+            index=pd.MultiIndex.from_arrays(
+                [["1", "1", "2"], ["a", "b", "c"], ["b", "a", "d"]],
+                names=["id", "home", "away"],
+            ),
+            data=[[1, 3, 4], [2, -1, -1], [10]],
+        )
+    )
+
+    assert test.dense_date_numbers.tolist() == [[1, 3, 4], [2, -1, -1], [10, -1, -1]]
+    assert test.pair_rows == {"1": {("a", "b"): 0, ("b", "a"): 1}, "2": {("c", "d"): 2}}
+
+    dates, positions = test.shuffle_dense(np.random.default_rng(0))
+
+    assert positions is None
+    assert dates.dtype == np.int32
+    assert sorted(dates[0]) == [1, 3, 4]
+    assert sorted(dates[1]) == [-1, -1, 2]
+
+    # padding after the list's width is not shuffled
+    assert dates[2].tolist() == [10, -1, -1]
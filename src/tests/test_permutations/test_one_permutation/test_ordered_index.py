@@ -1,5 +1,7 @@
+import numpy as np
 import pandas as pd
 
+import tournament_simulations.data_structures as ds
 import tournament_simulations.permutations.one_permutation.ordered_index as oi
 
 
@@ -34,3 +36,36 @@ def test_to_list():
     )
     expected = [("one", "1", 1), ("two", "2", 2), ("three", "3", 3), ("four", "4", 4)]
     assert instance.to_flat_list() == expected
+
+
+def test_positions_from_schedule__date_numbers():
+
+    matches = ds.Matches(
+        pd.DataFrame(
+            {
+                "id": ["0", "0", "0", "0", "1", "1", "1"],
+                "date number": [0, 1, 2, 3, 0, 1, 2],
+                "home": ["a", "a", "b", "a", "x", "y", "x"],
+                "away": ["b", "b", "a", "b", "y", "x", "y"],
+            }
+        )
+    )
+    schedule = oi.TournamentSchedule(
+        pd.Series(
+            {
+                "0": [(("a", "b"), ("c", "d")), (("b", "a"),)] * 3,
+                "1": [(("x", "y"),), (("y", "x"),)] * 2,
+            }
+        )
+    )
+    match_date_numbers = oi.MatchDateNumbers.from_matches(matches)
+
+    for seed in range(10):
+        positions = oi.OrderedIndex.positions_from_schedule__date_numbers(
+            schedule, match_date_numbers, np.random.default_rng(seed)
+        )
+        shuffled = match_date_numbers.create_shuffled_copy(np.random.default_rng(seed))
+        expected = oi.OrderedIndex.from_schedule__date_numbers(schedule, shuffled)
+
+        assert positions.tolist() == expected.to_flat_positions().tolist()
+        assert sorted(positions) == list(range(len(matches.df)))
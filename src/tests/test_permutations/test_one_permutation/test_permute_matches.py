@@ -38,37 +38,6 @@ def test_set_original_dates_back(matches: pm.Matches):
     assert pm._set_date_numbers(matches_df, original).equals(matches.df)
 
 
-def test_index_matches_appropriately(matches: pm.Matches):
-
-    expected = pd.DataFrame(
-        {
-            "id": pd.Categorical(["2"], categories=["1", "2"]),
-            "date number": [1],
-            "home": pd.Categorical(["b"], categories=["a", "b", "A", "B"]),
-            "away": pd.Categorical(["a"], categories=["a", "c", "A", "B"]),
-            "winner": ["a"],
-        }
-    ).set_index(["id", "date number"])
-
-    indexes = [("2", 1, "b", "a")]
-
-    assert pm._index_matches_appropriately(matches.df, indexes).equals(expected)
-
-    expected = pd.DataFrame(
-        {
-            "id": pd.Categorical(["1", "2", "2"]),
-            "date number": [1, 1, 0],
-            "home": pd.Categorical(["B", "b", "a"], categories=["a", "b", "A", "B"]),
-            "away": pd.Categorical(["A", "a", "c"], categories=["a", "c", "A", "B"]),
-            "winner": ["d", "a", "h"],
-        }
-    ).set_index(["id", "date number"])
-
-    indexes = [("1", 1, "B", "A"), ("2", 1, "b", "a"), ("2", 0, "a", "c")]
-
-    assert pm._index_matches_appropriately(matches.df, indexes).equals(expected)
-
-
 @pytest.fixture
 def simple_matches():
 
@@ -185,3 +154,33 @@ def test_permute_matches_complex(
     )
     result = permute_matches.permute_matches(complex_index, data_numbers)
     assert result.df.equals(expected.df)
+
+
+def test_row_positions(complex_matches: pm.Matches, complex_index: pm.OrderedIndex):
+
+    permute_matches = pm.PermuteMatches(complex_matches)
+    positions = permute_matches.row_positions(complex_index)
+
+    assert positions.tolist() == [1, 0, 3, 4, 2]
+
+    missing = pm.OrderedIndex(
+        pd.Series(index=pd.Categorical(["0"]), data=[[("0", 5, "B", "D")]])
+    )
+    with pytest.raises(KeyError):
+        permute_matches.row_positions(missing)
+
+
+def test_permute_matches__positions(
+    complex_matches: pm.Matches, complex_index: pm.OrderedIndex
+):
+
+    permute_matches = pm.PermuteMatches(complex_matches)
+    expected = permute_matches.permute_matches(complex_index)
+
+    with_positions = pm.OrderedIndex(
+        complex_index.series,
+        pd.Series(index=complex_index.series.index, data=[[1, 0], [3, 4, 2]]),
+    )
+
+    assert with_positions.to_flat_positions().tolist() == [1, 0, 3, 4, 2]
+    assert permute_matches.permute_matches(with_positions).df.equals(expected.df)
@@ -1,7 +1,11 @@
+import itertools
+
+import numpy as np
 import pandas as pd
 import pytest
 
 import tournament_simulations.permutations.matches_permutations as mp
+import tournament_simulations.schedules.round_robin.double_round_robin as drrs
 
 
 @pytest.fixture()
@@ -118,3 +122,157 @@ def test_create_n_permutations_with_identifiers(matches, scheduler):
 
     result = permutations.create_n_permutations(["one", "random_text"])
     assert result.df.equals(expected.df)
+
+
+def test_create_n_permutations__seed():
+
+    matches = mp.Matches(
+        pd.DataFrame(
+            {
+                "id": ["0"] * 6,
+                "date number": range(6),
+                "home": ["a"] * 6,
+                "away": ["b"] * 6,
+                "winner": ["h", "d", "a", "h", "h", "a"],
+            }
+        )
+    )
+    scheduler = mp.TournamentScheduler(
+        lambda p: [(("a", "b"),)] * 6, pd.Series(index=["0"], data=[[0]])
+    )
+    permutations = mp.MatchesPermutations(matches, scheduler)
+
+    first = permutations.create_n_permutations(3, seed=7)
+    second = permutations.create_n_permutations(3, seed=7)
+
+    assert first.df.equals(second.df)
+
+    # each permutation has its own random stream
+    winners = first.df["winner"].groupby("id", observed=True).agg(tuple)
+    assert winners.nunique() > 1
+
+
+def test_create_n_permutations__date_numbers(matches, scheduler):
+
+    permutations = mp.MatchesPermutations(matches, scheduler)
+
+    result = permutations.create_n_permutations(2, date_numbers=[5, 3])
+    assert result.df.index.get_level_values("date number").tolist() == [5, 5, 3, 3]
+
+    with pytest.raises(ValueError):
+        permutations.create_n_permutations(2, date_numbers=[5])
+
+
+def _six_matches_schedule(p):
+    # module-level, so it can be sent to worker processes
+    return [(("a", "b"),)] * 6
+
+
+def test_create_n_permutations__workers():
+
+    matches = mp.Matches(
+        pd.DataFrame(
+            {
+                "id": ["0"] * 6 + ["1"] * 6,
+                "date number": list(range(6)) * 2,
+                "home": ["a"] * 12,
+                "away": ["b"] * 12,
+                "winner": ["h", "d", "a", "h", "h", "a", "a", "a", "d", "h", "d", "h"],
+            }
+        )
+    )
+    scheduler = mp.TournamentScheduler(
+        _six_matches_schedule, pd.Series(index=["0", "1"], data=[[0], [0]])
+    )
+    permutations = mp.MatchesPermutations(matches, scheduler)
+
+    serial = permutations.create_n_permutations(5, seed=7)
+
+    # same order and random streams, whatever the number of processes
+    for workers in (2, 3):
+        parallel = permutations.create_n_permutations(5, seed=7, workers=workers)
+        assert parallel.df.equals(serial.df)
+
+    with pytest.raises(ValueError):
+        permutations.create_n_permutations(2, workers=0)
+
+
+def _double_round_robin(team_names, rng=None):
+    # random schedule, seeded by the generator each permutation passes to it
+    return list(
+        drrs.DoubleRoundRobin.from_team_names(team_names).get_full_schedule(1, rng=rng)
+    )
+
+
+def test_create_n_permutations__workers_random_scheduler():
+
+    teams = ["a", "b", "c", "d"]
+    pairs = list(itertools.permutations(teams, 2))
+
+    matches = mp.Matches(
+        pd.DataFrame(
+            {
+                "id": ["0"] * len(pairs),
+                "date number": range(len(pairs)),
+                "home": [home for home, _ in pairs],
+                "away": [away for _, away in pairs],
+                "winner": ["h", "d", "a"] * (len(pairs) // 3),
+            }
+        )
+    )
+    scheduler = mp.TournamentScheduler(
+        _double_round_robin, pd.Series(index=["0"], data=[[teams]])
+    )
+    permutations = mp.MatchesPermutations(matches, scheduler)
+
+    serial = permutations.create_n_permutations(4, seed=7)
+
+    assert permutations.create_n_permutations(4, seed=7).df.equals(serial.df)
+    assert permutations.create_n_permutations(4, seed=7, workers=2).df.equals(
+        serial.df
+    )
+    assert not permutations.create_n_permutations(4, seed=8).df.equals(serial.df)
+
+    # a generator can be given instead of a seed
+    with_generator = [
+        permutations.create_n_permutations(4, seed=np.random.default_rng(7))
+        for _ in range(2)
+    ]
+    assert with_generator[0].df.equals(with_generator[1].df)
+
+
+def test_iter_permutations():
+
+    matches = mp.Matches(
+        pd.DataFrame(
+            {
+                "id": ["0"] * 6,
+                "date number": range(6),
+                "home": ["a"] * 6,
+                "away": ["b"] * 6,
+                "winner": ["h", "d", "a", "h", "h", "a"],
+            }
+        )
+    )
+    scheduler = mp.TournamentScheduler(
+        _six_matches_schedule, pd.Series(index=["0"], data=[[0]])
+    )
+    permutations = mp.MatchesPermutations(matches, scheduler)
+
+    expected = permutations.create_n_permutations(5, seed=7).df
+
+    batches = list(permutations.iter_permutations(5, batch_size=2, seed=7))
+    assert [len(batch.df) for batch in batches] == [12, 12, 6]
+
+    ids = [batch.df.index.get_level_values("id").unique().tolist() for batch in batches]
+    assert ids == [["0@0", "0@1"], ["0@2", "0@3"], ["0@4"]]
+
+    # same permutations (and random streams) as create_n_permutations
+    result = pd.concat([batch.df.reset_index() for batch in batches], ignore_index=True)
+    assert result.astype(str).equals(expected.reset_index().astype(str))
+
+    single = list(permutations.iter_permutations(["x"], seed=3))
+    assert len(single) == 1
+
+    with pytest.raises(ValueError):
+        permutations.iter_permutations(2, batch_size=0)
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 import tournament_simulations.permutations.tournament_scheduler as ts
@@ -101,3 +102,30 @@ def test_from_num_teams_complex():
 
     scheduler = ts.TournamentScheduler(id_to_func_schedule, id_to_team_names)
     assert scheduler.generate_schedule().series.equals(expected)
+
+
+def test_generate_schedule_rng():
+
+    def func_schedule(number, rng=None):
+        return rng.permutation(number).tolist()
+
+    def func_schedule_without_rng(number):
+        return list(range(number))
+
+    id_to_num_teams = pd.Series(index=["1", "0"], data=[[4], [3]])
+
+    scheduler = ts.TournamentScheduler(func_schedule, id_to_num_teams)
+
+    first = scheduler.generate_schedule(np.random.default_rng(2)).series
+    second = scheduler.generate_schedule(np.random.default_rng(2)).series
+
+    assert first.equals(second)
+    assert first.map(sorted).tolist() == [[0, 1, 2], [0, 1, 2, 3]]
+
+    # only functions with an 'rng' parameter receive it
+    scheduler = ts.TournamentScheduler(
+        {"0": func_schedule_without_rng, "1": func_schedule}, id_to_num_teams
+    )
+    schedule = scheduler.generate_schedule(np.random.default_rng(2)).series
+    assert schedule["0"] == [0, 1, 2]
+    assert sorted(schedule["1"]) == [0, 1, 2, 3]
@@ -1,6 +1,7 @@
 from collections import Counter
 from itertools import combinations
 
+import numpy as np
 import pytest
 
 import tournament_simulations.schedules.randomize.randomize_schedule as rs
@@ -158,3 +159,11 @@ def test_randomize_iterable_options(schedule: rs.RandomizeSchedule):
     )
     # Assert that two rounds don't map to the same sorted round (uniqueness)
     assert len(set(new_to_old_round_map.values())) == len(new_to_old_round_map.values())
+
+
+def test_randomize_same_rng_seed(schedule: rs.RandomizeSchedule):
+
+    first = schedule.randomize("all", np.random.default_rng(5))
+    second = schedule.randomize("all", np.random.default_rng(5))
+
+    assert first == second
@@ -1,3 +1,5 @@
+import random
+
 import pytest
 
 import tournament_simulations.schedules.round_robin.double_round_robin as drrs
@@ -128,4 +130,18 @@ def test_create_full_schedule_not_random_reversed(
         tuple((a, h) for h, a in reversed(match))
         for match in reversed(simulated_first)
     ]
-    assert flipped == two_schedules[3 * num_rounds :]
\ No newline at end of file
+    assert flipped == two_schedules[3 * num_rounds :]
+
+
+def test_create_full_schedule_random_seed():
+
+    # without a generator, python's random module seeds the randomization
+    double_round_robin = drrs.DoubleRoundRobin.from_num_teams(4)
+
+    random.seed(3)
+    first = list(double_round_robin.get_full_schedule(1))
+
+    random.seed(3)
+    second = list(double_round_robin.get_full_schedule(1))
+
+    assert first == second
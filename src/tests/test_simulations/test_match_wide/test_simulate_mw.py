@@ -86,10 +86,13 @@ def test_simulate_match_wide_template_first(
     id_to_probabilities_winner: pd.Series, data_to_join_first: pd.DataFrame
 ):
 
-    # apply func
-    def apply_func(prob, num_simulations):
-        prob_values = [prob[key] for key in ["h", "d", "a"]]
-        return np.array([[*prob_values, num_simulations]])
+    def simulate_func(id_to_probabilities, num_simulations):
+        return np.array(
+            [
+                [*(prob[key] for key in ["h", "d", "a"]), num_simulations]
+                for prob in id_to_probabilities
+            ]
+        )
 
     num_simulations = 5
     expected = pd.DataFrame(
@@ -104,7 +107,7 @@ def test_simulate_match_wide_template_first(
     ).set_index(["id", "date number"])
 
     simulations = simul._simulate_match_wide_template(
-        apply_func,
+        simulate_func,
         num_simulations,
         id_to_probabilities_winner,
         data_to_join_first.index
@@ -112,20 +115,32 @@ def test_simulate_match_wide_template_first(
 
     assert simulations.equals(expected)
 
+    # functions without 'out' still fill the buffer they are given
+    out = np.empty((3, 4))
+    simulations = simul._simulate_match_wide_template(
+        simulate_func,
+        num_simulations,
+        id_to_probabilities_winner,
+        data_to_join_first.index,
+        out=out,
+    )
+
+    assert np.array_equal(out, expected.to_numpy())
+
 
 def test_simulate_match_wide_template_second(
     id_to_probabilities_winner: pd.Series, data_to_join_second: pd.DataFrame
 ):
 
-    # apply func
-    def apply_func(prob, num_simulations):
-        return np.array(
+    def simulate_func(id_to_probabilities, num_simulations):
+        rows = [
             [
                 [sorted(prob.keys()), sorted(prob.values())],
                 [num_simulations * 3, num_simulations * 4],
-            ],
-            dtype=object
-        )
+            ]
+            for prob in id_to_probabilities
+        ]
+        return np.array(sum(rows, []), dtype=object)
 
     num_simulations = 3
     expected = pd.DataFrame(
@@ -138,7 +153,7 @@ def test_simulate_match_wide_template_second(
     ).set_index(["id", "date number"])
 
     simulations = simul._simulate_match_wide_template(
-        apply_func,
+        simulate_func,
         num_simulations,
         id_to_probabilities_winner,
         data_to_join_second.index
@@ -226,3 +226,129 @@ def test_batch_simulate_points_per_match_with_func_after_two(
     )
 
     assert simulations.equals(expected)
+
+
+def test_batch_simulate_winners_executor(
+    id_to_num_matches: pd.Series,
+    data_to_join_first: pd.DataFrame,
+):
+
+    id_to_probabilities = pd.Series(
+        data=[{"h": 1.0, "d": 0.0, "a": 0.0}] * 3,
+        index=pd.Index(["1", "2", "3"], name="id"),
+    )
+    parameters = (
+        id_to_probabilities,
+        id_to_num_matches,
+        data_to_join_first.index,
+        (3, 4),
+    )
+
+    serial = batch.batch_simulate_winners(*parameters)
+    thread = batch.batch_simulate_winners(*parameters, executor="thread", max_workers=2)
+
+    assert serial.equals(thread)
+
+    with pytest.raises(ValueError):
+        batch.batch_simulate_winners(*parameters, executor="invalid")
+
+
+def test_batch_simulate_winners_seed(
+    id_to_num_matches: pd.Series,
+    data_to_join_first: pd.DataFrame,
+):
+
+    id_to_probabilities = pd.Series(
+        data=[{"h": 0.5, "d": 0.2, "a": 0.3}] * 3,
+        index=pd.Index(["1", "2", "3"], name="id"),
+    )
+    parameters = (
+        id_to_probabilities,
+        id_to_num_matches,
+        data_to_join_first.index,
+        (3, 4),
+    )
+
+    serial = batch.batch_simulate_winners(*parameters, seed=3)
+    thread = batch.batch_simulate_winners(
+        *parameters, executor="thread", max_workers=2, seed=3
+    )
+
+    assert serial.equals(thread)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+@pytest.mark.parametrize("executor", ["serial", "thread"])
+def test_batch_simulate_winners_preallocated(
+    id_to_num_matches: pd.Series,
+    data_to_join_first: pd.DataFrame,
+    compact: bool,
+    executor: str,
+):
+
+    id_to_probabilities = pd.Series(
+        data=[{"h": 0.5, "d": 0.2, "a": 0.3}] * 3,
+        index=pd.Index(["1", "2", "3"], name="id"),
+    )
+    parameters = (
+        id_to_probabilities,
+        id_to_num_matches,
+        data_to_join_first.index,
+        (3, 4),
+    )
+
+    # identity uses a preallocated array, the lambda concatenates batches
+    preallocated = batch.batch_simulate_winners(
+        *parameters, compact=compact, executor=executor, seed=1
+    )
+    concatenated = batch.batch_simulate_winners(
+        *parameters, lambda x: x, compact=compact, executor=executor, seed=1
+    )
+
+    assert preallocated.equals(concatenated)
+
+
+def test_batch_simulate_points_per_match_preallocated(
+    id_to_probabilities_ppm: pd.Series,
+    id_to_num_matches: pd.Series,
+    data_to_join_second: pd.DataFrame,
+):
+
+    parameters = (
+        id_to_probabilities_ppm,
+        id_to_num_matches,
+        data_to_join_second.set_index("team", append=True).index,
+        (2, 3),
+    )
+
+    preallocated = batch.batch_simulate_points_per_match(*parameters, seed=2)
+    concatenated = batch.batch_simulate_points_per_match(
+        *parameters, lambda x: x, seed=2
+    )
+
+    assert preallocated.equals(concatenated)
+
+
+def test_batch_simulate_winners_probability_matrix(
+    id_to_num_matches: pd.Series,
+    data_to_join_first: pd.DataFrame,
+):
+
+    id_to_probabilities = pd.Series(
+        data=[
+            {"h": 0.5, "d": 0.2, "a": 0.3},
+            {"h": 0.1, "d": 0.1, "a": 0.8},
+            {"h": 0.4, "d": 0.4, "a": 0.2},
+        ],
+        index=pd.Index(["1", "2", "3"], name="id"),
+    )
+    probability_matrix = pd.DataFrame(
+        list(id_to_probabilities), index=id_to_probabilities.index
+    )
+
+    parameters = (id_to_num_matches, data_to_join_first.index, (2, 3))
+
+    from_series = batch.batch_simulate_winners(id_to_probabilities, *parameters, seed=4)
+    from_matrix = batch.batch_simulate_winners(probability_matrix, *parameters, seed=4)
+
+    assert from_series.equals(from_matrix)
@@ -97,11 +97,12 @@ def test_simulate_tournament_wide_template_first(
     data_to_join_first: pd.DataFrame,
 ):
 
-    # apply func
-    def apply_func(prob__num_matches, num_simulations):
-        prob, num_matches = prob__num_matches
-        prob_values = [prob[key] for key in ["h", "d", "a"]]
-        return np.array([[*prob_values, num_simulations]] * num_matches)
+    def simulate_func(id_to_probabilities, num_simulations, num_matches):
+        rows = [
+            [*(prob[key] for key in ["h", "d", "a"]), num_simulations]
+            for prob in id_to_probabilities
+        ]
+        return np.repeat(np.array(rows), num_matches, axis=0)
 
     num_simulations = 5
     expected = pd.DataFrame(
@@ -115,14 +116,12 @@ def test_simulate_tournament_wide_template_first(
         }
     ).set_index(["id", "date number"])
 
-    joined_id_maps = pd.concat([id_to_probabilities_winner, id_to_num_matches], axis=1)
-    id_to_prob__num_matches = pd.Series(
-        data=joined_id_maps.itertuples(index=False, name=None),
-        index=joined_id_maps.index,
-    )
-
     simulations = simul._simulate_tournament_wide_template(
-        apply_func, num_simulations, id_to_prob__num_matches, data_to_join_first.index
+        simulate_func,
+        num_simulations,
+        id_to_probabilities_winner,
+        id_to_num_matches,
+        data_to_join_first.index,
     )
 
     assert simulations.equals(expected)
@@ -134,17 +133,16 @@ def test_simulate_tournament_wide_template_second(
     data_to_join_second: pd.DataFrame,
 ):
 
-    # apply func
-    def apply_func(prob__num_matches, num_simulations):
-        prob, num_matches = prob__num_matches
-        return np.array(
+    def simulate_func(id_to_probabilities, num_simulations, num_matches):
+        rows = [
             [
                 [sorted(prob.keys()), sorted(prob.values())],
                 [num_simulations * 3, num_simulations * 4],
             ]
-            * num_matches,
-            dtype=object
-        )
+            * num_match
+            for prob, num_match in zip(id_to_probabilities, num_matches)
+        ]
+        return np.array(sum(rows, []), dtype=object)
 
     num_simulations = 3
     expected = pd.DataFrame(
@@ -156,13 +154,12 @@ def test_simulate_tournament_wide_template_second(
         }
     ).set_index(["id", "date number"])
 
-    joined_id_maps = pd.concat([id_to_probabilities_winner, id_to_num_matches], axis=1)
-    id_to_prob__num_matches = pd.Series(
-        joined_id_maps.itertuples(index=False, name=None), index=joined_id_maps.index
-    )
-
     simulations = simul._simulate_tournament_wide_template(
-        apply_func, num_simulations, id_to_prob__num_matches, data_to_join_second.index
+        simulate_func,
+        num_simulations,
+        id_to_probabilities_winner,
+        id_to_num_matches,
+        data_to_join_second.index,
     )
 
     assert simulations.equals(expected)
@@ -258,3 +255,74 @@ def test_simulate_points_per_match__tournament_wide_second(
     )
 
     assert simulations.equals(expected)
+
+
+def test_simulate_winners__tournament_wide_compact(
+    id_to_probabilities_winner: pd.Series,
+    id_to_num_matches: pd.Series,
+    data_to_join_first: pd.DataFrame,
+):
+
+    num_simulations = 3
+    expected = pd.DataFrame(
+        {
+            "id": ["1", "1", "2", "2", "3", "3"],
+            "date number": [0, 1, 0, 1, 0, 0],
+            0: [2, 2, 0, 0, 1, 1],
+            1: [2, 2, 0, 0, 1, 1],
+            2: [2, 2, 0, 0, 1, 1],
+        },
+    ).set_index(["id", "date number"]).astype(np.int8)
+
+    simulations = simul.simulate_winners__tournament_wide(
+        num_simulations,
+        id_to_probabilities_winner,
+        id_to_num_matches,
+        data_to_join_first.index,
+        compact=True,
+    )
+
+    assert simulations.equals(expected)
+
+
+def test_simulate_rankings__tournament_wide(
+    id_to_probabilities_ppm: pd.Series,
+    id_to_num_matches: pd.Series,
+    data_to_join_second: pd.DataFrame,
+):
+
+    rankings_index = pd.MultiIndex.from_tuples(
+        [
+            ("1", "A"), ("1", "B"), ("1", "C"),
+            ("2", "a"), ("2", "b"), ("2", "c"),
+            ("3", "1"), ("3", "2"),
+        ],
+        names=["id", "team"],
+    )
+    team_codes = np.array([0, 1, 1, 2, 4, 3, 5, 3, 7, 6, 6, 7])
+
+    num_simulations = 3
+    expected = pd.DataFrame(
+        [[0] * 3, [3] * 3, [3] * 3, [0] * 3, [3] * 3, [3] * 3, [2] * 3, [2] * 3],
+        index=rankings_index,
+    )
+
+    simulations = simul.simulate_rankings__tournament_wide(
+        num_simulations,
+        id_to_probabilities_ppm,
+        id_to_num_matches,
+        team_codes,
+        rankings_index,
+    )
+
+    assert simulations.equals(expected)
+
+    # summing simulated points per match must give the same rankings
+    points_per_match = simul.simulate_points_per_match__tournament_wide(
+        num_simulations,
+        id_to_probabilities_ppm,
+        id_to_num_matches,
+        data_to_join_second.set_index("team", append=True).index,
+    )
+    summed = points_per_match.groupby(["id", "team"]).sum()
+    assert np.array_equal(summed.to_numpy(), simulations.to_numpy())
@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import tournament_simulations.simulations.utils.accumulators as acc
+import tournament_simulations.simulations.utils.batch_simulations as bat
+
+
+def random_points(num_simulations, rng):
+    index = pd.MultiIndex.from_arrays(
+        [["1", "1", "1", "2", "2"], ["a", "b", "c", "d", "e"]], names=["id", "team"]
+    )
+    values = rng.normal([[10], [20], [30], [0], [5]], 3, (5, num_simulations))
+    return pd.DataFrame(values, index=index)
+
+
+@pytest.fixture
+def simulations():
+    return bat.batch_simulate_tournaments_template(
+        random_points, 10, bat.identity, num_simulations=300, seed=0
+    )
+
+
+def test_mean_variance(simulations: pd.DataFrame):
+
+    batches = [
+        simulations.iloc[:, :1],
+        simulations.iloc[:, 1:7],
+        simulations.iloc[:, 7:],
+    ]
+    accumulator = acc.MeanVariance()(batches)
+
+    assert accumulator.count == 3000
+    assert np.allclose(accumulator.mean, simulations.mean(axis=1))
+    assert np.allclose(accumulator.variance, simulations.var(axis=1))
+    assert np.allclose(accumulator.std, simulations.std(axis=1))
+    assert accumulator.mean.index.equals(simulations.index)
+
+
+def test_rank_histogram():
+
+    index = pd.MultiIndex.from_arrays(
+        [["1", "1", "1", "2", "2"], ["a", "b", "c", "d", "e"]], names=["id", "team"]
+    )
+    first = pd.DataFrame({"s0": [3, 1, 0, 1, 1], "s1": [0, 3, 1, 0, 3]}, index=index)
+    second = pd.DataFrame({"s2": [6, 0, 3, 3, 0]}, index=index)
+
+    histogram = acc.RankHistogram()([first, second])
+
+    expected = pd.DataFrame(
+        [[2, 0, 1], [1, 1, 1], [0, 2, 1], [2, 1, 0], [2, 1, 0]],
+        index=index,
+        columns=pd.RangeIndex(1, 4, name="position"),
+    )
+    assert histogram.counts.equals(expected)
+    assert np.allclose(histogram.probabilities.sum(axis=1), 1)
+
+    # positions must be integers
+    with pytest.raises(ValueError):
+        acc.RankHistogram(method="average")
+
+    with pytest.raises(ValueError):
+        acc.RankHistogram().update(first.astype(float).where(first > 0))
+
+    with pytest.raises(TypeError):
+        acc._Accumulator()
+
+
+def test_p2_quantiles(simulations: pd.DataFrame):
+
+    quantiles = (0.1, 0.5, 0.9)
+    accumulator = bat.batch_simulate_tournaments_template(
+        random_points,
+        10,
+        bat.identity,
+        num_simulations=300,
+        seed=0,
+        batch_consumer=acc.P2Quantiles(quantiles),
+    )
+
+    expected = simulations.quantile(quantiles, axis=1).T
+    assert np.allclose(accumulator.values, expected, atol=0.3)
+
+
+def test_p2_quantiles_few_simulations(simulations: pd.DataFrame):
+
+    few = simulations.iloc[:, :3]
+    accumulator = acc.P2Quantiles([0.5])([few])
+
+    assert np.allclose(accumulator.values[0.5], few.median(axis=1))
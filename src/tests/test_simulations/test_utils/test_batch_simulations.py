@@ -1,5 +1,6 @@
 from typing import Callable
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -134,3 +135,144 @@ def test_batch_simulate_tournaments_template_third(
     data = [[0] * 2, [1] * 2, [2] * 2] * 3
     expected = pd.DataFrame(data=data, columns=["col"] * 2)
     assert simulated.equals(expected)
+
+
+def test_batch_simulate_tournaments_template__without_rng(simul_func: Callable):
+
+    # functions without 'rng' (or 'out') keywords are called without them
+    data = [[0] * 2, [1] * 2, [2] * 2] * 3
+    expected = pd.DataFrame(data=data, columns=["s0", "s1"])
+
+    for executor in ["serial", "thread"]:
+        for func_after_simulation in [bat.identity, lambda x: x]:
+            simulated = bat.batch_simulate_tournaments_template(
+                simul_func,
+                num_iterations=2,
+                num_simulations=3,
+                func_after_simulation=func_after_simulation,
+                executor=executor,
+                seed=1,
+            )
+            assert simulated.equals(expected)
+
+
+def test_accepted_kwargs():
+    def without_keywords(num_simulations):
+        pass
+
+    def with_rng(num_simulations, rng=None):
+        pass
+
+    def with_any_keyword(num_simulations, **kwargs):
+        pass
+
+    assert bat.accepted_kwargs(without_keywords, rng=1, out=2) == {}
+    assert bat.accepted_kwargs(with_rng, rng=1, out=2) == {"rng": 1}
+    assert bat.accepted_kwargs(with_any_keyword, rng=1, out=2) == {"rng": 1, "out": 2}
+
+
+def random_simulation(num_simulations, rng):
+    return pd.DataFrame(rng.random((4, num_simulations)))
+
+
+def test_batch_simulate_tournaments_template_executors():
+
+    serial = bat.batch_simulate_tournaments_template(
+        random_simulation,
+        num_iterations=5,
+        func_after_simulation=bat.identity,
+        num_simulations=3,
+        seed=42,
+    )
+    assert serial.columns.to_list() == [f"s{i}" for i in range(15)]
+
+    # each batch has its own random stream
+    assert not serial["s0"].equals(serial["s3"])
+
+    for executor in ["serial", "thread", "process"]:
+        simulated = bat.batch_simulate_tournaments_template(
+            random_simulation,
+            num_iterations=5,
+            func_after_simulation=bat.identity,
+            num_simulations=3,
+            executor=executor,
+            max_workers=2,
+            seed=42,
+        )
+        assert simulated.equals(serial)
+
+    # a generator can be given instead of a seed
+    with_generator = [
+        bat.batch_simulate_tournaments_template(
+            random_simulation,
+            num_iterations=5,
+            func_after_simulation=bat.identity,
+            num_simulations=3,
+            seed=np.random.default_rng(42),
+        )
+        for _ in range(2)
+    ]
+    assert with_generator[0].equals(with_generator[1])
+
+    with pytest.raises(ValueError):
+        bat.batch_simulate_tournaments_template(
+            random_simulation,
+            num_iterations=1,
+            func_after_simulation=bat.identity,
+            num_simulations=1,
+            executor="invalid",
+        )
+
+
+def test_iter_batches():
+
+    expected = bat.batch_simulate_tournaments_template(
+        random_simulation,
+        num_iterations=4,
+        func_after_simulation=bat.identity,
+        num_simulations=2,
+        seed=1,
+    )
+
+    for executor in ["serial", "thread"]:
+        batches = bat.iter_batches(
+            random_simulation,
+            4,
+            bat.identity,
+            num_simulations=2,
+            executor=executor,
+            max_workers=1,
+            seed=1,
+        )
+
+        batches = list(batches)
+        assert len(batches) == 4
+        assert batches[1].columns.to_list() == ["s2", "s3"]
+        assert bat.concat_batches(batches).equals(expected)
+
+    with pytest.raises(ValueError):
+        bat.iter_batches(random_simulation, 1, bat.identity, executor="invalid")
+
+
+def test_batch_simulate_tournaments_template_batch_consumer():
+
+    parameters = dict(
+        simulation_function=random_simulation,
+        num_iterations=3,
+        func_after_simulation=bat.identity,
+        num_simulations=2,
+        seed=5,
+    )
+    expected = bat.batch_simulate_tournaments_template(**parameters)
+
+    lazy = bat.batch_simulate_tournaments_template(**parameters, batch_consumer=iter)
+    assert not isinstance(lazy, pd.DataFrame)
+    assert pd.concat(lazy, axis=1).equals(expected)
+
+    def _add_sums(total, df):
+        return total + df.sum(axis=1)
+
+    total = bat.batch_simulate_tournaments_template(
+        **parameters, batch_consumer=bat.reduce_batches(_add_sums, 0)
+    )
+    assert np.allclose(total, expected.sum(axis=1))
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import tournament_simulations.simulations.utils.batch_simulations as bat
+import tournament_simulations.simulations.utils.npy_sink as sink
+
+
+def int8_simulation(num_simulations, rng):
+    values = rng.integers(0, 3, (5, num_simulations), dtype=np.int8)
+    return pd.DataFrame(values, index=pd.Index(list("abcde"), name="team"))
+
+
+def test_npy_sink(tmp_path):
+
+    parameters = dict(
+        simulation_function=int8_simulation,
+        num_iterations=3,
+        func_after_simulation=bat.identity,
+        num_simulations=4,
+        seed=0,
+    )
+    expected = bat.batch_simulate_tournaments_template(**parameters)
+
+    stored = bat.batch_simulate_tournaments_template(
+        **parameters, batch_consumer=sink.npy_sink(tmp_path / "simulations", 12)
+    )
+
+    assert stored.values.dtype == np.int8
+    assert stored.values.shape == (5, 12)
+    assert stored.to_frame().equals(expected)
+    assert stored.to_frame([0, 5]).equals(expected[["s0", "s5"]])
+    assert stored.to_frame(slice(4, 8)).equals(expected.iloc[:, 4:8])
+
+    # can be opened again without simulating
+    reopened = sink.NpySimulations(tmp_path / "simulations")
+    assert reopened.to_frame().equals(expected)
+
+
+def test_npy_sink_invalid(tmp_path):
+
+    parameters = dict(
+        simulation_function=int8_simulation,
+        num_iterations=3,
+        func_after_simulation=bat.identity,
+        num_simulations=4,
+    )
+
+    for num_columns in [11, 13]:
+        with pytest.raises(ValueError):
+            bat.batch_simulate_tournaments_template(
+                **parameters, batch_consumer=sink.npy_sink(tmp_path, num_columns)
+            )
+
+    with pytest.raises(ValueError):
+        sink.npy_sink(tmp_path, 1)([pd.DataFrame({"s0": ["h", "d"]})])
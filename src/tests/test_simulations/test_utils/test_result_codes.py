@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+
+from tournament_simulations.simulations.utils.result_codes import ResultCodes
+
+
+def test_from_probabilities():
+
+    result_codes = ResultCodes.from_probabilities(
+        [{"h": 0.5, "d": 0.5}, {"h": 0.2, "d": 0.2, "a": 0.6}]
+    )
+    assert result_codes.categories == ("h", "d", "a")
+    assert result_codes.dtype == np.int8
+    assert result_codes.code("h") == 0
+    assert result_codes.code("a") == 2
+
+    result_codes = ResultCodes.from_probabilities(pd.Series([{(3, 0): 1, (0, 3): 0}]))
+    assert result_codes.categories == ((3, 0), (0, 3))
+
+
+def test_to_labels_and_to_codes():
+
+    result_codes = ResultCodes(("h", "d", "a"))
+    index = pd.Index(["1", "2", "3"], name="id")
+
+    codes = pd.DataFrame({"s0": [0, 1, 2], "s1": [2, 2, 0]}, index=index, dtype=np.int8)
+    labels = pd.DataFrame({"s0": ["h", "d", "a"], "s1": ["a", "a", "h"]}, index=index)
+
+    assert result_codes.to_labels(codes).equals(labels)
+    assert result_codes.to_codes(labels).equals(codes)
+
+    unknown = pd.DataFrame({"s0": ["h", "x"]})
+    expected = pd.DataFrame({"s0": [0, -1]}, dtype=np.int8)
+    assert result_codes.to_codes(unknown).equals(expected)
@@ -1,4 +1,7 @@
+import tracemalloc
+
 import numpy as np
+import pytest
 
 import tournament_simulations.simulations.utils.simulate_functions as sf
 
@@ -112,3 +115,109 @@ def test_simulate_simulate_points_per_match():
     points = sf.simulate_points_per_match(probabilities, 7, 14)
     assert points.shape == (28, 7)
     assert np.all((points == 3) | (points == 1) | (points == 0))
+
+
+def test_stack_probabilities():
+
+    results, matrix = sf.stack_probabilities([])
+    assert results == []
+    assert matrix.size == 0
+
+    results, matrix = sf.stack_probabilities(
+        [{"h": 0.5, "d": 0.5}, {"a": 1}, {"d": 0.25, "h": 0.75}]
+    )
+    assert results == ["h", "d", "a"]
+    assert np.array_equal(matrix, [[0.5, 0.5, 0], [0, 0, 1], [0.75, 0.25, 0]])
+
+    results, matrix = sf.stack_probabilities([{(3, 0): 0.2, (1, 1): 0.8}])
+    assert results == [(3, 0), (1, 1)]
+    assert np.array_equal(matrix, [[0.2, 0.8]])
+
+
+def test_simulate_result_indexes():
+
+    probabilities = np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+    indexes = sf.simulate_result_indexes(probabilities, 5)
+    assert indexes.shape == (3, 5)
+    assert np.all(indexes == [[0], [1], [2]])
+
+    indexes = sf.simulate_result_indexes(probabilities, 2, repeats=[2, 0, 1])
+    assert indexes.shape == (3, 2)
+    assert np.all(indexes == [[0], [0], [2]])
+
+    probabilities = np.array([[0, 0.5, 0.5], [0.5, 0.5, 0]])
+    indexes = sf.simulate_result_indexes(probabilities, 100, repeats=[3, 4])
+    assert indexes.shape == (7, 100)
+    assert np.all((indexes[:3] == 1) | (indexes[:3] == 2))
+    assert np.all((indexes[3:] == 0) | (indexes[3:] == 1))
+
+    with pytest.raises(ValueError):
+        sf.simulate_result_indexes(np.array([[0.5, 0.2]]), 1)
+
+    with pytest.raises(ValueError):
+        sf.simulate_result_indexes(np.array([[1.5, -0.5]]), 1)
+
+
+def test_simulate_winners_per_id():
+
+    id_to_probabilities = [{"h": 1, "d": 0, "a": 0}, {"a": 1}, {"d": 1}]
+    winners = sf.simulate_winners_per_id(id_to_probabilities, 2, [1, 2, 1])
+    expected = np.array([["h", "h"], ["a", "a"], ["a", "a"], ["d", "d"]])
+    assert winners.shape == expected.shape
+    assert np.all(winners == expected)
+
+    winners = sf.simulate_winners_per_id(id_to_probabilities, 3)
+    expected = np.array([["h"] * 3, ["a"] * 3, ["d"] * 3])
+    assert winners.shape == expected.shape
+    assert np.all(winners == expected)
+
+
+def test_simulate_points_per_match_per_id():
+
+    id_to_probabilities = [{(3, 0): 1, (0, 3): 0}, {(1, 1): 1}]
+    points = sf.simulate_points_per_match_per_id(id_to_probabilities, 2, [2, 1])
+    expected = np.array([[3, 3], [0, 0], [3, 3], [0, 0], [1, 1], [1, 1]])
+    assert points.shape == expected.shape
+    assert np.all(points == expected)
+
+
+def test_simulate_points_per_team_per_id():
+
+    id_to_probabilities = [{(3, 0): 0.5, (1, 1): 0.2, (0, 3): 0.3}, {(1, 1): 1}]
+    home_codes, away_codes = np.array([0, 1, 2]), np.array([1, 2, 0])
+
+    points = sf.simulate_points_per_team_per_id(
+        id_to_probabilities, 50, [2, 1], home_codes, away_codes, 3, rng=1
+    )
+    per_match = sf.simulate_points_per_match_per_id(
+        id_to_probabilities, 50, [2, 1], rng=1
+    )
+
+    # home points are even rows, away points are odd rows
+    expected = np.zeros((3, 50))
+    np.add.at(expected, home_codes, per_match[0::2])
+    np.add.at(expected, away_codes, per_match[1::2])
+
+    assert np.array_equal(points, expected)
+
+
+def test_simulate_points_per_team_per_id__memory():
+
+    num_matches, num_simulations, num_teams = 20_000, 500, 20
+    codes = np.arange(num_matches) % num_teams
+
+    tracemalloc.start()
+    sf.simulate_points_per_team_per_id(
+        [{(3, 0): 0.5, (1, 1): 0.2, (0, 3): 0.3}],
+        num_simulations,
+        [num_matches],
+        codes,
+        codes[::-1].copy(),
+        num_teams,
+        rng=0,
+    )
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # less than simulated winners would take, even as int8 codes
+    assert peak < num_matches * num_simulations
@@ -0,0 +1,75 @@
+import random
+
+import numpy as np
+import pytest
+
+import tournament_simulations.utils.seeds as seeds
+
+
+def test_spawn_seed_sequences():
+
+    first = seeds.spawn_seed_sequences(42, 3)
+    second = seeds.spawn_seed_sequences(np.random.SeedSequence(42), 3)
+
+    assert len(first) == 3
+
+    for seq_1, seq_2 in zip(first, second):
+        assert np.array_equal(seq_1.generate_state(4), seq_2.generate_state(4))
+
+    states = {tuple(seq.generate_state(4)) for seq in first}
+    assert len(states) == 3
+
+
+def test_spawn_seed_sequences__does_not_modify_seed():
+
+    seed = np.random.SeedSequence(42)
+
+    first = seeds.spawn_seed_sequences(seed, 2)
+    second = seeds.spawn_seed_sequences(seed, 2)
+
+    for seq_1, seq_2 in zip(first, second):
+        assert np.array_equal(seq_1.generate_state(4), seq_2.generate_state(4))
+
+    # same streams as SeedSequence.spawn
+    for seq_1, seq_2 in zip(first, np.random.SeedSequence(42).spawn(2)):
+        assert np.array_equal(seq_1.generate_state(4), seq_2.generate_state(4))
+
+
+@pytest.mark.parametrize(
+    "global_state, seed_function",
+    [("random", random.seed), ("numpy", np.random.seed)],
+)
+def test_default_rng__global_state(global_state, seed_function):
+
+    seed_function(7)
+    first = seeds.default_rng(None, global_state).random(3)
+    first_streams = seeds.spawn_seed_sequences(None, 2, global_state)
+
+    seed_function(7)
+    second = seeds.default_rng(None, global_state).random(3)
+    second_streams = seeds.spawn_seed_sequences(None, 2, global_state)
+
+    assert np.array_equal(first, second)
+    assert np.array_equal(
+        first_streams[1].generate_state(4), second_streams[1].generate_state(4)
+    )
+
+    # generators are used as they are
+    rng = np.random.default_rng(0)
+    assert seeds.default_rng(rng, global_state) is rng
+
+
+def test_spawn_seed_sequences__generator():
+
+    # the root seed is drawn from the generator, like any other random number
+    first = seeds.spawn_seed_sequences(np.random.default_rng(3), 2)
+    second = seeds.spawn_seed_sequences(np.random.default_rng(3), 2)
+
+    for seq_1, seq_2 in zip(first, second):
+        assert np.array_equal(seq_1.generate_state(4), seq_2.generate_state(4))
+
+    rng = np.random.default_rng(3)
+    seeds.spawn_seed_sequences(rng, 2)
+    third = seeds.spawn_seed_sequences(rng, 2)
+
+    assert not np.array_equal(first[0].generate_state(4), third[0].generate_state(4))
@@ -1,9 +1,18 @@
+from __future__ import annotations
+
 import functools
-from dataclasses import dataclass
+from dataclasses import InitVar, dataclass, field
+from pathlib import Path
 from typing import Literal, NewType, Sequence
 
+import numpy as np
 import pandas as pd
 
+from tournament_simulations.data_structures.utils import columnar, per_id
+from tournament_simulations.data_structures.utils.compact import (
+    cast_like,
+    compact_frame,
+)
 from tournament_simulations.utils.convert_df_to_series import (
     convert_df_to_series_of_tuples,
 )
@@ -17,6 +26,35 @@ Team = NewType("Team", str)
 HomeAwayWinner = tuple[Team, Team, str]
 
 
+def _is_normalized(df: pd.DataFrame) -> bool:
+
+    """
+    Checks, without copying anything, if 'df' is already what
+    Matches.__post_init__ would turn it into.
+    """
+    index = df.index
+
+    if not isinstance(index, pd.MultiIndex) or index.names != ["id", "date number"]:
+        return False
+
+    id_level, date_number_level = index.levels
+
+    return (
+        isinstance(id_level.dtype, pd.CategoricalDtype)
+        and pd.api.types.is_integer_dtype(date_number_level.dtype)
+        and all(
+            column in df.columns and isinstance(df[column].dtype, pd.CategoricalDtype)
+            for column in ("home", "away")
+        )
+        and index.is_monotonic_increasing
+    )
+
+
+def _odds_columns(df: pd.DataFrame) -> list[str]:
+    # betting odds never need more than float32 precision (see Matches.compact)
+    return [column for column in df.columns if str(column).startswith("odds")]
+
+
 @dataclass
 class Matches:
     """
@@ -67,11 +105,40 @@ class Matches:
                         "02.04.2014", "02.01.2015"
                     ]\n
                     match_date_numbers = [0, 0, 1, 1, 2]
+
+        compact: bool = False (init only)
+            If True, every column is downcast to its smallest safe dtype:
+            categorical winners (and other repeated strings), the smallest
+            integer dtype for integer columns and float32 for floats which are
+            exactly representable. Values which would overflow or lose
+            precision are kept as they are.
+
+            Odds columns ("odds ...") always become float32, rounding values to
+            ~7 significant digits, which is more than odds ever have.
+
+            "date number" is already compact: the index stores it as int8/int16
+            codes into its unique values (pandas 1.x keeps those as int64).
+
+            Bytes saved are logged and stored in 'bytes_saved'.
+
+        bytes_saved: int = 0 (not in init)
+            Bytes saved by 'compact' (negative if the frame grew; 0 if it is False).
     """
 
     df: pd.DataFrame
+    compact: InitVar[bool] = False
+    bytes_saved: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self, compact: bool = False):
 
-    def __post_init__(self):
+        # permutations create a lot of matches that are already normalized
+        if not _is_normalized(self.df):
+            self._normalize()
+
+        if compact:
+            self.df, self.bytes_saved = compact_frame(self.df, _odds_columns(self.df))
+
+    def _normalize(self) -> None:
 
         index_cols = ["id", "date number"]
 
@@ -89,40 +156,142 @@ class Matches:
 
         self.df = self.df.astype(data_types).set_index(index_cols).sort_index()
 
+    @classmethod
+    def from_normalized(cls, df: pd.DataFrame) -> Matches:
+
+        """
+        Create an instance of Matches without normalizing 'df'.
+
+        Only use it when 'df' is known to have the right index, dtypes
+        and order (for example, another Matches' df), since nothing is checked.
+
+        ----
+        Parameters:
+
+            df: pd.DataFrame
+                Same as Matches.df after initialization.
+        """
+        matches = cls.__new__(cls)
+        matches.df = df
+        return matches
+
+    def with_string_storage(
+        self, storage: Literal["pyarrow", "python"] = "pyarrow"
+    ) -> Matches:
+
+        """
+        Opt-in storage for string columns which are not categorical
+        (for example, "result", "winner" and "date").
+
+        With "pyarrow", they become pd.StringDtype("pyarrow") columns:
+        Arrow string arrays, which are much smaller than python strings and
+        are shared with Arrow-based tools (Parquet, ...) without conversion.
+        Categorical columns ("id", "home" and "away") are kept, since they are
+        already dictionary encoded (Arrow dictionary arrays when converted).
+
+        ----
+        Parameters:
+
+            storage: Literal["pyarrow", "python"] = "pyarrow"
+                Storage of pd.StringDtype. "pyarrow" requires pyarrow.
+
+        ----
+        Returns:
+            Matches
+                New instance with the same index and values.
+        """
+        dtype = pd.StringDtype(storage)
+
+        string_columns = [
+            name
+            for name, column in self.df.items()
+            if column.dtype == object
+            and pd.api.types.infer_dtype(column, skipna=True) == "string"
+        ]
+        return Matches.from_normalized(
+            self.df.astype(dict.fromkeys(string_columns, dtype))
+        )
+
+    def save(self, path: str | Path) -> None:
+
+        """
+        Stores self.df in directory 'path' using a columnar format
+        (see data_structures.utils.columnar).
+
+        Categorical columns are stored as codes + categories and index order
+        is kept, so loading does not normalize anything again.
+
+        ----
+        Parameters:
+
+            path: str | Path
+                Directory in which it will be stored. Created if needed.
+        """
+        columnar.save_frame(self.df, path)
+
+    @classmethod
+    def load(cls, path: str | Path, mmap: bool = True) -> Matches:
+
+        """
+        Loads an instance stored by Matches.save.
+
+        ----
+        Parameters:
+
+            path: str | Path
+                Directory passed to Matches.save.
+
+            mmap: bool = True
+                If True, columns and index are read-only memory maps, so
+                they are only read from disk when used.
+                Otherwise, everything is read into memory.
+        """
+        return cls.from_normalized(columnar.load_frame(path, mmap=mmap))
+
     @functools.cached_property
     def team_names_per_id(self) -> pd.Series:
         """
         Gets a list of team names for each tournament separately.
         """
-        # apply func
-        def _get_team_names_one_id(matches_one_id: pd.DataFrame) -> list[str]:
+        return per_id.team_names_per_id(
+            pd.Categorical(self.df.index.get_level_values("id")),
+            [self.df["home"].array, self.df["away"].array],
+        )
 
-            teams_home: set[str] = set(matches_one_id.loc[:, "home"])
-            teams_away: set[str] = set(matches_one_id.loc[:, "away"])
+    @functools.cached_property
+    def id_to_rows(self) -> dict[Id, slice]:
+        """
+        Offsets table: maps each id to the slice of rows of its matches.
 
-            return sorted(teams_home | teams_away)
+        Index is sorted, so each tournament's matches are contiguous and
+        can be accessed with self.df.iloc[slice] (see self.view).
+        """
+        return per_id.id_slices(self.df.index)
 
-        return (
-            self.df.groupby("id", observed=True)
-            .apply(_get_team_names_one_id)
-            .rename("teams")
-        )
+    def view(self, id_: Id) -> pd.DataFrame:
+
+        """
+        Matches of tournament 'id_', without searching the whole index.
+
+        ----
+        Parameters:
+
+            id_: Id
+                Tournament id. Raises KeyError if there are no matches for it.
+
+        ----
+        Returns:
+            pd.DataFrame
+                Rows of self.df whose id is 'id_' (a slice, not a copy).
+        """
+        return self.df.iloc[self.id_to_rows[id_]]
 
     @functools.cached_property
     def number_of_matches_per_id(self) -> pd.Series:
         """
         Gets the number of matches for each tournament separately.
         """
-        # apply func
-        def _get_number_of_matches_one_id(matches_one_id: pd.DataFrame) -> int:
-
-            return matches_one_id.shape[0]
-
-        return (
-            self.df.groupby("id", observed=True)
-            .apply(_get_number_of_matches_one_id)
-            .rename("num matches")
-        )
+        return per_id.id_sizes(self.id_to_rows, self.df.index).rename("num matches")
 
     @functools.cached_property
     def home_vs_away_count_per_id(self) -> pd.Series:
@@ -135,12 +304,73 @@ class Matches:
         it will be omitted.
         """
 
-        return (
-            self.df.groupby(["id", "home", "away"], observed=True)
-            .apply(len)
-            .sort_index()  # BUG: it is not sorting after groupby
-            .rename("match count")
+        columns = [
+            pd.Categorical(self.df.index.get_level_values("id")),
+            self.df["home"].array,
+            self.df["away"].array,
+        ]
+
+        # each (id, home, away) triple is flattened into a single number
+        keys = np.zeros(len(self.df), dtype=np.int64)
+        for column in columns:
+            keys = keys * len(column.categories) + column.codes
+
+        unique_keys, counts = np.unique(keys, return_counts=True)
+
+        codes = []
+        for column in reversed(columns):
+            unique_keys, column_codes = np.divmod(unique_keys, len(column.categories))
+            codes.insert(0, column_codes)
+
+        index = pd.MultiIndex(
+            levels=[pd.CategoricalIndex(column.categories) for column in columns],
+            codes=codes,
+            names=["id", "home", "away"],
+        )
+        return pd.Series(counts, index=index, name="match count")
+
+    def append(self, new_matches: Matches | pd.DataFrame) -> None:
+
+        """
+        Appends new matches (for example, the matches of a new day).
+
+        Rows are merged into the sorted index. Cached properties which were
+        already computed are kept up to date: only ids with new matches are
+        recomputed, all others are reused.
+
+        ----
+        Parameters:
+
+            new_matches: Matches | pd.DataFrame
+                Same structure as self.df.
+                If it is a pd.DataFrame, it will be normalized first.
+        """
+        if isinstance(new_matches, pd.DataFrame):
+            new_matches = Matches(new_matches)
+
+        # compact dtypes (see compact_frame) are kept if new values fit
+        self.df = cast_like(
+            per_id.merge_sorted(self.df, new_matches.df),
+            self.df,
+            _odds_columns(self.df),
+        )
+
+        # row positions have changed
+        self.__dict__.pop("id_to_rows", None)
+
+        ids = new_matches.df.index.get_level_values("id").unique()
+        affected = Matches.from_normalized(per_id.rows_of_ids(self.df, ids))
+
+        cached_properties = (
+            "team_names_per_id",
+            "number_of_matches_per_id",
+            "home_vs_away_count_per_id",
         )
+        for name in cached_properties:
+            if name in self.__dict__:
+                self.__dict__[name] = per_id.replace_ids(
+                    self.__dict__[name], getattr(affected, name)
+                )
 
     def probabilities_per_id(
         self,
@@ -194,6 +424,63 @@ class Matches:
             .sort_index()
         )
 
+    def probability_matrix_per_id(
+        self,
+        column: str = "winner",
+        results: Sequence[str] | None = ("h", "d", "a")
+    ) -> pd.DataFrame:
+        """
+        Same as probabilities_per_id, but as a probability matrix computed
+        in a single pass, which simulations use directly.
+
+        ----
+        Parameters:
+            column: str
+                Desired column
+
+            results: Sequence[str] | None = ("h", "d", "a")
+                Results to be considered.
+
+                If it is None, it will be set to all unique values for the column.
+
+        Returns
+        -----
+            pd.DataFrame[
+                index = [
+                    "id": str
+                        tournament id
+                ]
+
+                columns = results
+
+                values = probability of each result (float)
+            ]
+        """
+        if results is None:
+            results = self.df[column].unique().tolist()
+
+        ids = pd.Categorical(self.df.index.get_level_values("id"))
+        num_ids, num_results = len(ids.categories), len(results)
+
+        # -1 -> results that are not considered
+        result_codes = pd.Categorical(self.df[column], categories=results).codes
+        is_considered = result_codes >= 0
+
+        bins = ids.codes[is_considered].astype(np.int64) * num_results
+        counts = np.bincount(
+            bins + result_codes[is_considered], minlength=num_ids * num_results
+        ).reshape(num_ids, num_results)
+        num_matches = np.bincount(ids.codes, minlength=num_ids)
+
+        is_observed = num_matches > 0
+        probabilities = counts[is_observed] / num_matches[is_observed, np.newaxis]
+
+        index = pd.CategoricalIndex(
+            pd.Categorical.from_codes(np.flatnonzero(is_observed), ids.categories),
+            name="id",
+        )
+        return pd.DataFrame(probabilities, index=index, columns=list(results))
+
     def home_away_winner(
         self, winner_type: Literal["winner", "result"] = "winner"
     ) -> pd.Series:
@@ -208,3 +495,39 @@ class Matches:
         """
         desired_cols = self.df[["home", "away", winner_type]]
         return convert_df_to_series_of_tuples(desired_cols).rename("home away winner")
+
+    def home_away_winner_columns(
+        self, winner_type: Literal["winner", "result"] = "winner"
+    ) -> pd.DataFrame:
+
+        """
+        Same information as self.home_away_winner, but as three aligned
+        categorical columns instead of a series of tuples.
+
+        Each column is stored as an array of codes and a table of categories,
+        so no per-match object is created. It can be passed directly to
+        PointsPerMatch.from_home_away_winner.
+
+        ---
+        Parameters:
+            winner_type: Literal["winner", "result"] = "winner"
+                winner: Which team won, that is, "h", "d" or "a"
+                result: Match result, that is, "{home score}-{away score}"
+
+        ---
+        Returns:
+            pd.DataFrame[
+                index = self.df.index,
+                columns = [
+                    "home"   -> pd.Categorical[str],\n
+                    "away"   -> pd.Categorical[str],\n
+                    "winner" -> pd.Categorical[str] (values of 'winner_type'),
+                ]
+            ]
+        """
+        columns = {
+            "home": self.df["home"].array,
+            "away": self.df["away"].array,
+            "winner": pd.Categorical(self.df[winner_type]),
+        }
+        return pd.DataFrame(columns, index=self.df.index, copy=False)
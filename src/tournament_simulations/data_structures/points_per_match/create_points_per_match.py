@@ -2,46 +2,76 @@ from typing import Mapping
 
 import numpy as np
 import pandas as pd
+from pandas.api.types import union_categoricals
 
-import tournament_simulations.data_structures.matches as mat
 from tournament_simulations.logs import log, tournament_simulations_logger
 
-TeamPontuation = tuple[mat.Team, float]
-TeamsMatchPoints = tuple[TeamPontuation, TeamPontuation]
-
 KwargsPPM = dict[str, pd.DataFrame]
 
 
-def _get_teams_points_per_match(
-    home_away_winner: pd.Series,
+HOME_AWAY_WINNER_COLUMNS = ["home", "away", "winner"]
+
+
+def _to_columns(home_away_winner: pd.Series | pd.DataFrame) -> pd.DataFrame:
+
+    if isinstance(home_away_winner, pd.DataFrame):
+        return home_away_winner.set_axis(HOME_AWAY_WINNER_COLUMNS, axis="columns")
+
+    return pd.DataFrame(
+        home_away_winner.tolist(),
+        index=home_away_winner.index,
+        columns=HOME_AWAY_WINNER_COLUMNS,
+    )
+
+
+def _interleave_teams(
+    home: pd.Series, away: pd.Series
+) -> np.ndarray | pd.Categorical:
+
+    """
+    [home 1, away 1, home 2, away 2, ...]
+
+    Categorical teams (for example, Matches.home_away_winner_columns) are
+    interleaved by their codes, so team names are never materialized.
+    """
+    if not all(isinstance(team.dtype, pd.CategoricalDtype) for team in (home, away)):
+        return np.column_stack([home.to_numpy(), away.to_numpy()]).ravel()
+
+    # codes of home teams followed by codes of away teams
+    teams = union_categoricals([home.array, away.array], sort_categories=True)
+    codes = teams.codes.reshape(2, len(home)).T.ravel()
+
+    return pd.Categorical.from_codes(codes, dtype=teams.dtype)
+
+
+def _get_teams_points_columns(
+    home_away_winner: pd.Series | pd.DataFrame,
     winner_to_points: Mapping[str, tuple[float, float]]
-) -> pd.Series:
+) -> tuple[pd.Index, np.ndarray, np.ndarray]:
 
-    # apply function
-    def _get_team_point_pair_one_match(
-        home_away_winner: mat.HomeAwayWinner,
-    ) -> TeamsMatchPoints | float:
+    columns = _to_columns(home_away_winner)
 
-        *home_away, winner = home_away_winner
-        points = winner_to_points.get(winner)
+    # -1 -> winners which cannot be converted
+    results = list(winner_to_points)
+    winner_codes = pd.Categorical(columns["winner"], categories=results).codes
+    is_valid = winner_codes >= 0
 
-        if points is None:
-            message = f"Invalid parameter: {home_away_winner}."
-            tournament_simulations_logger.warning(message)
-            return np.nan
+    for invalid in columns[~is_valid].itertuples(index=False, name=None):
+        tournament_simulations_logger.warning(f"Invalid parameter: {invalid}.")
 
-        return tuple(zip(home_away, points))  # type: ignore
+    valid = columns[is_valid]
+    points_table = np.array([winner_to_points[result] for result in results])
 
-    return (
-        home_away_winner.apply(_get_team_point_pair_one_match)
-        .dropna()  # ignores matches which cannot be converted
-        .explode()  # breaks ((home, points_home), (away, points_away)) into two lines
-    )
+    # home and away are interleaved: [home 1, away 1, home 2, away 2, ...]
+    teams = _interleave_teams(valid["home"], valid["away"])
+    points = points_table[winner_codes[is_valid]]
+
+    return valid.index.repeat(2), teams, points.ravel()
 
 
 @log(tournament_simulations_logger.debug)
 def get_kwargs_from_home_away_winner(
-    home_away_winner: pd.Series,
+    home_away_winner: pd.Series | pd.DataFrame,
     winner_to_points: Mapping[str, tuple[float, float]]
 ) -> KwargsPPM:
 
@@ -58,6 +88,10 @@ def get_kwargs_from_home_away_winner(
             Index -> home_away_winner index will be used for retuned df.
             Data -> (home, away, winner) tuples for all matches.
 
+            It can also be a pd.DataFrame with three columns: home, away and
+            winner (in this order), which avoids creating tuples.
+                Example: Matches.home_away_winner_columns()
+
         winner_to_points: Mapping[str, tuple[float, float]]
             Default: {"h": (3, 0),"d": (1, 1),"a": (0, 3)}
 
@@ -72,11 +106,5 @@ def get_kwargs_from_home_away_winner(
                 df -> pd.DataFrame
     """
 
-    points_per_match = _get_teams_points_per_match(home_away_winner, winner_to_points)
-
-    # each entry of points_per_match is a tuple like (team_name, points_gained)
-    df_columns = ["team", "points"]
-    df_index: pd.MultiIndex = points_per_match.index  # type: ignore
-    df_data: list[TeamPontuation] = points_per_match.to_list()
-
-    return {"df": pd.DataFrame(df_data, df_index, df_columns)}
+    index, teams, points = _get_teams_points_columns(home_away_winner, winner_to_points)
+    return {"df": pd.DataFrame({"team": teams, "points": points}, index)}
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
 import functools
-from dataclasses import dataclass
-from typing import Mapping, Sequence
+from dataclasses import InitVar, dataclass, field
+from pathlib import Path
+from typing import Hashable, Mapping, Sequence
 
 import numpy as np
 import pandas as pd
 
+from tournament_simulations.data_structures.utils import columnar, per_id
+from tournament_simulations.data_structures.utils.compact import (
+    cast_like,
+    compact_frame,
+)
+
 from .create_points_per_match import get_kwargs_from_home_away_winner
 
 RESULT_TO_POINTS = {
@@ -56,11 +63,21 @@ class PointsPerMatch:
                     "02.04.2014", "02.01.2015"
                 ]\n
                 match_date_numbers = [0, 0, 1, 1, 2]
+
+        compact: bool = False (init only)
+            If True, every column is downcast to its smallest safe dtype
+            (for example, int8 points). Bytes saved are logged and stored in
+            'bytes_saved'.
+
+        bytes_saved: int = 0 (not in init)
+            Bytes saved by 'compact' (negative if the frame grew; 0 if it is False).
     """
 
     df: pd.DataFrame
+    compact: InitVar[bool] = False
+    bytes_saved: int = field(default=0, init=False, repr=False, compare=False)
 
-    def __post_init__(self):
+    def __post_init__(self, compact: bool = False):
 
         index_cols = ["id", "date number"]
 
@@ -78,10 +95,13 @@ class PointsPerMatch:
 
         self.df = self.df.astype(data_types).set_index(index_cols).sort_index()
 
+        if compact:
+            self.df, self.bytes_saved = compact_frame(self.df)
+
     @classmethod
     def from_home_away_winner(
         cls,
-        home_away_winner: pd.Series,
+        home_away_winner: pd.Series | pd.DataFrame,
         result_to_points: Mapping[str, tuple[float, float]] = RESULT_TO_POINTS,
     ) -> PointsPerMatch:
 
@@ -98,6 +118,10 @@ class PointsPerMatch:
                 Index -> home_away_winner index will be used for retuned df.
                 (home, away, winner) tuples for all matches.
 
+                It can also be a pd.DataFrame with three columns: home, away and
+                winner (in this order), which avoids creating tuples.
+                    Example: Matches.home_away_winner_columns()
+
             result_to_points: Mapping[str, tuple[float, float]]
                 Default: {"h": (3, 0),"d": (1, 1),"a": (0, 3)}
 
@@ -111,23 +135,75 @@ class PointsPerMatch:
         kwargs = get_kwargs_from_home_away_winner(home_away_winner, result_to_points)
         return cls(**kwargs)
 
-    @property
-    def team_names_per_id(self) -> pd.Series:
+    @classmethod
+    def from_normalized(cls, df: pd.DataFrame) -> PointsPerMatch:
+
         """
-        Gets a list of team names for each tournament separately.
+        Create an instance of PointsPerMatch without normalizing 'df'.
+
+        Only use it when 'df' is known to have the right index, dtypes
+        and order (for example, another PointsPerMatch's df), since nothing
+        is checked.
+
+        ----
+        Parameters:
+
+            df: pd.DataFrame
+                Same as PointsPerMatch.df after initialization.
         """
-        # apply function
-        def _get_team_names_one_id(ppm_df: pd.DataFrame) -> list[str]:
+        points_per_match = cls.__new__(cls)
+        points_per_match.df = df
+        return points_per_match
 
-            if "team" in ppm_df.columns:
-                return sorted(ppm_df.loc[:, "team"].unique())
+    def save(self, path: str | Path) -> None:
 
-            return sorted(ppm_df.index.get_level_values("team").unique())
+        """
+        Stores self.df in directory 'path' using a columnar format
+        (see data_structures.utils.columnar).
 
-        return (
-            self.df.groupby("id", observed=True)
-            .apply(_get_team_names_one_id)
-            .rename("teams")
+        Categorical columns are stored as codes + categories and index order
+        is kept, so loading does not normalize anything again.
+
+        ----
+        Parameters:
+
+            path: str | Path
+                Directory in which it will be stored. Created if needed.
+        """
+        columnar.save_frame(self.df, path)
+
+    @classmethod
+    def load(cls, path: str | Path, mmap: bool = True) -> PointsPerMatch:
+
+        """
+        Loads an instance stored by PointsPerMatch.save.
+
+        ----
+        Parameters:
+
+            path: str | Path
+                Directory passed to PointsPerMatch.save.
+
+            mmap: bool = True
+                If True, columns and index are read-only memory maps, so
+                they are only read from disk when used.
+                Otherwise, everything is read into memory.
+        """
+        return cls.from_normalized(columnar.load_frame(path, mmap=mmap))
+
+    @functools.cached_property
+    def team_names_per_id(self) -> pd.Series:
+        """
+        Gets a list of team names for each tournament separately.
+        """
+        if "team" in self.df.columns:
+            teams = self.df["team"].array
+        else:
+            teams = self.df.index.get_level_values("team")
+
+        return per_id.team_names_per_id(
+            pd.Categorical(self.df.index.get_level_values("id")),
+            [pd.Categorical(teams)],
         )
 
     @functools.cached_property
@@ -138,23 +214,79 @@ class PointsPerMatch:
         This property is cached because otherwise it would be called
         each iteration.
         """
-        # apply function
-        def _get_number_of_matches_one_id(ppm_df: pd.DataFrame) -> int:
-            # each match is equivalent to 2 lines
-            return ppm_df.shape[0] // 2
+        # each match is equivalent to 2 lines
+        num_lines = per_id.id_sizes(self.id_to_rows, self.df.index)
+        return (num_lines // 2).rename("num matches")
 
-        return (
-            self.df.groupby("id", observed=True)
-            .apply(_get_number_of_matches_one_id)
-            .rename("num matches")
-        )
+    @functools.cached_property
+    def id_to_rows(self) -> dict[Hashable, slice]:
+        """
+        Offsets table: maps each id to the slice of rows of its lines
+        (see Matches.id_to_rows).
+        """
+        return per_id.id_slices(self.df.index)
 
     @functools.cached_property
     def rankings(self) -> pd.DataFrame:
         """
         Calculates tournament rankings.
+
+        Points are summed with a single bincount over (id, team) codes.
         """
-        return self.df.groupby(["id", "team"], observed=True).sum().sort_index()
+        ids = pd.Categorical(self.df.index.get_level_values("id"))
+        teams = pd.Categorical(self.df["team"])
+        num_teams = len(teams.categories)
+
+        keys = ids.codes.astype(np.int64) * num_teams + teams.codes
+        unique_keys, key_positions = np.unique(keys, return_inverse=True)
+
+        points = np.bincount(key_positions, weights=self.df["points"].to_numpy())
+        id_codes, team_codes = np.divmod(unique_keys, num_teams)
+
+        index = pd.MultiIndex(
+            levels=[
+                pd.CategoricalIndex(ids.categories),
+                pd.CategoricalIndex(teams.categories),
+            ],
+            codes=[id_codes, team_codes],
+            names=["id", "team"],
+        )
+        # sums may not fit in compact dtypes (int8)
+        dtype = np.promote_types(self.df["points"].dtype, np.int16)
+        return pd.DataFrame({"points": points.astype(dtype)}, index=index)
+
+    def append(self, new_points: PointsPerMatch | pd.DataFrame) -> None:
+
+        """
+        Appends points of new matches (for example, a new matchday).
+
+        Cached properties which were already computed are kept up to date:
+        only ids with new matches are recomputed, all others are reused.
+
+        ----
+        Parameters:
+
+            new_points: PointsPerMatch | pd.DataFrame
+                Same structure as self.df.
+                If it is a pd.DataFrame, it will be normalized first.
+        """
+        if isinstance(new_points, pd.DataFrame):
+            new_points = PointsPerMatch(new_points)
+
+        # compact dtypes (see compact_frame) are kept if new values fit
+        self.df = cast_like(per_id.merge_sorted(self.df, new_points.df), self.df)
+
+        # row positions have changed
+        self.__dict__.pop("id_to_rows", None)
+
+        ids = new_points.df.index.get_level_values("id").unique()
+        affected = PointsPerMatch(per_id.rows_of_ids(self.df, ids))
+
+        for name in ("team_names_per_id", "number_of_matches_per_id", "rankings"):
+            if name in self.__dict__:
+                self.__dict__[name] = per_id.replace_ids(
+                    self.__dict__[name], getattr(affected, name)
+                )
 
     def probabilities_per_id(
         self,
@@ -1,3 +1,3 @@
-from . import types
+from . import columnar, compact, per_id, types
 
-__all__ = ["types"]
+__all__ = ["columnar", "compact", "per_id", "types"]
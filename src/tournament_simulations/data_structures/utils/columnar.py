@@ -0,0 +1,152 @@
+"""
+Columnar on-disk format for dataframes of data structures.
+
+A dataframe is stored as a directory:
+    "schema.pkl"      -> names, dtypes, index levels and categories (small)
+    "index.{i}.npy"   -> codes of the i-th index level
+    "column.{j}.npy"  -> codes (categorical/object columns) or values of
+                         the j-th column
+
+Index order is kept, so sorted data structures do not have to be sorted again.
+
+Arrays are loaded as read-only memory maps: categorical and numeric columns,
+as well as the index, are not copied into memory until they are used.
+Object and string columns are stored as codes + dictionary and have to be
+rebuilt when loading.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+SCHEMA_FILE = "schema.pkl"
+
+
+def _index_file(position: int) -> str:
+    return f"index.{position}.npy"
+
+
+def _column_file(position: int) -> str:
+    return f"column.{position}.npy"
+
+
+def save_frame(df: pd.DataFrame, path: str | Path) -> None:
+
+    """
+    Stores 'df' in directory 'path' (created if needed).
+
+    ----
+    Parameters:
+
+        df: pd.DataFrame
+            Index may be a pd.Index or a pd.MultiIndex.
+            Columns must be categorical, numeric or object.
+
+        path: str | Path
+            Directory in which 'df' will be stored.
+    """
+    directory = Path(path)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    index = df.index
+    if not isinstance(index, pd.MultiIndex):
+        index = pd.MultiIndex.from_arrays([index])
+
+    for position, codes in enumerate(index.codes):
+        np.save(directory / _index_file(position), np.asarray(codes))
+
+    columns: list[dict[str, Any]] = []
+
+    for position, (name, column) in enumerate(df.items()):
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            values = column.cat.codes.to_numpy()
+            schema = {"name": name, "kind": "category", "dtype": column.dtype}
+
+        elif column.dtype == object or isinstance(column.dtype, pd.StringDtype):
+            codes, dictionary = pd.factorize(column, sort=True)
+            values = codes.astype(np.min_scalar_type(-len(dictionary) - 1))
+            schema = {
+                "name": name,
+                "kind": "object",
+                "dtype": column.dtype,
+                "dictionary": np.asarray(dictionary, dtype=object),
+            }
+
+        else:
+            values = column.to_numpy()
+            schema = {"name": name, "kind": "values"}
+
+        np.save(directory / _column_file(position), values)
+        columns.append(schema)
+
+    schema = {
+        "index": {
+            "names": list(index.names),
+            "levels": list(index.levels),
+            "is_multiindex": isinstance(df.index, pd.MultiIndex),
+        },
+        "columns": columns,
+        "columns_name": df.columns.name,
+    }
+    pd.to_pickle(schema, directory / SCHEMA_FILE)
+
+
+def load_frame(path: str | Path, mmap: bool = True) -> pd.DataFrame:
+
+    """
+    Loads a dataframe stored by save_frame.
+
+    ----
+    Parameters:
+
+        path: str | Path
+            Directory passed to save_frame.
+
+        mmap: bool = True
+            If True, arrays are read-only memory maps (zero-copy).
+            Otherwise, they are read into memory.
+
+    ----
+    Returns:
+        pd.DataFrame
+            Same dataframe that was stored (including index order).
+    """
+    directory = Path(path)
+    schema = pd.read_pickle(directory / SCHEMA_FILE)
+    mmap_mode = "r" if mmap else None
+
+    index_schema = schema["index"]
+    index = pd.MultiIndex(
+        levels=index_schema["levels"],
+        codes=[
+            np.load(directory / _index_file(position), mmap_mode=mmap_mode)
+            for position in range(len(index_schema["levels"]))
+        ],
+        names=index_schema["names"],
+        verify_integrity=False,
+    )
+    if not index_schema["is_multiindex"]:
+        index = index.get_level_values(0)
+
+    columns = {}
+
+    for position, column in enumerate(schema["columns"]):
+        values = np.load(directory / _column_file(position), mmap_mode=mmap_mode)
+
+        if column["kind"] == "category":
+            values = pd.Categorical.from_codes(values, dtype=column["dtype"])
+        elif column["kind"] == "object":
+            values = pd.Categorical.from_codes(values, column["dictionary"])
+            values = pd.array(np.asarray(values, dtype=object), dtype=column["dtype"])
+
+        columns[column["name"]] = values
+
+    # copy=False keeps memory-mapped arrays as they are (no consolidation)
+    df = pd.DataFrame(columns, index=index, copy=False)
+    df.columns.name = schema["columns_name"]
+
+    return df
@@ -0,0 +1,212 @@
+"""
+Downcasting of data structures' columns to the smallest safe dtypes.
+"""
+
+from __future__ import annotations
+
+from typing import Hashable, Sequence
+
+import numpy as np
+import pandas as pd
+
+from tournament_simulations.logs import tournament_simulations_logger
+
+INTEGER_DTYPES = (np.int8, np.int16, np.int32, np.int64)
+FLOAT_DTYPES = (np.float32, np.float64)
+
+
+def _fits(values: np.ndarray, candidate: np.ndarray, lossy: bool = False) -> bool:
+
+    """
+    Checks if 'values' survive the conversion to 'candidate'.
+
+    Converting 'candidate' back must give exactly 'values': integers must not
+    overflow and floats must not overflow, underflow or be rounded (NaNs are
+    kept as NaNs). So downcasting is lossless.
+
+    If 'lossy', floats may be rounded (float32 keeps ~7 significant digits),
+    but they still must not overflow.
+    """
+    if np.issubdtype(values.dtype, np.integer):
+        return np.array_equal(candidate, values)
+
+    if lossy:
+        return np.array_equal(np.isfinite(candidate), np.isfinite(values))
+
+    return np.array_equal(candidate.astype(values.dtype), values, equal_nan=True)
+
+
+def smallest_safe_dtype(values: np.ndarray, lossy: bool = False) -> np.dtype:
+
+    """
+    Smallest integer or float dtype which represents 'values' safely.
+
+    Other dtypes are returned unchanged. See _fits for 'lossy'.
+    """
+    if np.issubdtype(values.dtype, np.integer):
+        candidates = INTEGER_DTYPES
+    elif np.issubdtype(values.dtype, np.floating):
+        candidates = FLOAT_DTYPES
+    else:
+        return values.dtype
+
+    for dtype in candidates:
+        if np.dtype(dtype).itemsize >= values.dtype.itemsize:
+            break
+
+        with np.errstate(over="ignore", invalid="ignore"):
+            candidate = values.astype(dtype)
+
+        if _fits(values, candidate, lossy):
+            return np.dtype(dtype)
+
+    return values.dtype
+
+
+def _memory_usage(values: pd.Index | pd.Series) -> int:
+    if isinstance(values, pd.Series):
+        return values.memory_usage(deep=True, index=False)
+
+    return values.memory_usage(deep=True)
+
+
+def _compact_values(
+    values: pd.Index | pd.Series, lossy: bool = False
+) -> pd.Index | pd.Series:
+
+    # repeated strings (for example, winners) -> small integer codes
+    if values.dtype == object:
+        if pd.api.types.infer_dtype(values, skipna=True) != "string":
+            return values
+
+        categorical = values.astype("category")
+        if _memory_usage(categorical) < _memory_usage(values):
+            return categorical
+
+        return values
+
+    if isinstance(values.dtype, np.dtype):
+        return values.astype(smallest_safe_dtype(values.to_numpy(), lossy))
+
+    # categorical codes are already as small as possible
+    return values
+
+
+def compact_frame(
+    df: pd.DataFrame, lossy_columns: Sequence[Hashable] = ()
+) -> tuple[pd.DataFrame, int]:
+
+    """
+    Downcasts every column and index level of 'df' to its smallest safe dtype.
+
+        Integers -> smallest integer dtype with no overflow.
+        Floats -> float32 if every value is exactly representable (lossless).
+            Floats in 'lossy_columns' -> float32 unless a value overflows.
+        Strings -> categorical (int8 codes for a few categories) if smaller.
+
+    Index levels are downcast as well. MultiIndex codes already use the
+    smallest integer dtype for their number of unique values; pandas 1.x
+    keeps integer levels as int64, but they only hold unique values.
+
+    ----
+    Parameters:
+
+        df: pd.DataFrame
+            Any dataframe. It is not modified.
+
+        lossy_columns: Sequence[Hashable] = ()
+            Float columns which may be rounded to float32 (~7 significant
+            digits), for example, betting odds.
+
+    ----
+    Returns:
+        tuple[pd.DataFrame, int]
+            Compacted dataframe (same values, index and order) and how many
+            bytes were saved (negative if it grew).
+    """
+    before = df.memory_usage(deep=True).sum()
+
+    compacted = df.copy(deep=False)
+    for name, column in df.items():
+        compacted[name] = _compact_values(column, name in lossy_columns)
+
+    index = compacted.index
+    if isinstance(index, pd.MultiIndex):
+        levels = [_compact_values(level) for level in index.levels]
+        compacted.index = index.set_levels(levels, verify_integrity=False)
+    else:
+        compacted.index = _compact_values(index)
+
+    bytes_saved = int(before - compacted.memory_usage(deep=True).sum())
+    tournament_simulations_logger.info(
+        f"Compact dtypes saved {bytes_saved} bytes ({before} bytes before)."
+    )
+
+    return compacted, bytes_saved
+
+
+def _cast_values(
+    values: pd.Index | pd.Series,
+    dtype: np.dtype | pd.CategoricalDtype,
+    lossy: bool = False,
+) -> pd.Index | pd.Series:
+
+    if values.dtype == dtype:
+        return values
+
+    if isinstance(dtype, pd.CategoricalDtype):
+        if values.dtype == object:
+            return values.astype("category")
+
+        return values
+
+    if isinstance(dtype, np.dtype) and isinstance(values.dtype, np.dtype):
+        with np.errstate(over="ignore", invalid="ignore"):
+            candidate = values.to_numpy().astype(dtype)
+
+        fits = _fits(values.to_numpy(), candidate, lossy)
+        if values.dtype.kind == dtype.kind and fits:
+            return values.astype(dtype)
+
+    return values
+
+
+def cast_like(
+    df: pd.DataFrame,
+    reference: pd.DataFrame,
+    lossy_columns: Sequence[Hashable] = (),
+) -> pd.DataFrame:
+
+    """
+    Casts columns and index levels of 'df' back to their dtypes in 'reference',
+    as long as no value changes (columns in 'lossy_columns' may be rounded,
+    see compact_frame).
+
+    For example, rows appended to a compacted frame are upcast by
+    concatenation (int8 + int64 -> int64); this restores the compact dtypes.
+    Columns and levels that do not fit (or are not in 'reference') are kept.
+    """
+    cast = df.copy(deep=False)
+    for name, column in df.items():
+        if name in reference.columns:
+            lossy = name in lossy_columns
+            cast[name] = _cast_values(column, reference[name].dtype, lossy)
+
+    index, reference_index = cast.index, reference.index
+
+    if isinstance(index, pd.MultiIndex) and isinstance(reference_index, pd.MultiIndex):
+        levels = []
+
+        for name, level in zip(index.names, index.levels):
+            if name in reference_index.names:
+                position = reference_index.names.index(name)
+                level = _cast_values(level, reference_index.levels[position].dtype)
+
+            levels.append(level)
+
+        cast.index = index.set_levels(levels, verify_integrity=False)
+
+    elif not isinstance(index, pd.MultiIndex):
+        cast.index = _cast_values(index, reference_index.dtype)
+
+    return cast
@@ -0,0 +1,218 @@
+"""
+Helpers shared by data structures whose rows (and cached per-id results)
+are indexed by tournament "id".
+"""
+
+from typing import Hashable, Sequence, TypeVar
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+FrameOrSeries = TypeVar("FrameOrSeries", pd.DataFrame, pd.Series)
+
+
+def team_names_per_id(
+    ids: pd.Categorical, teams: Sequence[pd.Categorical]
+) -> pd.Series:
+
+    """
+    Sorted list of team names for each id, computed from categorical codes.
+
+    ----
+    Parameters:
+
+        ids: pd.Categorical
+            Id of each row.
+
+        teams: Sequence[pd.Categorical]
+            Team columns (for example, home and away teams), each with
+            the same length as 'ids'.
+
+    ----
+    Returns:
+        pd.Series[
+            index = "id" -> pd.Categorical[str] (only ids with rows),
+            values = "teams" -> list[str]
+        ]
+    """
+    # sorted categories, so sorting codes also sorts team names
+    all_teams = union_categoricals(list(teams), sort_categories=True)
+    num_teams = len(all_teams.categories)
+
+    # unique (id, team) pairs, sorted by id and then by team name
+    id_codes = np.tile(ids.codes.astype(np.int64), len(teams))
+    pairs = np.unique(id_codes * num_teams + all_teams.codes)
+    pair_ids, pair_teams = np.divmod(pairs, num_teams)
+
+    present_ids, first_positions = np.unique(pair_ids, return_index=True)
+    team_names = all_teams.categories.to_numpy()[pair_teams]
+
+    return pd.Series(
+        [names.tolist() for names in np.split(team_names, first_positions[1:])],
+        index=pd.CategoricalIndex(
+            pd.Categorical.from_codes(present_ids, ids.categories), name="id"
+        ),
+        name="teams",
+        dtype=object,
+    )
+
+
+def _sort_keys(column: pd.Series) -> np.ndarray:
+
+    # integers in the same order as 'column' values (categories are sorted)
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return column.cat.codes.to_numpy()
+
+    if pd.api.types.is_numeric_dtype(column.dtype):
+        return column.to_numpy()
+
+    return pd.factorize(column, sort=True)[0]
+
+
+def merge_sorted(
+    sorted_frame: FrameOrSeries, new_frame: FrameOrSeries
+) -> FrameOrSeries:
+
+    """
+    Merges 'new_frame' into 'sorted_frame', whose index is already sorted.
+
+    Only 'new_frame' is sorted. Its rows are inserted (with searchsorted) after
+    all rows of 'sorted_frame' with the same index, so the result is the same
+    as concatenating both and sorting the index with a stable sort. If all new
+    rows come after the existing ones (for example, a new matchday), they are
+    only concatenated.
+
+    Categorical columns and index levels stay categorical: their categories
+    become the sorted union of all categories, so codes keep the same order
+    as the values.
+    """
+    index_names = list(sorted_frame.index.names)
+    is_series = isinstance(sorted_frame, pd.Series)
+
+    tables = [sorted_frame.reset_index(), new_frame.reset_index()]
+
+    for name in tables[0].columns:
+        columns = [table[name] for table in tables]
+
+        if all(isinstance(column.dtype, pd.CategoricalDtype) for column in columns):
+            categories = union_categoricals(
+                [column.array for column in columns], sort_categories=True
+            ).categories
+
+            tables = [
+                table.assign(**{name: table[name].cat.set_categories(categories)})
+                for table in tables
+            ]
+
+    num_sorted = len(tables[0])
+    concatenated = pd.concat(tables, ignore_index=True)
+
+    # index values as integers, compared level by level
+    keys = np.rec.fromarrays([_sort_keys(concatenated[name]) for name in index_names])
+    sorted_keys, new_keys = keys[:num_sorted], keys[num_sorted:]
+
+    # stable, so rows with the same index keep their order
+    new_order = np.argsort(new_keys, kind="stable")
+    positions = np.searchsorted(sorted_keys, new_keys[new_order], side="right")
+
+    if not (np.all(positions == num_sorted) and np.all(np.diff(new_order) > 0)):
+        order = np.insert(np.arange(num_sorted), positions, num_sorted + new_order)
+        concatenated = concatenated.take(order)
+
+    merged = concatenated.set_index(index_names)
+
+    if is_series:
+        return merged.iloc[:, 0].rename(sorted_frame.name)
+
+    return merged
+
+
+def id_slices(index: pd.Index) -> dict[Hashable, slice]:
+
+    """
+    Maps each id to the slice of rows (positions) it occupies in 'index'.
+
+    Only valid if 'index' is sorted by "id", so all rows of an id are
+    contiguous. Then, df.iloc[slice] is a constant-time view of an id's rows.
+
+    ----
+    Parameters:
+
+        index: pd.Index
+            Index with an "id" level, sorted by it.
+
+    ----
+    Returns:
+        dict[Hashable, slice]
+            Only ids with rows are keys.
+    """
+    if isinstance(index, pd.MultiIndex):
+        position = index.names.index("id")
+        codes, level = index.codes[position], index.levels[position]
+    else:
+        codes, level = pd.factorize(index, sort=True)
+
+    if len(codes) == 0:
+        return {}
+
+    boundaries = np.flatnonzero(np.diff(codes)) + 1
+    starts = np.concatenate([[0], boundaries]).astype(int)
+    stops = np.concatenate([boundaries, [len(codes)]]).astype(int)
+
+    ids = level[np.asarray(codes)[starts]]
+    return {id_: slice(start, stop) for id_, start, stop in zip(ids, starts, stops)}
+
+
+def id_sizes(id_to_rows: dict[Hashable, slice], index: pd.Index) -> pd.Series:
+
+    """
+    Number of rows of each id, taken from its slice (see id_slices).
+
+    Same as index.to_frame().groupby("id", observed=True).size(), but without
+    grouping: 'id_to_rows' is usually already cached.
+
+    ----
+    Parameters:
+
+        id_to_rows: dict[Hashable, slice]
+            id_slices(index).
+
+        index: pd.Index
+            Index with an "id" level. Only used to keep the id dtype.
+
+    ----
+    Returns:
+        pd.Series[index="id", values=int]
+    """
+    level = index
+    if isinstance(index, pd.MultiIndex):
+        level = index.levels[index.names.index("id")]
+
+    ids = pd.Index(list(id_to_rows), name="id")
+    if isinstance(level.dtype, pd.CategoricalDtype):
+        ids = ids.astype(level.dtype)
+
+    sizes = [rows.stop - rows.start for rows in id_to_rows.values()]
+    return pd.Series(sizes, index=ids, dtype=np.int64)
+
+
+def rows_of_ids(df: FrameOrSeries, ids: Sequence[Hashable]) -> FrameOrSeries:
+    """
+    Rows of 'df' (indexed by "id") whose id is in 'ids'.
+    """
+    return df[df.index.get_level_values("id").isin(ids)]
+
+
+def replace_ids(cached: FrameOrSeries, recomputed: FrameOrSeries) -> FrameOrSeries:
+
+    """
+    Replaces the rows of all ids in 'recomputed' inside 'cached'.
+
+    Other ids are untouched, so only affected ids have to be recomputed
+    when new rows are appended.
+    """
+    ids = recomputed.index.get_level_values("id").unique()
+    kept = cached[~cached.index.get_level_values("id").isin(ids)]
+
+    return merge_sorted(kept, recomputed)
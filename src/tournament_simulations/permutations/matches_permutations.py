@@ -1,14 +1,144 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Iterable, Sequence
+from typing import Any, Iterable, Iterator, Sequence
 
+import numpy as np
 import pandas as pd
 
 from tournament_simulations.data_structures.matches import Matches
 from tournament_simulations.logs import log, tournament_simulations_logger
+from tournament_simulations.utils.seeds import Seed, spawn_seed_sequences
 
 from . import one_permutation as op
 from .tournament_scheduler import TournamentScheduler
 
+# state shared by all chunks computed in a worker process, see _initialize_worker
+_worker_state: dict[str, Any] = {}
+
+
+def _permutation_positions(
+    scheduler: TournamentScheduler,
+    match_date_numbers: op.MatchDateNumbers,
+    seed_sequences: Sequence[np.random.SeedSequence],
+    num_matches: int,
+) -> np.ndarray:
+
+    """
+    Row positions of one permutation per seed sequence.
+
+    Each seed sequence seeds both the schedule (a spawned stream, passed to
+    'scheduler') and the shuffling of date numbers.
+
+    ----
+    Returns:
+        np.ndarray
+            Shape = [len(seed_sequences), num_matches].
+    """
+    positions = np.empty((len(seed_sequences), num_matches), dtype=np.intp)
+
+    for i, seed_sequence in enumerate(seed_sequences):
+
+        (scheduler_sequence,) = spawn_seed_sequences(seed_sequence, 1)
+        permuted_schedule = scheduler.generate_schedule(
+            np.random.default_rng(scheduler_sequence)
+        )
+
+        rng = np.random.default_rng(seed_sequence)
+
+        positions[i] = op.OrderedIndex.positions_from_schedule__date_numbers(
+            permuted_schedule, match_date_numbers, rng
+        )
+
+    return positions
+
+
+def _initialize_worker(
+    scheduler: TournamentScheduler,
+    match_date_numbers: op.MatchDateNumbers,
+    num_matches: int,
+) -> None:
+
+    # forked workers inherit the parent's global random states; without fresh
+    # entropy, scheduler functions without an 'rng' would repeat each other
+    random.seed()
+    np.random.seed()
+
+    # sent once per worker instead of once per chunk
+    _worker_state.update(
+        scheduler=scheduler,
+        match_date_numbers=match_date_numbers,
+        num_matches=num_matches,
+    )
+
+
+def _permutation_positions_in_worker(
+    seed_sequences: Sequence[np.random.SeedSequence],
+) -> np.ndarray:
+
+    return _permutation_positions(seed_sequences=seed_sequences, **_worker_state)
+
+
+def _gather_permutations(
+    matches_df: pd.DataFrame,
+    positions: np.ndarray,
+    identifiers: Sequence[str] | Sequence[int],
+    date_numbers: np.ndarray,
+) -> pd.DataFrame:
+
+    """
+    Builds all permuted tournaments with a single take.
+
+    ----
+    Parameters:
+
+        matches_df: pd.DataFrame
+            Matches.df of the original tournaments.
+
+        positions: np.ndarray
+            Shape = [num_permutations, num_matches].
+            Row positions (in 'matches_df') of each permutation, in order.
+
+        identifiers: Sequence[str] | Sequence[int]
+            Identifier of each permutation.
+
+        date_numbers: np.ndarray
+            "date number" of each match of a permutation.
+
+    ----
+    Returns:
+        pd.DataFrame
+            Same as Matches.df. Id "{id}@{identifier}" for each permutation.
+    """
+    num_permutations, num_matches = positions.shape
+
+    # renamed ids are only created once per (permutation, id), not per match
+    ids = pd.Categorical(matches_df.index.get_level_values("id"))
+    present_codes, id_codes = np.unique(ids.codes[positions], return_inverse=True)
+    present_ids = ids.categories[present_codes]
+
+    new_ids = [
+        f"{id_}@{identifier}" for identifier in identifiers for id_ in present_ids
+    ]
+    categories, new_id_codes = np.unique(new_ids, return_inverse=True)
+
+    permutation_numbers = np.repeat(np.arange(num_permutations), num_matches)
+    row_codes = new_id_codes[permutation_numbers * len(present_ids) + id_codes]
+    row_date_numbers = np.tile(date_numbers, num_permutations)
+
+    # sorted by (id, date number), schedule order is kept for ties
+    order = np.lexsort((row_date_numbers, row_codes))
+
+    permuted = matches_df.take(positions.ravel()[order])
+    permuted.index = pd.MultiIndex.from_arrays(
+        [
+            pd.Categorical.from_codes(row_codes[order], categories),
+            row_date_numbers[order],
+        ],
+        names=["id", "date number"],
+    )
+    return permuted
+
 
 @dataclass
 class MatchesPermutations:
@@ -34,7 +164,6 @@ class MatchesPermutations:
 
     def __post_init__(self):
 
-        self._permuter = op.PermuteMatches(self.matches)
         self._matches_date_numbers = op.MatchDateNumbers.from_matches(self.matches)
 
     @log(tournament_simulations_logger.info)
@@ -42,11 +171,16 @@ class MatchesPermutations:
         self,
         n: int | Iterable[str] | Iterable[int],
         date_numbers: Sequence[int] | pd.Series | None = None,
+        seed: Seed = None,
+        workers: int = 1,
     ) -> Matches:
 
         """
         Create n permutations of all tournaments.
 
+        Each permutation is computed as row positions of self.matches, and
+        all of them are gathered with a single take at the end.
+
         Remark: There can't be a (home, away) pair happening
         more than once in the same day for any real tournament.
             It is ok for (home, away) and (away, home) to occur
@@ -67,6 +201,34 @@ class MatchesPermutations:
                 all new tournaments. That is, all permuted tournaments will have the
                 same match dates as the original ones.
 
+            seed: int | np.random.SeedSequence | np.random.Generator | None = None
+                Seed for schedules and for shuffling date numbers. Each
+                permutation uses its own random stream spawned from it.
+
+                If None, it is drawn from python's random module.
+                If it is a np.random.Generator, the seed is drawn from it.
+
+                Remark: the stream is passed to self.scheduler functions with an
+                'rng' parameter (see TournamentScheduler). Other functions are
+                called as they are, so they must be seeded separately for
+                permutations to be reproducible.
+
+            workers: int = 1
+                Number of processes computing permutations.
+
+                1: every permutation is computed in this process.
+                More than 1: permutations are split into chunks, which are
+                    computed by a pool of 'workers' processes. self.scheduler
+                    must be picklable (lambdas are not).
+
+                    Each permutation's schedule and shuffling are seeded from
+                    its own stream (see 'seed') in both cases, so results do
+                    not depend on 'workers'. Scheduler functions without an
+                    'rng' parameter draw from their worker's global random
+                    states instead, which are not seeded from 'seed'.
+
+                Permutations are always in the same order.
+
         ----
         Returns:
 
@@ -79,7 +241,8 @@ class MatchesPermutations:
                 df: pd.DataFrame[
                     index=[
                         "id"          -> pd.Categorical[str]
-                            "{current_name}@/{sport}/{country}/{name-year}/@{num_permutation}",\n
+                            "{current_name}@/{sport}/{country}/{name-year}/"
+                            "@{num_permutation}",\n
                         "date number" -> int,
                     ],\n
                     columns=[
@@ -97,24 +260,143 @@ class MatchesPermutations:
                     ]
                 ]
         """
-        permutations: list[pd.DataFrame] = []
+        if workers < 1:
+            raise ValueError(f"Expected at least 1 worker, got {workers}.")
 
         if isinstance(n, int):
             n = range(n)
 
-        for identifier in n:
+        n = list(n)
+        seed_sequences = spawn_seed_sequences(seed, len(n))
+        date_numbers = self._parse_date_numbers(date_numbers)
+
+        # row permutation of each identifier -> shape = [len(n), num_matches]
+        positions = self._create_positions(seed_sequences, workers)
+
+        permuted = _gather_permutations(self.matches.df, positions, n, date_numbers)
+        return Matches.from_normalized(permuted)
+
+    def iter_permutations(
+        self,
+        n: int | Iterable[str] | Iterable[int],
+        batch_size: int = 1,
+        date_numbers: Sequence[int] | pd.Series | None = None,
+        seed: Seed = None,
+    ) -> Iterator[Matches]:
+
+        """
+        Lazily create n permutations of all tournaments, 'batch_size' at a time.
+
+        Only the current batch is kept in memory, so each batch can be
+        simulated (or reduced) and discarded before the next one is created.
+
+        Batches are the same as slices of create_n_permutations' result with
+        the same parameters (and workers=1):
+            the i-th batch has the permutations of identifiers
+            n[i * batch_size : (i + 1) * batch_size].
+
+        ----
+        Parameters:
+
+            n: int | Iterable[str] | Iterable[int]
+                Same as create_n_permutations'.
+
+            batch_size: int = 1
+                Number of permutations in each yielded Matches.
+                The last batch may be smaller.
+
+            date_numbers: Sequence[int] | pd.Series | None = None
+                Same as create_n_permutations'.
+
+            seed: int | np.random.SeedSequence | np.random.Generator | None = None
+                Same as create_n_permutations'.
+
+        ----
+        Returns:
+
+            Iterator[Matches]
+                Permuted matches of each batch (see create_n_permutations).
+
+                Nothing is computed until the iterator is consumed.
+        """
+        if batch_size < 1:
+            raise ValueError(f"Expected a positive batch size, got {batch_size}.")
+
+        if isinstance(n, int):
+            n = range(n)
+
+        n = list(n)
+        seed_sequences = spawn_seed_sequences(seed, len(n))
+        date_numbers = self._parse_date_numbers(date_numbers)
+
+        return self._generate_batches(n, batch_size, date_numbers, seed_sequences)
+
+    def _generate_batches(
+        self,
+        n: list[str] | list[int],
+        batch_size: int,
+        date_numbers: np.ndarray,
+        seed_sequences: list[np.random.SeedSequence],
+    ) -> Iterator[Matches]:
+
+        for start in range(0, len(n), batch_size):
+            stop = start + batch_size
+
+            positions = self._create_positions(seed_sequences[start:stop], workers=1)
+            permuted = _gather_permutations(
+                self.matches.df, positions, n[start:stop], date_numbers
+            )
+            yield Matches.from_normalized(permuted)
+
+    def _parse_date_numbers(
+        self, date_numbers: Sequence[int] | pd.Series | None
+    ) -> np.ndarray:
+
+        if date_numbers is None:
+            date_numbers = self.matches.df.index.get_level_values("date number")
+        date_numbers = np.asarray(date_numbers, dtype=int)
+
+        if len(date_numbers) != len(self.matches.df):
+            raise ValueError(
+                f"Expected {len(self.matches.df)} date numbers, "
+                f"got {len(date_numbers)}."
+            )
+
+        return date_numbers
+
+    def _create_positions(
+        self, seed_sequences: Sequence[np.random.SeedSequence], workers: int
+    ) -> np.ndarray:
+
+        num_matches = len(self.matches.df)
+
+        if workers == 1:
+            return _permutation_positions(
+                self.scheduler, self._matches_date_numbers, seed_sequences, num_matches
+            )
+
+        if not seed_sequences:
+            return np.empty((0, num_matches), dtype=np.intp)
 
-            def _rename_id(id_: str) -> str:
-                return f"{id_}@{identifier}"
+        # a few chunks per worker, so slower chunks do not leave workers idle
+        num_chunks = min(len(seed_sequences), 4 * workers)
+        boundaries = np.linspace(0, len(seed_sequences), num_chunks + 1).astype(int)
+        chunks = [
+            seed_sequences[start:stop]
+            for start, stop in zip(boundaries[:-1], boundaries[1:])
+        ]
 
-            shuffled_date_numbers = self._matches_date_numbers.create_shuffled_copy()
-            permuted_schedule = self.scheduler.generate_schedule()
+        # dense arrays are computed once here, instead of once per worker
+        match_date_numbers = self._matches_date_numbers
+        for name in ("widths", "dense_date_numbers", "dense_positions", "pair_rows"):
+            getattr(match_date_numbers, name)
 
-            _get_new_index = op.OrderedIndex.from_schedule__date_numbers
-            new_index = _get_new_index(permuted_schedule, shuffled_date_numbers)
-            permuted_matches = self._permuter.permute_matches(new_index, date_numbers)
+        initargs = (self.scheduler, match_date_numbers, num_matches)
 
-            renamed_df = permuted_matches.df.rename(index=_rename_id, level="id")
-            permutations.append(renamed_df)
+        with ProcessPoolExecutor(
+            workers, initializer=_initialize_worker, initargs=initargs
+        ) as pool:
+            # map keeps chunks in order
+            positions = list(pool.map(_permutation_positions_in_worker, chunks))
 
-        return Matches(pd.concat(permutations))
+        return np.concatenate(positions)
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 from tournament_simulations.data_structures.matches import Matches
@@ -20,6 +21,27 @@ def _get_date_numbers_per_match(matches: Matches) -> pd.Series:
     )
 
 
+def _get_positions_per_match(matches: Matches) -> pd.Series:
+
+    """
+    Maps team pair (home, away) to a list with the row positions
+    (in matches.df) of all matches between them.
+
+    Lists are aligned with _get_date_numbers_per_match.
+    """
+
+    df = matches.df
+    id_home_away = pd.MultiIndex.from_arrays(
+        [df.index.get_level_values("id"), df["home"], df["away"]]
+    )
+
+    return (
+        pd.Series(np.arange(len(df)), index=id_home_away, name="position")
+        .groupby(["id", "home", "away"], observed=True)
+        .agg(list)
+    )
+
+
 def _fill_date_numbers_per_match_per_id(
     date_numbers_per_match: pd.Series, max_match_count: pd.Series
 ) -> pd.Series:
@@ -81,9 +103,12 @@ def get_kwargs_from_matches(matches: Matches) -> KwargsMD:
         Kwargs parameters to intiialize MatchesDates
             "series" -> pd.Series
                 list with all date number two teams faced each other per tournament.
+            "positions" -> pd.Series
+                row positions (in matches.df) of the same matches.
     """
 
     date_numbers_per_match = _get_date_numbers_per_match(matches)
+    positions_per_match = _get_positions_per_match(matches)
 
     count_per_id = matches.home_vs_away_count_per_id
     max_match_count_per_id = count_per_id.groupby("id", observed=True).max()
@@ -91,5 +116,8 @@ def get_kwargs_from_matches(matches: Matches) -> KwargsMD:
     return {
         "series": _fill_date_numbers_per_match_per_id(
             date_numbers_per_match, max_match_count_per_id
-        )
+        ),
+        "positions": _fill_date_numbers_per_match_per_id(
+            positions_per_match, max_match_count_per_id
+        ),
     }
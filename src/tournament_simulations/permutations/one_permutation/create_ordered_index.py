@@ -1,8 +1,10 @@
 from typing import Iterator
 
+import numpy as np
 import pandas as pd
 
-from tournament_simulations.data_structures.matches import Id
+from tournament_simulations.data_structures.matches import Id, Team
+from tournament_simulations.data_structures.utils import per_id
 from tournament_simulations.logs import log, tournament_simulations_logger
 from tournament_simulations.schedules import Round
 
@@ -13,15 +15,20 @@ from .tournament_schedule import TournamentSchedule
 KwargsPI = dict[str, pd.Series]
 
 
-def _generate_all_indexes_one_id(
-    rounds: Iterator[Round], dates_numbers: pd.Series, id_: Id
-) -> list[MatchIndexWithTeams]:
+def _generate_indexes_and_positions_one_id(
+    rounds: Iterator[Round],
+    dates_numbers: pd.Series,
+    id_: Id,
+    positions: pd.Series | None = None,
+) -> tuple[list[MatchIndexWithTeams], list[int]]:
 
     # date_number is a mapping of (home, away) pairs to lists
     # containing all date numbers they faced each other in
     real_matches = set(dates_numbers.index)
 
+    # positions (if any) are aligned with date numbers, so both are popped together
     list_ = []
+    positions_list = []
 
     for round in rounds:
         for home_away in round:
@@ -30,39 +37,91 @@ def _generate_all_indexes_one_id(
                 continue
 
             date_number = dates_numbers[home_away].pop()
+            position = positions[home_away].pop() if positions is not None else -1
+
             if date_number == -1:  # -1 is padding number
                 continue
 
             list_.append((id_, date_number) + home_away)
+            positions_list.append(position)
 
-    return list_
+    return list_, positions_list
 
 
-def _generate_matches_permutation_index_one_id(
-    schedule: pd.Series, id_to_matches_dates: pd.Series
+def _generate_all_indexes_one_id(
+    rounds: Iterator[Round], dates_numbers: pd.Series, id_: Id
 ) -> list[MatchIndexWithTeams]:
 
+    indexes, _ = _generate_indexes_and_positions_one_id(rounds, dates_numbers, id_)
+    return indexes
+
+
+def _generate_matches_permutation_one_id(
+    schedule: pd.Series,
+    id_to_matches_dates: pd.Series,
+    id_to_rows: dict[Id, slice] | None = None,
+    id_to_positions: pd.Series | None = None,
+) -> tuple[list[MatchIndexWithTeams], list[int]]:
+
     id_: Id = schedule.name
     rounds: Iterator[Round] = schedule["schedule"]
-    dates_numbers: pd.Series = id_to_matches_dates.loc[id_]
 
-    return _generate_all_indexes_one_id(rounds, dates_numbers, id_)
+    if id_to_rows is None:
+        id_to_rows = per_id.id_slices(id_to_matches_dates.index)
+
+    # constant-time slice instead of searching the whole index with .loc
+    rows = id_to_rows[id_]
+    dates_numbers: pd.Series = id_to_matches_dates.iloc[rows].droplevel("id")
+
+    positions = None
+    if id_to_positions is not None:
+        positions = id_to_positions.iloc[rows].droplevel("id")
+
+    return _generate_indexes_and_positions_one_id(rounds, dates_numbers, id_, positions)
+
+
+def _generate_matches_permutation_index_one_id(
+    schedule: pd.Series,
+    id_to_matches_dates: pd.Series,
+    id_to_rows: dict[Id, slice] | None = None,
+) -> list[MatchIndexWithTeams]:
+
+    indexes, _ = _generate_matches_permutation_one_id(
+        schedule, id_to_matches_dates, id_to_rows
+    )
+    return indexes
 
 
 def _get_kwargs(
     id_to_permutation_schedule: pd.Series,
     id_to_matches_dates: pd.Series,
-) -> dict[str, pd.Series]:
+    id_to_positions: pd.Series | None = None,
+    id_to_rows: dict[Id, slice] | None = None,
+) -> KwargsPI:
 
-    return {
-        "series": id_to_permutation_schedule.to_frame("schedule")
+    if id_to_rows is None:
+        id_to_rows = per_id.id_slices(id_to_matches_dates.index)
+
+    generated = (
+        id_to_permutation_schedule.to_frame("schedule")
         .apply(
-            _generate_matches_permutation_index_one_id,
+            _generate_matches_permutation_one_id,
             axis=1,
             id_to_matches_dates=id_to_matches_dates,
+            id_to_rows=id_to_rows,
+            id_to_positions=id_to_positions,
         )
         .sort_index()
-    }
+    )
+
+    kwargs = {"series": generated.map(lambda generated_one_id: generated_one_id[0])}
+
+    if id_to_positions is not None:
+        kwargs["positions"] = generated.map(
+            lambda generated_one_id: generated_one_id[1]
+        )
+
+    return kwargs
 
 
 @log(tournament_simulations_logger.debug)
@@ -71,4 +130,80 @@ def get_kwargs_from_schedule__date_number(
     match_date_numbers: MatchDateNumbers,
 ) -> KwargsPI:
 
-    return _get_kwargs(permuatation_schedule.series, match_date_numbers.series)
+    return _get_kwargs(
+        permuatation_schedule.series,
+        match_date_numbers.series,
+        match_date_numbers.positions,
+        match_date_numbers.id_to_rows,
+    )
+
+
+def _generate_positions_one_id(
+    rounds: Iterator[Round],
+    pair_rows: dict[tuple[Team, Team], int],
+    widths: np.ndarray,
+    dates: np.ndarray,
+    positions: np.ndarray,
+) -> np.ndarray:
+
+    """
+    Same positions as _generate_indexes_and_positions_one_id, but popping
+    from dense arrays (see MatchDateNumbers.shuffle_dense).
+    """
+    # row (in the dense arrays) of each scheduled match between real pairs
+    rows = np.fromiter(
+        (pair_rows.get(home_away, -1) for round in rounds for home_away in round),
+        dtype=np.intp,
+    )
+    rows = rows[rows >= 0]
+
+    # the k-th time a pair is scheduled, it pops its k-th element from the end
+    order = np.argsort(rows, kind="stable")
+    sorted_rows = rows[order]
+    is_first = np.concatenate([[True], sorted_rows[1:] != sorted_rows[:-1]])
+    first_positions = np.maximum.accumulate(np.where(is_first, np.arange(len(rows)), 0))
+
+    occurrences = np.empty_like(rows)
+    occurrences[order] = np.arange(len(rows)) - first_positions
+    columns = widths[rows] - 1 - occurrences
+
+    if (columns < 0).any():
+        raise IndexError("A pair is scheduled more times than it has date numbers.")
+
+    is_real = dates[rows, columns] != -1  # -1 is padding number
+    return positions[rows, columns][is_real]
+
+
+# not logged: it is called once per permutation and logging formats all arguments
+def get_positions_from_schedule__date_numbers(
+    permuatation_schedule: TournamentSchedule,
+    match_date_numbers: MatchDateNumbers,
+    rng: np.random.Generator | None = None,
+) -> np.ndarray:
+
+    """
+    Row positions (in Matches.df) of a permutation, that is, the same as
+
+        OrderedIndex.from_schedule__date_numbers(
+            permuatation_schedule, match_date_numbers.create_shuffled_copy(rng)
+        ).to_flat_positions()
+
+    but working on dense arrays, without creating any index tuple or list.
+
+    'match_date_numbers' must have positions.
+    """
+    if match_date_numbers.positions is None:
+        raise ValueError("'match_date_numbers' has no positions.")
+
+    dates, positions = match_date_numbers.shuffle_dense(rng)
+    pair_rows = match_date_numbers.pair_rows
+    widths = match_date_numbers.widths
+
+    positions_per_id = [
+        _generate_positions_one_id(rounds, pair_rows[id_], widths, dates, positions)
+        for id_, rounds in permuatation_schedule.series.items()
+    ]
+    if not positions_per_id:
+        return np.empty(0, dtype=np.intp)
+
+    return np.concatenate(positions_per_id)
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-import random
+import functools
+import itertools
 from dataclasses import dataclass
 
+import numpy as np
 import pandas as pd
 
-from tournament_simulations.data_structures.matches import Matches
+from tournament_simulations.data_structures.matches import Id, Matches, Team
+from tournament_simulations.data_structures.utils import per_id
+from tournament_simulations.utils.seeds import default_rng
 
 from .create_match_date_numbers import get_kwargs_from_matches
 
@@ -43,13 +47,28 @@ class MatchDateNumbers:
                     teams don't face each other are randomized.
             ]
         ]
+
+        positions: pd.Series | None = None
+            Same index as 'series'. Row positions (in Matches.df) of the
+            matches in "date number" lists, in the same order (-1 for padding).
+
+            If available, permutations can take rows directly from Matches.df
+            instead of looking matches up by (id, date number, home, away).
+
+    Both are also stored as dense arrays (shape = [num_pairs, max_count], one
+    row per (id, home, away) pair and padded with -1), so all lists can be
+    shuffled at once (see self.shuffle_dense).
     """
 
     series: pd.Series
+    positions: pd.Series | None = None
 
     def __post_init__(self) -> None:
         self.series = self.series.sort_index().rename("date number")
 
+        if self.positions is not None:
+            self.positions = self.positions.sort_index().rename("position")
+
     @classmethod
     def from_matches(cls, matches: Matches) -> MatchDateNumbers:
 
@@ -65,12 +84,121 @@ class MatchDateNumbers:
         parameters = get_kwargs_from_matches(matches)
         return cls(**parameters)
 
-    def create_shuffled_copy(self) -> MatchDateNumbers:
+    @functools.cached_property
+    def widths(self) -> np.ndarray:
         """
-        Create a matches dates copy in which all date numbers lists have been shuffled.
+        Length of each "date number" list.
+        """
+        return self.series.map(len).to_numpy(dtype=np.intp)
+
+    def _to_dense(self, lists: pd.Series, dtype: type[np.integer]) -> np.ndarray:
+
+        widths = self.widths
+        dense = np.full((len(widths), widths.max(initial=0)), -1, dtype=dtype)
+
+        is_filled = np.arange(dense.shape[1]) < widths[:, np.newaxis]
+        dense[is_filled] = np.fromiter(
+            itertools.chain.from_iterable(lists), dtype=dtype, count=widths.sum()
+        )
+        return dense
+
+    @functools.cached_property
+    def dense_date_numbers(self) -> np.ndarray:
+        """
+        "date number" lists as a np.int32 array (shape = [num_pairs, max_count]).
+        """
+        return self._to_dense(self.series, np.int32)
+
+    @functools.cached_property
+    def dense_positions(self) -> np.ndarray | None:
+        """
+        Same as self.dense_date_numbers, but for self.positions.
+        """
+        if self.positions is None:
+            return None
+
+        return self._to_dense(self.positions, np.intp)
+
+    @functools.cached_property
+    def id_to_rows(self) -> dict[Id, slice]:
+        """
+        Offsets table: maps each id to the slice of its (home, away) pairs
+        in self.series (see Matches.id_to_rows).
+        """
+        return per_id.id_slices(self.series.index)
+
+    @functools.cached_property
+    def pair_rows(self) -> dict[Id, dict[tuple[Team, Team], int]]:
         """
-        # apply func
-        def _sample_dates(list_):
-            return random.sample(list_, k=len(list_))
+        Maps each id and (home, away) pair to its row in the dense arrays.
+        """
+        pair_rows: dict[Id, dict[tuple[Team, Team], int]] = {}
+
+        for row, (id_, home, away) in enumerate(self.series.index):
+            pair_rows.setdefault(id_, {})[(home, away)] = row
+
+        return pair_rows
+
+    def shuffle_dense(
+        self, rng: np.random.Generator | None = None
+    ) -> tuple[np.ndarray, np.ndarray | None]:
+
+        """
+        Shuffles all lists at once: each row of the dense arrays is sorted by
+        random keys (only its first 'width' elements are shuffled).
+
+        ----
+        Parameters:
+
+            rng: np.random.Generator | None = None
+                If None, a new one is seeded from python's random module.
 
-        return MatchDateNumbers(self.series.apply(_sample_dates))
+        ----
+        Returns:
+            tuple[np.ndarray, np.ndarray | None]
+                Shuffled copies of self.dense_date_numbers and
+                self.dense_positions (same shuffle for both).
+        """
+        rng = default_rng(rng)
+        dates = self.dense_date_numbers
+
+        # padding beyond each list's width gets infinite keys, so it stays last
+        keys = rng.random(dates.shape)
+        keys[np.arange(dates.shape[1]) >= self.widths[:, np.newaxis]] = np.inf
+        order = np.argsort(keys, axis=1)
+
+        positions = self.dense_positions
+        if positions is not None:
+            positions = np.take_along_axis(positions, order, axis=1)
+
+        return np.take_along_axis(dates, order, axis=1), positions
+
+    def create_shuffled_copy(
+        self, rng: np.random.Generator | None = None
+    ) -> MatchDateNumbers:
+        """
+        Create a matches dates copy in which all date numbers lists have been shuffled.
+
+        If 'rng' (np.random.Generator) is None, one is seeded from python's random.
+        """
+        dates, positions = self.shuffle_dense(rng)
+
+        def _to_lists(dense: np.ndarray, series: pd.Series) -> pd.Series:
+            lists = [row[:width].tolist() for row, width in zip(dense, self.widths)]
+            return pd.Series(lists, series.index, dtype=object, name=series.name)
+
+        if positions is None:
+            shuffled = MatchDateNumbers(_to_lists(dates, self.series))
+        else:
+            shuffled = MatchDateNumbers(
+                _to_lists(dates, self.series), _to_lists(positions, self.positions)
+            )
+
+        # same index and list lengths: offsets are computed once (on self) and
+        # shared by all shuffled copies instead of recomputed for each of them
+        shuffled.__dict__["id_to_rows"] = self.id_to_rows
+        shuffled.__dict__["widths"] = self.widths
+        if "pair_rows" in self.__dict__:
+            shuffled.__dict__["pair_rows"] = self.pair_rows
+
+        return shuffled
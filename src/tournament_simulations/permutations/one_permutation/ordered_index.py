@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import itertools
 from dataclasses import dataclass
 
+import numpy as np
 import pandas as pd
 
 from ..utils.types import MatchIndexWithTeams
-from .create_ordered_index import get_kwargs_from_schedule__date_number
+from .create_ordered_index import (
+    get_kwargs_from_schedule__date_number,
+    get_positions_from_schedule__date_numbers,
+)
 from .match_date_numbers import MatchDateNumbers
 from .tournament_schedule import TournamentSchedule
 
@@ -31,19 +36,38 @@ class OrderedIndex:
                     List of indexes.
             ]
 
+        positions: pd.Series | None = None
+            Same index as 'series'. Row positions (in Matches.df) of each
+            index, in the same order. Available when MatchDateNumbers has
+            positions.
+
     """
 
     series: pd.Series
+    positions: pd.Series | None = None
 
     def __post_init__(self) -> None:
         self.series = self.series.sort_index().rename("index")
 
+        if self.positions is not None:
+            self.positions = self.positions.sort_index().rename("position")
+
     def to_flat_list(self) -> list[MatchIndexWithTeams]:
         """
         Returns a list aggregating all tournaments' indexes.
         """
         return self.series.explode(ignore_index=True).to_list()
 
+    def to_flat_positions(self) -> np.ndarray | None:
+        """
+        Returns an array aggregating all tournaments' row positions (same order
+        as self.to_flat_list), or None if there are no positions.
+        """
+        if self.positions is None:
+            return None
+
+        return np.fromiter(itertools.chain.from_iterable(self.positions), dtype=np.intp)
+
     @classmethod
     def from_schedule__date_numbers(
         cls,
@@ -55,3 +79,43 @@ class OrderedIndex:
             tournament_schedule, match_date_numbers
         )
         return cls(**parameters)
+
+    @staticmethod
+    def positions_from_schedule__date_numbers(
+        tournament_schedule: TournamentSchedule,
+        match_date_numbers: MatchDateNumbers,
+        rng: np.random.Generator | None = None,
+    ) -> np.ndarray:
+
+        """
+        Flat row positions of the OrderedIndex created from 'tournament_schedule'
+        and a shuffled copy of 'match_date_numbers', without creating it.
+
+        Shuffling and popping date numbers are done on dense arrays, so it is
+        much faster when only positions are needed (for example, permutations).
+
+        ----
+        Parameters:
+
+            tournament_schedule: TournamentSchedule
+                Schedule for each tournament.
+
+            match_date_numbers: MatchDateNumbers
+                Original (not shuffled) date numbers. Must have positions.
+
+            rng: np.random.Generator | None = None
+                Used to shuffle date numbers.
+                If None, a new one is seeded from python's random module.
+
+        ----
+        Returns:
+            np.ndarray
+                Same as
+                    OrderedIndex.from_schedule__date_numbers(
+                        tournament_schedule,
+                        match_date_numbers.create_shuffled_copy(rng)
+                    ).to_flat_positions()
+        """
+        return get_positions_from_schedule__date_numbers(
+            tournament_schedule, match_date_numbers, rng
+        )
@@ -1,26 +1,16 @@
+import functools
 from dataclasses import dataclass
 from typing import Sequence
 
+import numpy as np
 import pandas as pd
 
 from tournament_simulations.data_structures.matches import DateNumber, Matches
 from tournament_simulations.logs import log, tournament_simulations_logger
 
-from ..utils.types import MatchIndexWithTeams
 from .ordered_index import OrderedIndex
 
 
-def _index_matches_appropriately(
-    matches_df: pd.DataFrame, indexes: list[MatchIndexWithTeams]
-) -> pd.DataFrame:
-
-    # need to set ["home", "away"] to index since the indexes depend on it
-    matches_teams_in_index = matches_df.set_index(["home", "away"], append=True)
-    desired_matches = matches_teams_in_index.loc[indexes]
-
-    return desired_matches.reset_index(["home", "away"])
-
-
 def _set_date_numbers(
     permuted_matches: pd.DataFrame, date_numbers: list[DateNumber]
 ) -> pd.DataFrame:
@@ -38,6 +28,60 @@ class PermuteMatches:
 
     matches: Matches
 
+    @functools.cached_property
+    def _row_lookup(self) -> pd.MultiIndex:
+        """
+        (id, date number, home, away) of each row of self.matches.df.
+        """
+        df = self.matches.df
+        return pd.MultiIndex.from_arrays(
+            [
+                df.index.get_level_values("id"),
+                df.index.get_level_values("date number"),
+                df["home"],
+                df["away"],
+            ]
+        )
+
+    def row_positions(self, ordered_index: OrderedIndex) -> np.ndarray:
+
+        """
+        Row positions (in self.matches.df) of all matches in 'ordered_index',
+        in the desired order.
+
+        They are carried by 'ordered_index' when it was created from
+        MatchDateNumbers.from_matches(self.matches). Otherwise, matches are
+        looked up by (id, date number, home, away).
+
+        -----
+        Parameters:
+
+            ordered_index: OrderedIndex
+                Desired order for new tournament.
+
+        -----
+        Returns:
+            np.ndarray[int]
+                self.matches.df.take(positions) is the permuted tournament
+                before its date numbers are replaced.
+        """
+        positions = ordered_index.to_flat_positions()
+        if positions is not None:
+            return positions
+
+        flat_list = ordered_index.to_flat_list()
+        if not flat_list:
+            return np.empty(0, dtype=np.intp)
+
+        flat_index = pd.MultiIndex.from_tuples(flat_list)
+        positions = self._row_lookup.get_indexer(flat_index)
+
+        if (positions == -1).any():
+            missing = flat_index[positions == -1].tolist()
+            raise KeyError(f"Matches not found: {missing}.")
+
+        return positions
+
     @log(tournament_simulations_logger.info)
     def permute_matches(
         self,
@@ -69,8 +113,7 @@ class PermuteMatches:
                 initial tournament, but the matches that happen in
                 each date will be different.
         """
-        flat_index = ordered_index.to_flat_list()
-        new_matches_df = _index_matches_appropriately(self.matches.df, flat_index)
+        new_matches_df = self.matches.df.take(self.row_positions(ordered_index))
 
         if date_numbers is None:
             date_numbers = self.matches.df.index.get_level_values("date number")
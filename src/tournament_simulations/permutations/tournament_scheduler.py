@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import functools
+import inspect
 from dataclasses import dataclass
 from typing import Callable, Mapping
 
+import numpy as np
 import pandas as pd
 
 import tournament_simulations.utils.series_of_functions as sof
@@ -10,6 +13,15 @@ import tournament_simulations.utils.series_of_functions as sof
 from .one_permutation import TournamentSchedule
 
 
+def _pass_rng(func: Callable, rng: np.random.Generator | None) -> Callable:
+
+    # only functions with an 'rng' parameter receive it
+    if rng is None or "rng" not in inspect.signature(func).parameters:
+        return func
+
+    return functools.partial(func, rng=rng)
+
+
 @dataclass
 class TournamentScheduler:
 
@@ -27,6 +39,14 @@ class TournamentScheduler:
 
         Parameters should always be an Iterable, even if the function only
         takes one parameter.
+
+        If a function has an 'rng' parameter, it also receives the generator
+        passed to generate_schedule, for example:
+            def func_schedule(team_names, rng=None):
+                return list(
+                    DoubleRoundRobin.from_team_names(team_names)
+                    .get_full_schedule(1, rng=rng)
+                )
             Iterable[0] -> first parameter
             Iterable[1] -> second parameter
             ...
@@ -40,11 +60,23 @@ class TournamentScheduler:
     def __post_init__(self) -> None:
         self.id_to_parameters = self.id_to_parameters.sort_index()
 
-    def generate_schedule(self) -> TournamentSchedule:
+    def generate_schedule(
+        self, rng: np.random.Generator | None = None
+    ) -> TournamentSchedule:
         """
         Create a tournament schedule for each id given self.func_schedule
         and self.id_to_parameters.
 
+        ----
+        Parameters:
+
+            rng: np.random.Generator | None = None
+                Passed as keyword argument 'rng' to functions which have
+                that parameter. Ids are scheduled in order, so schedules are
+                reproducible if 'rng' is.
+
+                If None, functions are called as they are.
+
         ----
         Retuns:
             TournamentSchedule
@@ -52,14 +84,19 @@ class TournamentScheduler:
                     Schedule for each tournament (pd.Series)
         """
         if isinstance(self.func_schedule, Callable):
+            func_schedule = _pass_rng(self.func_schedule, rng)
+
             # .map uses all parameters as a single one, so we need to unpack it
             def _unpack_parameters(iterable):
-                return self.func_schedule(*iterable)
+                return func_schedule(*iterable)
 
             schedule = self.id_to_parameters.map(_unpack_parameters)
         else:
             schedule = sof.call_functions_with_their_parameters(
-                key_to_func=self.func_schedule,
+                key_to_func={
+                    key: _pass_rng(func, rng)
+                    for key, func in self.func_schedule.items()
+                },
                 key_to_func_parameters=self.id_to_parameters,
             )
 
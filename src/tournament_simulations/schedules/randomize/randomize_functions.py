@@ -1,19 +1,35 @@
-import random
 from typing import Sequence
 
+import numpy as np
+
+from tournament_simulations.utils.seeds import default_rng
+
 from ..utils.rename_teams import rename_teams_in_rounds
 from ..utils.scheduling_types import Match, Round, Team
 
 
-def shuffle_home_away_in_matches(schedule: list[Round]) -> list[Round]:
+def _sample(
+    population: Sequence, rng: np.random.Generator | None = None
+) -> list:
+    rng = default_rng(rng)
+    return [population[i] for i in rng.permutation(len(population))]
+
+
+def shuffle_home_away_in_matches(
+    schedule: list[Round], rng: np.random.Generator | None = None
+) -> list[Round]:
     """
     Shuffle all (home, away) matches.
     Each match can either stay as (home, away) or turn into (away, home).
 
     It does not shuffle inplace, a new list will be returned.
+
+    If 'rng' (np.random.Generator) is None, one is seeded from python's random.
     """
+    rng = default_rng(rng)
+
     def _shuffle_match(match: Match) -> Match:
-        return tuple(random.sample(match, 2))
+        return tuple(_sample(match, rng))
 
     # shuffling is a good idea because otherwise some teams could be home too much
     # for example, the first team would be home all matches
@@ -23,25 +39,35 @@ def shuffle_home_away_in_matches(schedule: list[Round]) -> list[Round]:
     ]
 
 
-def shuffle_matches_in_rounds(schedule: list[Round]) -> list[Round]:
+def shuffle_matches_in_rounds(
+    schedule: list[Round], rng: np.random.Generator | None = None
+) -> list[Round]:
     """
     Given a single round-robin schedule, shuffle matches in all rounds.
 
     It does not shuffle inplace, a new list will be returned.
+
+    If 'rng' (np.random.Generator) is None, one is seeded from python's random.
     """
+    rng = default_rng(rng)
+
     return [
-        tuple(random.sample(round_, k=len(round_)))
+        tuple(_sample(round_, rng))
         for round_ in schedule
     ]
 
 
-def shuffle_rounds_in_schedule(schedule: list[Round]) -> list[Round]:
+def shuffle_rounds_in_schedule(
+    schedule: list[Round], rng: np.random.Generator | None = None
+) -> list[Round]:
     """
     Given a single round-robin schedule, shuffle its rounds.
 
     It does not shuffle inplace, a new list will be returned.
+
+    If 'rng' (np.random.Generator) is None, one is seeded from python's random.
     """
-    return random.sample(schedule, k=len(schedule))
+    return _sample(schedule, rng)
 
 
 def _get_names_from_schedule(schedule: list[Round]) -> list[Team]:
@@ -50,7 +76,9 @@ def _get_names_from_schedule(schedule: list[Round]) -> list[Team]:
 
 
 def shuffle_teams(
-    schedule: list[Round], team_names: Sequence[Team] | None = None
+    schedule: list[Round],
+    team_names: Sequence[Team] | None = None,
+    rng: np.random.Generator | None = None,
 ) -> list[Round]:
     """
     Shuffle all team names in matches.
@@ -58,11 +86,13 @@ def shuffle_teams(
     If 'team_names' is None, they will be infered from 'schedule'.
 
     It does not shuffle inplace, a new list will be returned.
+
+    If 'rng' (np.random.Generator) is None, one is seeded from python's random.
     """
     if team_names is None:
         team_names = _get_names_from_schedule(schedule)
 
-    shuffled_names = random.sample(team_names, k=len(team_names))
+    shuffled_names = _sample(team_names, rng)
 
     old_team_to_new = dict(zip(team_names, shuffled_names))
     return list(rename_teams_in_rounds(schedule, old_team_to_new))
@@ -1,11 +1,15 @@
 from dataclasses import dataclass
 from typing import Callable, Iterable, Literal, Mapping, Sequence
 
+import numpy as np
+
+from tournament_simulations.utils.seeds import default_rng
+
 from ..utils.scheduling_types import Round, Team
 from . import randomize_functions as rfunc
 
 Option = Literal["teams", "home_away", "matches", "rounds", "all"]
-RandFunc = Callable[[list[Round]], list[Round]]
+RandFunc = Callable[[list[Round], np.random.Generator], list[Round]]
 
 
 @dataclass
@@ -22,7 +26,9 @@ class RandomizeSchedule:
             "home_away": rfunc.shuffle_home_away_in_matches,
             "matches": rfunc.shuffle_matches_in_rounds,
             "rounds": rfunc.shuffle_rounds_in_schedule,
-            "teams": lambda schedule: rfunc.shuffle_teams(schedule, self.team_names),
+            "teams": lambda schedule, rng: rfunc.shuffle_teams(
+                schedule, self.team_names, rng
+            ),
         }
 
     def _parse_to_randomize(
@@ -41,7 +47,11 @@ class RandomizeSchedule:
 
         return sorted(set(to_randomize))
 
-    def randomize(self, to_randomize: Option | Iterable[Option] | None) -> list[Round]:
+    def randomize(
+        self,
+        to_randomize: Option | Iterable[Option] | None,
+        rng: np.random.Generator | None = None,
+    ) -> list[Round]:
 
         """
         Randomize self.schedule.
@@ -69,6 +79,11 @@ class RandomizeSchedule:
                     "all":
                         Equivalent to ["teams", "home_away", "matches", "rounds"]
 
+            rng: np.random.Generator | None = None
+                Random number generator used by all randomizations.
+
+                If None, a new one is seeded from python's random module.
+
         ----
             list[
                 tuple[  # Round
@@ -82,11 +97,12 @@ class RandomizeSchedule:
         functions = [self._name_to_randomize_func[option] for option in to_randomize]
 
         schedule = self.schedule
+        rng = default_rng(rng)
 
         if not functions:
             schedule = schedule.copy()
 
         for randomize_function in functions:
-            schedule = randomize_function(schedule)
+            schedule = randomize_function(schedule, rng)
 
         return schedule
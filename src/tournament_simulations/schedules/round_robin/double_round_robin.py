@@ -3,6 +3,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Callable, Iterable, Iterator, Literal
 
+import numpy as np
+
+from tournament_simulations.utils.seeds import default_rng
+
 from ..randomize import Option, RandomizeSchedule
 from ..utils.flip_home_away import flip_home_away_in_schedule
 from ..utils.reversed_schedule import reverse_schedule
@@ -144,6 +148,7 @@ class DoubleRoundRobin:
         num_schedules: int,
         to_randomize_first: ToRandomizeType = "all",
         to_randomize_second: ToRandomizeType | Literal["flipped", "mirrored", "reversed"] = "flipped",
+        rng: np.random.Generator | None = None,
     ) -> Iterator[Round]:
 
         """
@@ -187,6 +192,11 @@ class DoubleRoundRobin:
                     "reversed":
                         The second portion will be the same as the first one, but reversed.
 
+            rng: np.random.Generator | None = None
+                Random number generator used by all randomizations.
+
+                If None, a new one is seeded from python's random module.
+
         ----
         Returns:
             Iterator[Round]
@@ -214,10 +224,11 @@ class DoubleRoundRobin:
         """
         rand_first_schedule = RandomizeSchedule(self.first_schedule, self.team_names)
         rand_second_schedule = RandomizeSchedule(self.second_schedule, self.team_names)
+        rng = default_rng(rng)
 
         for _ in range(num_schedules):
 
-            first_schedule = rand_first_schedule.randomize(to_randomize_first)
+            first_schedule = rand_first_schedule.randomize(to_randomize_first, rng)
             yield from first_schedule
 
             match to_randomize_second:
@@ -226,4 +237,4 @@ class DoubleRoundRobin:
                 case "reversed":
                     yield from reverse_schedule(first_schedule)
                 case _:
-                    yield from rand_second_schedule.randomize(to_randomize_second)
+                    yield from rand_second_schedule.randomize(to_randomize_second, rng)
@@ -3,6 +3,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Callable, Iterable, Iterator
 
+import numpy as np
+
+from tournament_simulations.utils.seeds import default_rng
+
 from ..randomize import Option, RandomizeSchedule
 from ..utils.scheduling_types import Round, Team
 from . import create_single_round_robin as create
@@ -126,7 +130,10 @@ class SingleRoundRobin:
         return cls(**parameters)
 
     def get_full_schedule(
-        self, num_schedules: int, to_randomize: Option | Iterable[Option] | None = "all"
+        self,
+        num_schedules: int,
+        to_randomize: Option | Iterable[Option] | None = "all",
+        rng: np.random.Generator | None = None,
     ) -> Iterator[Round]:
 
         """
@@ -155,6 +162,11 @@ class SingleRoundRobin:
                         Randomizes order of rounds in the schedule.
                     "all":
                         Equivalent to ["teams", "home_away", "matches", "rounds"]
+
+            rng: np.random.Generator | None = None
+                Random number generator used by all randomizations.
+
+                If None, a new one is seeded from python's random module.
         ----
         Returns:
             Iterator[Round]
@@ -181,6 +193,7 @@ class SingleRoundRobin:
             as were the 2nd's.
         """
         rand_schedule = RandomizeSchedule(self.schedule, self.team_names)
+        rng = default_rng(rng)
 
         for _ in range(num_schedules):
-            yield from rand_schedule.randomize(to_randomize)
+            yield from rand_schedule.randomize(to_randomize, rng)
@@ -33,5 +33,21 @@
 
 from .simulate_matches import SimulateMatches
 from .simulate_points_per_match import SimulatePointsPerMatch
-
-__all__ = ["SimulateMatches", "SimulatePointsPerMatch"]
+from .utils.accumulators import MeanVariance, P2Quantiles, RankHistogram
+from .utils.batch_simulations import concat_batches, iter_batches, reduce_batches
+from .utils.npy_sink import NpySimulations, npy_sink
+from .utils.result_codes import ResultCodes
+
+__all__ = [
+    "MeanVariance",
+    "NpySimulations",
+    "P2Quantiles",
+    "RankHistogram",
+    "ResultCodes",
+    "SimulateMatches",
+    "SimulatePointsPerMatch",
+    "concat_batches",
+    "iter_batches",
+    "npy_sink",
+    "reduce_batches",
+]
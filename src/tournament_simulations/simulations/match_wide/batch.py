@@ -1,10 +1,16 @@
-from typing import Callable
+from typing import Any, Callable, Iterator
 
 import pandas as pd
 
 from tournament_simulations.logs import log, tournament_simulations_logger
+from tournament_simulations.utils.seeds import Seed
 
-from ..utils.batch_simulations import batch_simulate_tournaments_template
+from ..utils.batch_simulations import (
+    ExecutorType,
+    batch_simulate_tournaments_template,
+    concat_batches,
+    identity,
+)
 from .simulate import (
     simulate_points_per_match__match_wide,
     simulate_winners__match_wide,
@@ -16,7 +22,12 @@ def batch_simulate_winners(
     match_to_probabilities: pd.Series,
     simulation_index: pd.Index | pd.MultiIndex,
     num_iteration_simulation: tuple[int, int],
-    func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame] = lambda x: x,
+    func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame] = identity,
+    compact: bool = False,
+    executor: ExecutorType = "serial",
+    max_workers: int | None = None,
+    seed: Seed = None,
+    batch_consumer: Callable[[Iterator[pd.DataFrame]], Any] = concat_batches,
 ) -> pd.DataFrame:
 
     """
@@ -51,13 +62,22 @@ def batch_simulate_winners(
             This helps avoid using too much memory.
 
         func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame]
-            By default, does nothing -> lambda x: x.
+            By default, does nothing -> identity.
 
             Function to be applied after simulating data.
                 Input Index -> simulation_index'
                 i-th column -> winners for i-th simulation
                         Note: i-th simulation (column) is named f"s{i}"
 
+        compact: bool = False
+            If True, winners are stored as integer codes (usually np.int8).
+
+            Codes can be converted back into winners with
+            ResultCodes.from_probabilities(probabilities).to_labels(simulations).
+
+        executor, max_workers, seed, batch_consumer
+            Same as batch_simulate_tournaments_template's.
+
     -----
     Returns:
         pd.DataFrame
@@ -67,6 +87,7 @@ def batch_simulate_winners(
                         Note: i-th simulation (column) is named f"s{i}"
 
             If func_after_simulation is not default, then it will be different.
+            If batch_consumer is not default, whatever it returns.
     """
 
     num_iterations, num_simulation_per_iteration = num_iteration_simulation
@@ -75,10 +96,15 @@ def batch_simulate_winners(
         simulate_winners__match_wide,
         num_iterations,
         func_after_simulation,
+        executor=executor,
+        max_workers=max_workers,
+        seed=seed,
+        batch_consumer=batch_consumer,
         # simulate_winners__match_wide parameters
         num_simulations=num_simulation_per_iteration,
         id_to_probabilities=match_to_probabilities,
         simulation_index=simulation_index,
+        compact=compact,
     )
 
 
@@ -87,7 +113,11 @@ def batch_simulate_points_per_match(
     match_to_probabilities: pd.Series,
     simulation_index: pd.Index | pd.MultiIndex,
     num_iteration_simulation: tuple[int, int],
-    func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame] = lambda x: x,
+    func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame] = identity,
+    executor: ExecutorType = "serial",
+    max_workers: int | None = None,
+    seed: Seed = None,
+    batch_consumer: Callable[[Iterator[pd.DataFrame]], Any] = concat_batches,
 ) -> pd.DataFrame:
 
     """
@@ -122,13 +152,16 @@ def batch_simulate_points_per_match(
             This helps avoid using too much memory.
 
         func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame]
-            By default, does nothing -> lambda x: x.
+            By default, does nothing -> identity.
 
             Function to be applied after simulating data.
                 Input Index -> 'simulation_index'
                 i-th column -> points each team gained for matches in i-th simulation
                     Note: i-th simulation (column) is named f"s{i}"
 
+        executor, max_workers, seed, batch_consumer
+            Same as batch_simulate_tournaments_template's.
+
     -----
     Returns:
         pd.DataFrame
@@ -138,6 +171,7 @@ def batch_simulate_points_per_match(
                         Note: i-th simulation (column) is named f"s{i}"
 
             If func_after_simulation is not default, then it will be different.
+            If batch_consumer is not default, whatever it returns.
     """
     num_iterations, num_simulation_per_iteration = num_iteration_simulation
 
@@ -145,6 +179,10 @@ def batch_simulate_points_per_match(
         simulate_points_per_match__match_wide,
         num_iterations,
         func_after_simulation,
+        executor=executor,
+        max_workers=max_workers,
+        seed=seed,
+        batch_consumer=batch_consumer,
         # simulate_points_per_match__match_wide parameters
         num_simulations=num_simulation_per_iteration,
         id_to_probabilities=match_to_probabilities,
@@ -2,26 +2,37 @@
 Simulations match-wide, that is, each matchhas its own probability:
 [prob home win, prob draw, prob away win].
 """
+import functools
 from typing import Callable
 
 import numpy as np
 import pandas as pd
 
-from tournament_simulations.data_structures.utils import types
+from ..utils.batch_simulations import accepted_kwargs
+from ..utils.simulate_functions import (
+    simulate_points_per_match_per_id,
+    simulate_winners_per_id,
+)
 
-from ..utils.simulate_functions import simulate_points_per_match, simulate_winners
+SimulateFunc = Callable[..., np.ndarray]
 
 
 def _simulate_match_wide_template(
-    apply_func: Callable[[types.Probability, int], np.ndarray],
+    simulate_func: SimulateFunc,
     num_simulations: int,
     id_to_probabilities: pd.Series,
     simulation_index: pd.Index | pd.MultiIndex,
+    rng: np.random.Generator | None = None,
+    out: np.ndarray | None = None,
 ) -> pd.DataFrame:
 
-    simulations = id_to_probabilities.apply(apply_func, num_simulations=num_simulations)
+    optional = accepted_kwargs(simulate_func, rng=rng, out=out)
+    data_for_df = simulate_func(id_to_probabilities, num_simulations, **optional)
+
+    # functions without 'out' return their results, which are copied into it
+    if out is not None and "out" not in optional:
+        out[...] = data_for_df
 
-    data_for_df = np.vstack(simulations)
     return pd.DataFrame(data_for_df, index=simulation_index)
 
 
@@ -29,21 +40,18 @@ def simulate_winners__match_wide(
     num_simulations: int,
     id_to_probabilities: pd.Series,
     simulation_index: pd.Index | pd.MultiIndex,
+    compact: bool = False,
+    rng: np.random.Generator | None = None,
+    out: np.ndarray | None = None,
 ) -> pd.DataFrame:
 
-    # apply function
-    def _simulate_winners_one_match_one_id(
-        probabilities: types.ResultProbability,
-        num_simulations: int,
-    ) -> np.ndarray:
-
-        return simulate_winners(probabilities, num_simulations, num_matches=1)
-
     return _simulate_match_wide_template(
-        apply_func=_simulate_winners_one_match_one_id,
+        simulate_func=functools.partial(simulate_winners_per_id, compact=compact),
         num_simulations=num_simulations,
         id_to_probabilities=id_to_probabilities,
         simulation_index=simulation_index,
+        rng=rng,
+        out=out,
     )
 
 
@@ -51,19 +59,15 @@ def simulate_points_per_match__match_wide(
     num_simulations: int,
     id_to_probabilities: pd.Series,
     simulation_index: pd.Index | pd.MultiIndex,
+    rng: np.random.Generator | None = None,
+    out: np.ndarray | None = None,
 ) -> pd.DataFrame:
 
-    # apply function
-    def _simulate_points_per_match_one_match_one_id(
-        probabilities: types.PontuationProbability,
-        num_simulations: int,
-    ) -> np.ndarray:
-
-        return simulate_points_per_match(probabilities, num_simulations, num_matches=1)
-
     return _simulate_match_wide_template(
-        apply_func=_simulate_points_per_match_one_match_one_id,
+        simulate_func=simulate_points_per_match_per_id,
         num_simulations=num_simulations,
         id_to_probabilities=id_to_probabilities,
         simulation_index=simulation_index,
+        rng=rng,
+        out=out,
     )
@@ -1,12 +1,15 @@
 from dataclasses import dataclass
-from typing import Callable
+from typing import Any, Callable, Iterator
 
 import pandas as pd
 
 from tournament_simulations.data_structures.matches import Matches
+from tournament_simulations.utils.seeds import Seed
 
 from . import match_wide as mw
 from . import tournament_wide as tw
+from .utils.batch_simulations import ExecutorType, concat_batches, identity
+from .utils.result_codes import ResultCodes
 
 
 @dataclass
@@ -24,8 +27,13 @@ class SimulateMatches:
     def tournament_wide(
         self,
         num_iteration_simulation: tuple[int, int],
-        id_to_probabilities: pd.Series | None = None,
-        func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame] = lambda x: x,
+        id_to_probabilities: pd.Series | pd.DataFrame | None = None,
+        func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame] = identity,
+        compact: bool = False,
+        executor: ExecutorType = "serial",
+        max_workers: int | None = None,
+        seed: Seed = None,
+        batch_consumer: Callable[[Iterator[pd.DataFrame]], Any] = concat_batches,
     ) -> pd.DataFrame:
 
         """
@@ -44,7 +52,7 @@ class SimulateMatches:
                 This helps avoid using too much memory.
 
             func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame]
-                By default, does nothing -> lambda x: x.
+                By default, does nothing -> identity.
 
                 Function to be applied after simulating data.
                     Input Index:
@@ -54,17 +62,52 @@ class SimulateMatches:
                         f"s{i}" -> winners for i-th simulation
                             Note: i-th simulation (column) is named f"s{i}"
 
-            id_to_probabilities: pd.Series | None = None
+            id_to_probabilities: pd.Series | pd.DataFrame | None = None
                 Series mapping each tournament id to the desired probabilities.
 
                 Probabilities are a Mapping:
                     keys: possible results (str)
                     values: probability for each possible result (float)
 
+                It can also be a probability matrix (pd.DataFrame) with one
+                column per result, such as Matches.probability_matrix_per_id.
+
                 If not provided, probabilities will be taken from self.matches.
                     For each tournament the number of home-team wins, draws and
                     away-team wins will be counted to estimate it.
 
+            compact: bool = False
+                If True, winners are stored as integer codes (usually np.int8),
+                which uses a fraction of the memory.
+
+                See self.result_codes to convert them back into winners.
+
+            executor: Literal["serial", "thread", "process"] = "serial"
+                How batches are run: one after the other, in a pool of threads
+                or in a pool of processes. Results do not depend on it.
+
+                "process" requires 'func_after_simulation' to be picklable.
+
+            max_workers: int | None = None
+                Maximum number of threads or processes.
+                If None, concurrent.futures default is used.
+
+            seed: int | np.random.SeedSequence | np.random.Generator | None = None
+                Seed for the simulations. Each batch uses its own random stream
+                spawned from it, so results are reproducible for any executor.
+
+                If None, it is drawn from numpy's global random state.
+                If it is a np.random.Generator, the seed is drawn from it.
+
+            batch_consumer: Callable[[Iterator[pd.DataFrame]], Any] = concat_batches
+                Receives an iterator over all batches (after 'func_after_simulation')
+                and returns the final result.
+
+                By default, batches are concatenated into a single dataframe.
+                Use iter to get batches lazily, reduce_batches to fold them into an
+                accumulator or npy_sink to write them to disk, so memory does not grow
+                with the number of iterations.
+
         -----
         Returns:
             pd.DataFrame
@@ -77,10 +120,11 @@ class SimulateMatches:
                             Note: i-th simulation (column) is named f"s{i}"
 
                 If func_after_simulation is not default, then it will be different.
+                If batch_consumer is not default, whatever it returns.
 
         """
         if id_to_probabilities is None:
-            id_to_probabilities = self.matches.probabilities_per_id()
+            id_to_probabilities = self.matches.probability_matrix_per_id()
 
         index = self.matches.df.set_index(["home", "away"], append=True).index
 
@@ -90,13 +134,23 @@ class SimulateMatches:
             simulation_index=index,
             num_iteration_simulation=num_iteration_simulation,
             func_after_simulation=func_after_simulation,
+            compact=compact,
+            executor=executor,
+            max_workers=max_workers,
+            seed=seed,
+            batch_consumer=batch_consumer,
         )
 
     def match_wide(
         self,
         num_iteration_simulation: tuple[int, int],
         match_to_probabilities: pd.Series,
-        func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame] = lambda x: x,
+        func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame] = identity,
+        compact: bool = False,
+        executor: ExecutorType = "serial",
+        max_workers: int | None = None,
+        seed: Seed = None,
+        batch_consumer: Callable[[Iterator[pd.DataFrame]], Any] = concat_batches,
     ) -> pd.DataFrame:
 
         """
@@ -121,7 +175,7 @@ class SimulateMatches:
                 This helps avoid using too much memory.
 
             func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame]
-                By default, does nothing -> lambda x: x.
+                By default, does nothing -> identity.
 
                 Function to be applied after simulating data.
                     Input Index:
@@ -131,6 +185,38 @@ class SimulateMatches:
                         f"s{i}" -> winners for i-th simulation
                             Note: i-th simulation (column) is named f"s{i}"
 
+            compact: bool = False
+                If True, winners are stored as integer codes (usually np.int8),
+                which uses a fraction of the memory.
+
+                See self.result_codes to convert them back into winners.
+
+            executor: Literal["serial", "thread", "process"] = "serial"
+                How batches are run: one after the other, in a pool of threads
+                or in a pool of processes. Results do not depend on it.
+
+                "process" requires 'func_after_simulation' to be picklable.
+
+            max_workers: int | None = None
+                Maximum number of threads or processes.
+                If None, concurrent.futures default is used.
+
+            seed: int | np.random.SeedSequence | np.random.Generator | None = None
+                Seed for the simulations. Each batch uses its own random stream
+                spawned from it, so results are reproducible for any executor.
+
+                If None, it is drawn from numpy's global random state.
+                If it is a np.random.Generator, the seed is drawn from it.
+
+            batch_consumer: Callable[[Iterator[pd.DataFrame]], Any] = concat_batches
+                Receives an iterator over all batches (after 'func_after_simulation')
+                and returns the final result.
+
+                By default, batches are concatenated into a single dataframe.
+                Use iter to get batches lazily, reduce_batches to fold them into an
+                accumulator or npy_sink to write them to disk, so memory does not grow
+                with the number of iterations.
+
         -----
         Returns:
             pd.DataFrame
@@ -143,6 +229,7 @@ class SimulateMatches:
                             Note: i-th simulation (column) is named f"s{i}"
 
                 If func_after_simulation is not default, then it will be different.
+                If batch_consumer is not default, whatever it returns.
 
         """
         index = self.matches.df.set_index(["home", "away"], append=True).index
@@ -152,4 +239,36 @@ class SimulateMatches:
             simulation_index=index,
             num_iteration_simulation=num_iteration_simulation,
             func_after_simulation=func_after_simulation,
+            compact=compact,
+            executor=executor,
+            max_workers=max_workers,
+            seed=seed,
+            batch_consumer=batch_consumer,
         )
+
+    def result_codes(
+        self, id_to_probabilities: pd.Series | pd.DataFrame | None = None
+    ) -> ResultCodes:
+
+        """
+        Lookup table between winners and the integer codes used by
+        compact simulations (compact=True).
+
+        ----
+        Parameters:
+
+            id_to_probabilities: pd.Series | pd.DataFrame | None = None
+                Same probabilities used for the simulation (either
+                id_to_probabilities or match_to_probabilities).
+
+                If not provided, probabilities will be taken from self.matches.
+
+        -----
+        Returns:
+            ResultCodes
+                Use .to_labels(simulations) to convert codes back into winners.
+        """
+        if id_to_probabilities is None:
+            id_to_probabilities = self.matches.probability_matrix_per_id()
+
+        return ResultCodes.from_probabilities(id_to_probabilities)
@@ -1,12 +1,14 @@
 from dataclasses import dataclass
-from typing import Callable
+from typing import Any, Callable, Iterator
 
 import pandas as pd
 
 from tournament_simulations.data_structures.points_per_match import PointsPerMatch
+from tournament_simulations.utils.seeds import Seed
 
 from . import match_wide as mw
 from . import tournament_wide as tw
+from .utils.batch_simulations import ExecutorType, concat_batches, identity
 
 
 @dataclass
@@ -25,7 +27,11 @@ class SimulatePointsPerMatch:
         self,
         num_iteration_simulation: tuple[int, int],
         id_to_probabilities: pd.Series | None = None,
-        func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame] = lambda x: x,
+        func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame] = identity,
+        executor: ExecutorType = "serial",
+        max_workers: int | None = None,
+        seed: Seed = None,
+        batch_consumer: Callable[[Iterator[pd.DataFrame]], Any] = concat_batches,
     ) -> pd.DataFrame:
 
         """
@@ -44,7 +50,7 @@ class SimulatePointsPerMatch:
                 This helps avoid using too much memory.
 
             func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame]
-                By default, does nothing -> lambda x: x.
+                By default, does nothing -> identity.
 
                 Function to be applied after simulating data.
                     Input Index:
@@ -65,6 +71,35 @@ class SimulatePointsPerMatch:
                     For each tournament the number of home-team wins, draws and
                     away-team wins will be counted to estimate it.
 
+            executor: Literal["serial", "thread", "process"] = "serial"
+                How batches are run: one after the other, in a pool of threads
+                or in a pool of processes. Results do not depend on it.
+
+                "process" requires 'func_after_simulation' to be picklable.
+
+            max_workers: int | None = None
+                Maximum number of threads or processes.
+                If None, concurrent.futures default is used.
+
+            seed: int | np.random.SeedSequence | np.random.Generator | None = None
+                Seed for the simulations. Each batch uses its own random stream
+                spawned from it, so results are reproducible for any executor.
+
+                If None, it is drawn from numpy's global random state.
+                If it is a np.random.Generator, the seed is drawn from it.
+
+            batch_consumer: Callable[[Iterator[pd.DataFrame]], Any] = concat_batches
+                Receives an iterator over all batches (after 'func_after_simulation')
+                and returns the final result.
+
+                By default, batches are concatenated into a single dataframe.
+                Use iter to get batches lazily, reduce_batches to fold them into an
+                accumulator or npy_sink to write them to disk, so memory does not grow
+                with the number of iterations.
+
+                Accumulators (MeanVariance, RankHistogram, P2Quantiles) compute
+                summary statistics per line without keeping the simulations.
+
         -----
         Returns:
             pd.DataFrame
@@ -77,6 +112,7 @@ class SimulatePointsPerMatch:
                             Note: i-th simulation (column) is named f"s{i}"
 
                 If func_after_simulation is not default, then it will be different.
+                If batch_consumer is not default, whatever it returns.
 
         """
         if id_to_probabilities is None:
@@ -88,13 +124,21 @@ class SimulatePointsPerMatch:
             simulation_index=self.ppm.df.set_index("team", append=True).index,
             num_iteration_simulation=num_iteration_simulation,
             func_after_simulation=func_after_simulation,
+            executor=executor,
+            max_workers=max_workers,
+            seed=seed,
+            batch_consumer=batch_consumer,
         )
 
     def match_wide(
         self,
         num_iteration_simulation: tuple[int, int],
         match_to_probabilities: pd.Series,
-        func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame] = lambda x: x,
+        func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame] = identity,
+        executor: ExecutorType = "serial",
+        max_workers: int | None = None,
+        seed: Seed = None,
+        batch_consumer: Callable[[Iterator[pd.DataFrame]], Any] = concat_batches,
     ) -> pd.DataFrame:
 
         """
@@ -118,7 +162,7 @@ class SimulatePointsPerMatch:
                 This helps avoid using too much memory.
 
             func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame]
-                By default, does nothing -> lambda x: x.
+                By default, does nothing -> identity.
 
                 Function to be applied after simulating data.
                     Input Index:
@@ -128,6 +172,35 @@ class SimulatePointsPerMatch:
                         i-th column -> winners for i-th simulation
                             Note: i-th simulation (column) is named f"s{i}"
 
+            executor: Literal["serial", "thread", "process"] = "serial"
+                How batches are run: one after the other, in a pool of threads
+                or in a pool of processes. Results do not depend on it.
+
+                "process" requires 'func_after_simulation' to be picklable.
+
+            max_workers: int | None = None
+                Maximum number of threads or processes.
+                If None, concurrent.futures default is used.
+
+            seed: int | np.random.SeedSequence | np.random.Generator | None = None
+                Seed for the simulations. Each batch uses its own random stream
+                spawned from it, so results are reproducible for any executor.
+
+                If None, it is drawn from numpy's global random state.
+                If it is a np.random.Generator, the seed is drawn from it.
+
+            batch_consumer: Callable[[Iterator[pd.DataFrame]], Any] = concat_batches
+                Receives an iterator over all batches (after 'func_after_simulation')
+                and returns the final result.
+
+                By default, batches are concatenated into a single dataframe.
+                Use iter to get batches lazily, reduce_batches to fold them into an
+                accumulator or npy_sink to write them to disk, so memory does not grow
+                with the number of iterations.
+
+                Accumulators (MeanVariance, RankHistogram, P2Quantiles) compute
+                summary statistics per line without keeping the simulations.
+
         -----
         Returns:
             pd.DataFrame
@@ -140,6 +213,7 @@ class SimulatePointsPerMatch:
                             Note: i-th simulation (column) is named f"s{i}"
 
                 If func_after_simulation is not default, then it will be different.
+                If batch_consumer is not default, whatever it returns.
         """
 
         return mw.batch_simulate_points_per_match(
@@ -147,4 +221,115 @@ class SimulatePointsPerMatch:
             simulation_index=self.ppm.df.set_index("team", append=True).index,
             num_iteration_simulation=num_iteration_simulation,
             func_after_simulation=func_after_simulation,
+            executor=executor,
+            max_workers=max_workers,
+            seed=seed,
+            batch_consumer=batch_consumer,
+        )
+
+    def simulate_rankings(
+        self,
+        num_iteration_simulation: tuple[int, int],
+        id_to_probabilities: pd.Series | None = None,
+        func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame] = identity,
+        executor: ExecutorType = "serial",
+        max_workers: int | None = None,
+        seed: Seed = None,
+        batch_consumer: Callable[[Iterator[pd.DataFrame]], Any] = concat_batches,
+    ) -> pd.DataFrame:
+
+        """
+        Simulates tournament rankings tournament-wide, that is, each tournament
+        has a single probability: [prob home win, prob draw, prob away win].
+
+        Equivalent to summing the points of self.tournament_wide for each team,
+        but points per match are never stored: each batch only has one line
+        per (id, team) pair.
+
+        ----
+        Parameters:
+
+            num_iteration_simulation: tuple[int, int]
+                Respectively, number of iterations and number of
+                simulations per iteration (batch size).
+
+                This helps avoid using too much memory.
+
+            id_to_probabilities: pd.Series | None = None
+                Series mapping each tournament id to the desired probabilities.
+
+                Probabilities are a Mapping:
+                    keys: (points gained by home team, points gained by away team)
+                    values: probability for each possible result (float)
+
+                If not provided, probabilities will be taken from self.ppm.
+
+            func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame]
+                By default, does nothing -> identity.
+
+                Function to be applied after simulating data.
+                    Input Index:
+                        self.ppm.rankings.index -> ["id", "team"]
+                    Input Column:
+                        i-th column -> total points teams gained in i-th simulation
+                            Note: i-th simulation (column) is named f"s{i}"
+
+            executor: Literal["serial", "thread", "process"] = "serial"
+                How batches are run: one after the other, in a pool of threads
+                or in a pool of processes. Results do not depend on it.
+
+                "process" requires 'func_after_simulation' to be picklable.
+
+            max_workers: int | None = None
+                Maximum number of threads or processes.
+                If None, concurrent.futures default is used.
+
+            seed: int | np.random.SeedSequence | np.random.Generator | None = None
+                Seed for the simulations. Each batch uses its own random stream
+                spawned from it, so results are reproducible for any executor.
+
+                If None, it is drawn from numpy's global random state.
+                If it is a np.random.Generator, the seed is drawn from it.
+
+            batch_consumer: Callable[[Iterator[pd.DataFrame]], Any] = concat_batches
+                Receives an iterator over all batches (after 'func_after_simulation')
+                and returns the final result.
+
+                By default, batches are concatenated into a single dataframe.
+                Use iter to get batches lazily, reduce_batches to fold them into an
+                accumulator or npy_sink to write them to disk, so memory does not grow
+                with the number of iterations.
+
+                Accumulators (MeanVariance, RankHistogram, P2Quantiles) compute
+                summary statistics per line without keeping the simulations.
+
+        -----
+        Returns:
+            pd.DataFrame
+                By default, total points teams gained for all simulations.
+                    Index:
+                        self.ppm.rankings.index -> ["id", "team"]
+                    Columns:
+                        f"s{i}" -> total points teams gained in i-th simulation
+                            Note: i-th simulation (column) is named f"s{i}"
+
+                If func_after_simulation is not default, then it will be different.
+                If batch_consumer is not default, whatever it returns.
+        """
+        if id_to_probabilities is None:
+            id_to_probabilities = self.ppm.probabilities_per_id()
+
+        id_team = self.ppm.df.groupby(["id", "team"], observed=True)
+
+        return tw.batch_simulate_rankings(
+            id_to_probabilities=id_to_probabilities,
+            id_to_num_matches=self.ppm.number_of_matches_per_id,
+            team_codes=id_team.ngroup().to_numpy(),
+            rankings_index=id_team.size().index,
+            num_iteration_simulation=num_iteration_simulation,
+            func_after_simulation=func_after_simulation,
+            executor=executor,
+            max_workers=max_workers,
+            seed=seed,
+            batch_consumer=batch_consumer,
         )
@@ -4,6 +4,14 @@ Simulations tournament-wide, that is, each tournament has its own probability:
 will have the same probability
 """
 
-from .batch import batch_simulate_points_per_match, batch_simulate_winners
+from .batch import (
+    batch_simulate_points_per_match,
+    batch_simulate_rankings,
+    batch_simulate_winners,
+)
 
-__all__ = ["batch_simulate_points_per_match", "batch_simulate_winners"]
+__all__ = [
+    "batch_simulate_points_per_match",
+    "batch_simulate_rankings",
+    "batch_simulate_winners",
+]
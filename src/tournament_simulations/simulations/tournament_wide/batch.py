@@ -1,23 +1,36 @@
-from typing import Callable
+from typing import Any, Callable, Iterator
 
+import numpy as np
 import pandas as pd
 
 from tournament_simulations.logs import log, tournament_simulations_logger
+from tournament_simulations.utils.seeds import Seed
 
-from ..utils.batch_simulations import batch_simulate_tournaments_template
+from ..utils.batch_simulations import (
+    ExecutorType,
+    batch_simulate_tournaments_template,
+    concat_batches,
+    identity,
+)
 from .simulate import (
     simulate_points_per_match__tournament_wide,
+    simulate_rankings__tournament_wide,
     simulate_winners__tournament_wide,
 )
 
 
 @log(tournament_simulations_logger.info)
 def batch_simulate_winners(
-    id_to_probabilities: pd.Series,
+    id_to_probabilities: pd.Series | pd.DataFrame,
     id_to_num_matches: pd.Series,
     simulation_index: pd.Index | pd.MultiIndex,
     num_iteration_simulation: tuple[int, int],
-    func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame] = lambda x: x,
+    func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame] = identity,
+    compact: bool = False,
+    executor: ExecutorType = "serial",
+    max_workers: int | None = None,
+    seed: Seed = None,
+    batch_consumer: Callable[[Iterator[pd.DataFrame]], Any] = concat_batches,
 ) -> pd.DataFrame:
 
     """
@@ -39,6 +52,9 @@ def batch_simulate_winners(
                     keys: possible results (str)
                     values: probability for each possible result (float)
 
+            It can also be a probability matrix (pd.DataFrame) with one
+            column per result, such as Matches.probability_matrix_per_id.
+
         id_to_num_matches: pd.Series["id", int]
             Mapping from each tournament 'id' to its total number of matches.
             Index should be in the same order as simulation_index.
@@ -56,13 +72,22 @@ def batch_simulate_winners(
             This helps avoid using too much memory.
 
         func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame]
-            By default, does nothing -> lambda x: x.
+            By default, does nothing -> identity.
 
             Function to be applied after simulating data.
                 Input Index -> simulation_index'
                 i-th column -> winners for i-th simulation
                         Note: i-th simulation (column) is named f"s{i}"
 
+        compact: bool = False
+            If True, winners are stored as integer codes (usually np.int8).
+
+            Codes can be converted back into winners with
+            ResultCodes.from_probabilities(probabilities).to_labels(simulations).
+
+        executor, max_workers, seed, batch_consumer
+            Same as batch_simulate_tournaments_template's.
+
     -----
     Returns:
         pd.DataFrame
@@ -72,6 +97,7 @@ def batch_simulate_winners(
                         Note: i-th simulation (column) is named f"s{i}"
 
             If func_after_simulation is not default, then it will be different.
+            If batch_consumer is not default, whatever it returns.
 
     """
 
@@ -81,21 +107,30 @@ def batch_simulate_winners(
         simulate_winners__tournament_wide,
         num_iterations,
         func_after_simulation,
+        executor=executor,
+        max_workers=max_workers,
+        seed=seed,
+        batch_consumer=batch_consumer,
         # simulate_winners__tournament_wide parameters
         num_simulations=num_simulation_per_iteration,
         id_to_probabilities=id_to_probabilities,
         id_to_num_matches=id_to_num_matches,
         simulation_index=simulation_index,
+        compact=compact,
     )
 
 
 @log(tournament_simulations_logger.info)
 def batch_simulate_points_per_match(
-    id_to_probabilities: pd.Series,
+    id_to_probabilities: pd.Series | pd.DataFrame,
     id_to_num_matches: pd.Series,
     simulation_index: pd.Index | pd.MultiIndex,
     num_iteration_simulation: tuple[int, int],
-    func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame] = lambda x: x,
+    func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame] = identity,
+    executor: ExecutorType = "serial",
+    max_workers: int | None = None,
+    seed: Seed = None,
+    batch_consumer: Callable[[Iterator[pd.DataFrame]], Any] = concat_batches,
 ) -> pd.DataFrame:
 
     """
@@ -117,6 +152,9 @@ def batch_simulate_points_per_match(
                     keys: possible results (str)
                     values: probability for each possible result (float)
 
+            It can also be a probability matrix (pd.DataFrame) with one
+            column per result, such as Matches.probability_matrix_per_id.
+
         id_to_num_matches: pd.Series["id", int]
             Mapping from each tournament 'id' to its total number of matches.
             Index should be in the same order as simulation_index.
@@ -134,12 +172,16 @@ def batch_simulate_points_per_match(
             This helps avoid using too much memory.
 
         func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame]
-            By default, does nothing -> lambda x: x.
+            By default, does nothing -> identity.
 
             Function to be applied after simulating data.
                 Input Index -> 'simulation_index'
                 i-th column -> points each team gained for matches in i-th simulation
                     Note: i-th simulation (column) is named f"s{i}"
+
+        executor, max_workers, seed, batch_consumer
+            Same as batch_simulate_tournaments_template's.
+
     -----
     Returns:
         pd.DataFrame
@@ -149,6 +191,7 @@ def batch_simulate_points_per_match(
                         Note: i-th simulation (column) is named f"s{i}"
 
             If func_after_simulation is not default, then it will be different.
+            If batch_consumer is not default, whatever it returns.
 
     """
 
@@ -158,9 +201,116 @@ def batch_simulate_points_per_match(
         simulate_points_per_match__tournament_wide,
         num_iterations,
         func_after_simulation,
+        executor=executor,
+        max_workers=max_workers,
+        seed=seed,
+        batch_consumer=batch_consumer,
         # simulate_points_per_match__tournament_wide parameters
         num_simulations=num_simulation_per_iteration,
         id_to_probabilities=id_to_probabilities,
         id_to_num_matches=id_to_num_matches,
         simulation_index=simulation_index,
     )
+
+
+@log(tournament_simulations_logger.info)
+def batch_simulate_rankings(
+    id_to_probabilities: pd.Series | pd.DataFrame,
+    id_to_num_matches: pd.Series,
+    team_codes: np.ndarray,
+    rankings_index: pd.Index | pd.MultiIndex,
+    num_iteration_simulation: tuple[int, int],
+    func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame] = identity,
+    executor: ExecutorType = "serial",
+    max_workers: int | None = None,
+    seed: Seed = None,
+    batch_consumer: Callable[[Iterator[pd.DataFrame]], Any] = concat_batches,
+) -> pd.DataFrame:
+
+    """
+    Simulates total points each team gained in all matches.
+
+    All matches for a tournament will have the same probabilities.
+
+    Points per match are never stored, so each batch only has
+    one line per team.
+
+    Simulations are split into 'num_simulations[0]' batches with
+    'num_simulations[1]' simulations each.
+
+    -----
+    Parameters:
+
+        id_to_probabilities: pd.Series["id", Probabilities]]
+            Mapping from each tournament 'id' to the desired probabilities.
+            Index should be in the same order as team_codes.
+
+                Probabilities are a Mapping:
+                    keys: (points gained by home team, points gained by away team)
+                    values: probability for each possible result (float)
+
+            It can also be a probability matrix (pd.DataFrame) with one
+            column per result, such as Matches.probability_matrix_per_id.
+
+        id_to_num_matches: pd.Series["id", int]
+            Mapping from each tournament 'id' to its total number of matches.
+            Index should be in the same order as team_codes.
+
+        team_codes: np.ndarray -> Shape = [2 * total number of matches]
+            Integer code of the team in each (team, match) pair, that is,
+            i-th code is the position of that team in 'rankings_index'.
+
+            Even-numbered positions are home teams; odd-numbered ones are away teams.
+
+        rankings_index: pd.Index | pd.MultiIndex
+            Simulated dataframe will have its index set to this.
+
+            It should have one line per team code.
+
+        num_iteration_simulation: tuple[int, int]
+            Respectively, number of iterations and number of
+            simulations per iteration (batch size).
+
+            This helps avoid using too much memory.
+
+        func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame]
+            By default, does nothing -> identity.
+
+            Function to be applied after simulating data.
+                Input Index -> 'rankings_index'
+                i-th column -> total points each team gained in i-th simulation
+                    Note: i-th simulation (column) is named f"s{i}"
+
+        executor, max_workers, seed, batch_consumer
+            Same as batch_simulate_tournaments_template's.
+
+    -----
+    Returns:
+        pd.DataFrame
+             By default, total points teams gained for all simulations.
+                Index -> 'rankings_index'
+                i-th column -> total points each team gained in i-th simulation
+                        Note: i-th simulation (column) is named f"s{i}"
+
+            If func_after_simulation is not default, then it will be different.
+            If batch_consumer is not default, whatever it returns.
+
+    """
+
+    num_iterations, num_simulation_per_iteration = num_iteration_simulation
+
+    return batch_simulate_tournaments_template(
+        simulate_rankings__tournament_wide,
+        num_iterations,
+        func_after_simulation,
+        executor=executor,
+        max_workers=max_workers,
+        seed=seed,
+        batch_consumer=batch_consumer,
+        # simulate_rankings__tournament_wide parameters
+        num_simulations=num_simulation_per_iteration,
+        id_to_probabilities=id_to_probabilities,
+        id_to_num_matches=id_to_num_matches,
+        team_codes=team_codes,
+        rankings_index=rankings_index,
+    )
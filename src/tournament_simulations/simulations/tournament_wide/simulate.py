@@ -1,80 +1,115 @@
+import functools
 from typing import Callable
 
 import numpy as np
 import pandas as pd
 
-from tournament_simulations.data_structures.utils import types
-from tournament_simulations.utils.convert_df_to_series import (
-    convert_df_to_series_of_tuples,
+from ..utils.batch_simulations import accepted_kwargs
+from ..utils.simulate_functions import (
+    simulate_points_per_match_per_id,
+    simulate_points_per_team_per_id,
+    simulate_winners_per_id,
 )
 
-from ..utils.simulate_functions import simulate_points_per_match, simulate_winners
+SimulateFunc = Callable[..., np.ndarray]
 
 
 def _simulate_tournament_wide_template(
-    apply_func: Callable[[tuple[types.Probability, int], int], np.ndarray],
+    simulate_func: SimulateFunc,
     num_simulations: int,
-    id_to_prob__num_matches: pd.Series,
+    id_to_probabilities: pd.Series | pd.DataFrame,
+    id_to_num_matches: pd.Series,
     simulation_index: pd.Index | pd.MultiIndex,
+    rng: np.random.Generator | None = None,
+    out: np.ndarray | None = None,
 ) -> pd.DataFrame:
 
-    simulations = id_to_prob__num_matches.apply(
-        apply_func, num_simulations=num_simulations
+    # aligns both, so each id has its probabilities and its number of matches
+    concatenated = pd.concat([id_to_probabilities, id_to_num_matches], axis=1)
+    probabilities = concatenated.iloc[:, :-1]
+    num_matches = concatenated.iloc[:, -1]
+
+    # probabilities as a Series of Mappings instead of a probability matrix
+    if isinstance(id_to_probabilities, pd.Series):
+        probabilities = probabilities.iloc[:, 0]
+
+    optional = accepted_kwargs(simulate_func, rng=rng, out=out)
+    data_for_df = simulate_func(
+        probabilities, num_simulations, num_matches.to_numpy(), **optional
     )
 
-    data_for_df = np.vstack(simulations)
+    # functions without 'out' return their results, which are copied into it
+    if out is not None and "out" not in optional:
+        out[...] = data_for_df
+
     return pd.DataFrame(data_for_df, simulation_index)
 
 
 def simulate_winners__tournament_wide(
     num_simulations: int,
-    id_to_probabilities: pd.Series,
+    id_to_probabilities: pd.Series | pd.DataFrame,
     id_to_num_matches: pd.Series,
     simulation_index: pd.Index | pd.MultiIndex,
+    compact: bool = False,
+    rng: np.random.Generator | None = None,
+    out: np.ndarray | None = None,
 ) -> pd.DataFrame:
 
-    # apply function
-    def _simulate_winners_one_id(
-        prob__num_matches: tuple[types.ResultProbability, int],
-        num_simulations: int,
-    ) -> np.ndarray:
-
-        probabilities, num_matches = prob__num_matches
-        return simulate_winners(probabilities, num_simulations, num_matches)
-
-    concatenated_series = pd.concat([id_to_probabilities, id_to_num_matches], axis=1)
-    id_to_prob__num_matches = convert_df_to_series_of_tuples(concatenated_series)
-
     return _simulate_tournament_wide_template(
-        apply_func=_simulate_winners_one_id,
+        simulate_func=functools.partial(simulate_winners_per_id, compact=compact),
         num_simulations=num_simulations,
-        id_to_prob__num_matches=id_to_prob__num_matches,
+        id_to_probabilities=id_to_probabilities,
+        id_to_num_matches=id_to_num_matches,
         simulation_index=simulation_index,
+        rng=rng,
+        out=out,
     )
 
 
 def simulate_points_per_match__tournament_wide(
     num_simulations: int,
-    id_to_probabilities: pd.Series,
+    id_to_probabilities: pd.Series | pd.DataFrame,
     id_to_num_matches: pd.Series,
     simulation_index: pd.Index | pd.MultiIndex,
+    rng: np.random.Generator | None = None,
+    out: np.ndarray | None = None,
 ) -> pd.DataFrame:
 
-    # apply function
-    def _simulate_points_per_match_one_id(
-        prob__num_matches: tuple[types.PontuationProbability, int],
-        num_simulations: int,
-    ) -> np.ndarray:
+    return _simulate_tournament_wide_template(
+        simulate_func=simulate_points_per_match_per_id,
+        num_simulations=num_simulations,
+        id_to_probabilities=id_to_probabilities,
+        id_to_num_matches=id_to_num_matches,
+        simulation_index=simulation_index,
+        rng=rng,
+        out=out,
+    )
 
-        probabilities, num_matches = prob__num_matches
-        return simulate_points_per_match(probabilities, num_simulations, num_matches)
 
-    concatenated_series = pd.concat([id_to_probabilities, id_to_num_matches], axis=1)
-    id_to_prob__num_matches = convert_df_to_series_of_tuples(concatenated_series)
+def simulate_rankings__tournament_wide(
+    num_simulations: int,
+    id_to_probabilities: pd.Series | pd.DataFrame,
+    id_to_num_matches: pd.Series,
+    team_codes: np.ndarray,
+    rankings_index: pd.Index | pd.MultiIndex,
+    rng: np.random.Generator | None = None,
+    out: np.ndarray | None = None,
+) -> pd.DataFrame:
+
+    # home teams are in even-numbered positions; away teams in odd-numbered ones
+    simulate_func = functools.partial(
+        simulate_points_per_team_per_id,
+        home_codes=team_codes[::2],
+        away_codes=team_codes[1::2],
+        num_teams=len(rankings_index),
+    )
 
     return _simulate_tournament_wide_template(
-        apply_func=_simulate_points_per_match_one_id,
+        simulate_func=simulate_func,
         num_simulations=num_simulations,
-        id_to_prob__num_matches=id_to_prob__num_matches,
-        simulation_index=simulation_index,
+        id_to_probabilities=id_to_probabilities,
+        id_to_num_matches=id_to_num_matches,
+        simulation_index=rankings_index,
+        rng=rng,
+        out=out,
     )
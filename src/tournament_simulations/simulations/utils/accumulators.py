@@ -0,0 +1,303 @@
+"""
+Online statistics over simulations.
+
+Accumulators are 'batch_consumer's: they are updated with one batch at a time
+and only keep O(number of lines) state, so statistics over millions of
+simulations do not require keeping all simulated columns in memory.
+
+Each column of a batch is a simulation; each line (team, match, ...) has
+its own statistics.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Hashable, Iterable, Literal, Sequence, get_args
+
+import numpy as np
+import pandas as pd
+
+# tie-breaking methods of pd.DataFrame.rank which give integer positions
+RankMethod = Literal["min", "max", "first", "dense"]
+
+
+@dataclass
+class _Accumulator(ABC):
+
+    index: pd.Index | None = field(default=None, init=False, repr=False)
+
+    def _check_index(self, batch: pd.DataFrame) -> None:
+        if self.index is None:
+            self.index = batch.index
+        elif len(batch.index) != len(self.index):
+            raise ValueError("All batches must have the same index.")
+
+    @abstractmethod
+    def update(self, batch: pd.DataFrame) -> None:
+        """
+        Add all simulations (columns) in 'batch'.
+        """
+
+    def __call__(self, batches: Iterable[pd.DataFrame]):
+        """
+        Update with all 'batches' and return itself, so it can be used
+        as a 'batch_consumer'.
+        """
+        for batch in batches:
+            self.update(batch)
+
+        return self
+
+
+@dataclass
+class MeanVariance(_Accumulator):
+
+    """
+    Mean and variance of each line, using Welford's algorithm
+    (batches are merged with Chan et al.'s parallel update).
+
+        ddof: int = 1
+            Delta degrees of freedom of the variance (same as pd.DataFrame.var).
+    """
+
+    ddof: int = 1
+    count: int = field(default=0, init=False)
+    _mean: np.ndarray | None = field(default=None, init=False, repr=False)
+    _m2: np.ndarray | None = field(default=None, init=False, repr=False)
+
+    def update(self, batch: pd.DataFrame) -> None:
+        """
+        Add all simulations (columns) in 'batch'.
+        """
+        self._check_index(batch)
+
+        values = batch.to_numpy(dtype=float)
+        batch_count = values.shape[1]
+
+        if batch_count == 0:
+            return
+
+        batch_mean = values.mean(axis=1)
+        batch_m2 = np.square(values - batch_mean[:, np.newaxis]).sum(axis=1)
+
+        if self.count == 0:
+            self.count, self._mean, self._m2 = batch_count, batch_mean, batch_m2
+            return
+
+        total = self.count + batch_count
+        delta = batch_mean - self._mean
+
+        self._mean = self._mean + delta * batch_count / total
+        self._m2 = self._m2 + batch_m2 + delta**2 * self.count * batch_count / total
+        self.count = total
+
+    @property
+    def mean(self) -> pd.Series:
+        """
+        Mean of each line.
+        """
+        return pd.Series(self._mean, index=self.index, name="mean")
+
+    @property
+    def variance(self) -> pd.Series:
+        """
+        Variance of each line. NaN if there are not enough simulations.
+        """
+        num_degrees = self.count - self.ddof
+        variance = self._m2 / num_degrees if num_degrees > 0 else np.nan * self._m2
+
+        return pd.Series(variance, index=self.index, name="variance")
+
+    @property
+    def std(self) -> pd.Series:
+        """
+        Standard deviation of each line.
+        """
+        return np.sqrt(self.variance).rename("std")
+
+
+@dataclass
+class RankHistogram(_Accumulator):
+
+    """
+    How many times each line (team) finished in each position.
+
+    Lines are ranked within each group (usually each tournament) for
+    every simulation: the highest value is the first position.
+
+        level: Hashable | Sequence[Hashable] = "id"
+            Index level(s) defining groups (see pd.DataFrame.groupby).
+
+        method: Literal["min", "max", "first", "dense"] = "min"
+            How ties are ranked (see pd.DataFrame.rank).
+                Example: "min" -> tied teams get the best position.
+
+            Positions must be integers, so "average" is not allowed.
+    """
+
+    level: Hashable | Sequence[Hashable] = "id"
+    method: RankMethod = "min"
+    _counts: np.ndarray | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.method not in get_args(RankMethod):
+            raise ValueError(
+                f"Invalid method: {self.method}. Ranks must be integer positions."
+            )
+
+    def update(self, batch: pd.DataFrame) -> None:
+        """
+        Add all simulations (columns) in 'batch'.
+        """
+        self._check_index(batch)
+
+        groups = batch.groupby(level=self.level, observed=True, sort=False)
+
+        if self._counts is None:
+            num_positions = groups.size().max() if len(batch) else 0
+            self._counts = np.zeros((len(batch), num_positions), dtype=np.int64)
+
+        ranks = groups.rank(ascending=False, method=self.method).to_numpy()
+
+        # missing values are not ranked
+        if np.isnan(ranks).any():
+            raise ValueError("Simulated values must not be missing.")
+
+        positions = ranks.astype(np.int64) - 1
+
+        # scatter-add: (line, position) pairs are flattened into a single bin number
+        num_lines, num_positions = self._counts.shape
+        bins = np.arange(num_lines)[:, np.newaxis] * num_positions + positions
+        self._counts += np.bincount(bins.ravel(), minlength=self._counts.size).reshape(
+            self._counts.shape
+        )
+
+    @property
+    def counts(self) -> pd.DataFrame:
+        """
+        Index -> lines (teams).
+        Columns -> positions, starting from 1.
+        Values -> number of simulations in which the line finished in that position.
+        """
+        num_positions = self._counts.shape[1]
+        columns = pd.RangeIndex(1, num_positions + 1, name="position")
+
+        return pd.DataFrame(self._counts, index=self.index, columns=columns)
+
+    @property
+    def probabilities(self) -> pd.DataFrame:
+        """
+        Same as self.counts, but divided by the number of simulations.
+        """
+        counts = self.counts
+        return counts.div(counts.sum(axis=1), axis=0)
+
+
+@dataclass
+class P2Quantiles(_Accumulator):
+
+    """
+    Estimates quantiles of each line with the P-square algorithm
+    (Jain & Chlamtac), which keeps five markers per line and quantile.
+
+    Simulations are processed one at a time (vectorized over lines), so it is
+    slower than the other accumulators but memory does not grow.
+
+        quantiles: Sequence[float] = (0.05, 0.5, 0.95)
+            Quantiles to be estimated, between 0 and 1.
+    """
+
+    quantiles: Sequence[float] = (0.05, 0.5, 0.95)
+    _first: list[np.ndarray] = field(default_factory=list, init=False, repr=False)
+    _heights: np.ndarray | None = field(default=None, init=False, repr=False)
+    _positions: np.ndarray | None = field(default=None, init=False, repr=False)
+    _desired: np.ndarray | None = field(default=None, init=False, repr=False)
+
+    @property
+    def _increments(self) -> np.ndarray:
+        # shape = [num_quantiles, 1, 5], broadcast over lines
+        p = np.asarray(self.quantiles, dtype=float)[:, np.newaxis, np.newaxis]
+        return np.concatenate([0 * p, p / 2, p, (1 + p) / 2, 0 * p + 1], axis=2)
+
+    def _initialize_markers(self) -> None:
+        # shape = [num_quantiles, num_lines, 5]
+        first = np.sort(np.column_stack(self._first), axis=1)
+        num_quantiles = len(self.quantiles)
+
+        self._heights = np.repeat(first[np.newaxis], num_quantiles, axis=0)
+        self._positions = np.broadcast_to(np.arange(5.0), self._heights.shape).copy()
+        self._desired = 4 * self._increments + 0 * self._heights
+        self._first = []
+
+    def _add_observation(self, x: np.ndarray) -> None:
+
+        q, n = self._heights, self._positions
+
+        # cell k such that q[k] <= x < q[k + 1]; extremes update the markers
+        q[..., 0] = np.minimum(q[..., 0], x)
+        q[..., 4] = np.maximum(q[..., 4], x)
+        k = np.clip((x[..., np.newaxis] >= q[..., 1:4]).sum(axis=-1), 0, 3)
+
+        n += np.arange(5) > k[..., np.newaxis]
+        self._desired += self._increments
+
+        for i in (1, 2, 3):
+            d = self._desired[..., i] - n[..., i]
+            move_right = (d >= 1) & (n[..., i + 1] - n[..., i] > 1)
+            move_left = (d <= -1) & (n[..., i - 1] - n[..., i] < -1)
+            to_move = move_right | move_left
+
+            if not to_move.any():
+                continue
+
+            d = np.where(move_right, 1.0, -1.0)
+
+            q_left, q_i, q_right = q[..., i - 1], q[..., i], q[..., i + 1]
+            n_left, n_i, n_right = n[..., i - 1], n[..., i], n[..., i + 1]
+
+            parabolic = q_i + d / (n_right - n_left) * (
+                (n_i - n_left + d) * (q_right - q_i) / (n_right - n_i)
+                + (n_right - n_i - d) * (q_i - q_left) / (n_i - n_left)
+            )
+            q_neighbour = np.where(move_right, q_right, q_left)
+            n_neighbour = np.where(move_right, n_right, n_left)
+            linear = q_i + d * (q_neighbour - q_i) / (n_neighbour - n_i)
+
+            is_parabolic_valid = (q_left < parabolic) & (parabolic < q_right)
+            new_height = np.where(is_parabolic_valid, parabolic, linear)
+
+            q[..., i] = np.where(to_move, new_height, q_i)
+            n[..., i] = np.where(to_move, n_i + d, n_i)
+
+    def update(self, batch: pd.DataFrame) -> None:
+        """
+        Add all simulations (columns) in 'batch'.
+        """
+        self._check_index(batch)
+
+        for x in batch.to_numpy(dtype=float).T:
+            if self._heights is None:
+                self._first.append(x)
+
+                if len(self._first) == 5:
+                    self._initialize_markers()
+            else:
+                self._add_observation(x)
+
+    @property
+    def values(self) -> pd.DataFrame:
+        """
+        Index -> lines.
+        Columns -> quantiles.
+        Values -> estimated quantile of each line.
+        """
+        if self._heights is None:
+            # less than five simulations: exact quantiles
+            first = np.column_stack(self._first)
+            estimates = np.quantile(first, self.quantiles, axis=1)
+        else:
+            estimates = self._heights[..., 2]
+
+        columns = pd.Index(self.quantiles, name="quantile")
+        return pd.DataFrame(estimates.T, index=self.index, columns=columns)
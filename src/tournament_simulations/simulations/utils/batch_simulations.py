@@ -1,21 +1,342 @@
-from typing import Callable, ParamSpec
+import inspect
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Literal,
+    ParamSpec,
+    TypeVar,
+    get_args,
+)
 
+import numpy as np
 import pandas as pd
 
+from tournament_simulations.utils.seeds import Seed, spawn_seed_sequences
+
 P = ParamSpec("P")
+T = TypeVar("T")
+
+ExecutorType = Literal["serial", "thread", "process"]
+
+# state shared by all batches run in a worker process, see _initialize_worker
+_worker_state: dict[str, Any] = {}
+
+
+def identity(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Default 'func_after_simulation': does nothing.
+
+    Unlike a lambda, it can be sent to other processes.
+    """
+    return df
+
+
+def concat_batches(batches: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Default 'batch_consumer': concatenates all batches into a single dataframe.
+    """
+    return pd.concat(list(batches), axis=1)
+
+
+def reduce_batches(
+    reduce_function: Callable[[T, pd.DataFrame], T], initial: T
+) -> Callable[[Iterable[pd.DataFrame]], T]:
+
+    """
+    Creates a 'batch_consumer' that folds batches into a running accumulator.
+
+    Only the accumulator and the current batch are kept in memory.
+
+    -----
+    Parameters:
+
+        reduce_function: Callable[[T, pd.DataFrame], T]
+            Receives the accumulator and a batch, returns the new accumulator.
+
+        initial: T
+            Initial accumulator.
+
+    -----
+    Returns:
+        Callable[[Iterable[pd.DataFrame]], T]
+            'batch_consumer' returning the final accumulator.
+
+    -----
+    Example:
+        Total points of each team over all simulations:
+            reduce_batches(lambda total, df: total + df.sum(axis=1), 0)
+    """
+
+    def _consume_batches(batches: Iterable[pd.DataFrame]) -> T:
+        accumulator = initial
+
+        for batch in batches:
+            accumulator = reduce_function(accumulator, batch)
+
+        return accumulator
+
+    return _consume_batches
+
+
+def accepted_kwargs(function: Callable, **kwargs: Any) -> dict[str, Any]:
+
+    """
+    Keeps only the keyword arguments 'function' accepts.
+
+    Optional keywords ('rng', 'out') are only passed to functions declaring them
+    (or **kwargs), so functions written before they existed still work.
+    """
+    parameters = inspect.signature(function).parameters.values()
+
+    if any(parameter.kind is parameter.VAR_KEYWORD for parameter in parameters):
+        return kwargs
+
+    names = {parameter.name for parameter in parameters}
+    return {name: value for name, value in kwargs.items() if name in names}
 
 
 def _create_column_names(num_cols: int, num_iteration: int) -> list[str]:
     return [f"s{i + num_cols * num_iteration}" for i in range(num_cols)]
 
 
+def _simulate_one_batch(
+    simulation_function: Callable[..., pd.DataFrame],
+    func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame],
+    num_iteration: int,
+    seed_sequence: np.random.SeedSequence,
+    args: tuple,
+    kwargs: dict[str, Any],
+) -> pd.DataFrame:
+
+    rng = np.random.default_rng(seed_sequence)
+    simulation = simulation_function(
+        *args, **accepted_kwargs(simulation_function, rng=rng), **kwargs
+    )
+
+    # simulated dataframes in all iterations have the same size, so this works
+    num_cols = len(simulation.columns)
+    col_names = _create_column_names(num_cols, num_iteration)
+    simulation_correct_cols = simulation.set_axis(col_names, axis="columns")
+
+    return func_after_simulation(simulation_correct_cols)
+
+
+def _initialize_worker(
+    simulation_function: Callable[..., pd.DataFrame],
+    func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame],
+    args: tuple,
+    kwargs: dict[str, Any],
+) -> None:
+
+    # parameters are sent once per worker instead of once per batch
+    _worker_state.update(
+        simulation_function=simulation_function,
+        func_after_simulation=func_after_simulation,
+        args=args,
+        kwargs=kwargs,
+    )
+
+
+def _simulate_one_batch_in_worker(
+    num_iteration: int, seed_sequence: np.random.SeedSequence
+) -> pd.DataFrame:
+
+    return _simulate_one_batch(
+        num_iteration=num_iteration, seed_sequence=seed_sequence, **_worker_state
+    )
+
+
+def _simulate_into_buffer(
+    simulation_function: Callable[..., pd.DataFrame],
+    num_iterations: int,
+    args: tuple,
+    kwargs: dict[str, Any],
+    executor: ExecutorType,
+    max_workers: int | None,
+    seed: Seed,
+) -> pd.DataFrame:
+
+    seed_sequences = spawn_seed_sequences(seed, num_iterations, "numpy")
+
+    # first batch gives the shape, dtype and index of all batches
+    rng = np.random.default_rng(seed_sequences[0])
+    first_batch = simulation_function(
+        *args, **accepted_kwargs(simulation_function, rng=rng), **kwargs
+    )
+    first_values = first_batch.to_numpy()
+    num_rows, num_cols = first_values.shape
+
+    # column-major, so each batch writes a contiguous block
+    buffer = np.empty(
+        (num_rows, num_cols * num_iterations), dtype=first_values.dtype, order="F"
+    )
+    buffer[:, :num_cols] = first_values
+
+    writes_in_place = "out" in accepted_kwargs(simulation_function, out=None)
+
+    def _simulate_into_slice(num_iteration, seed_sequence):
+        out = buffer[:, num_cols * num_iteration : num_cols * (num_iteration + 1)]
+        rng = np.random.default_rng(seed_sequence)
+        optional = accepted_kwargs(simulation_function, rng=rng, out=out)
+
+        if writes_in_place:
+            simulation_function(*args, **optional, **kwargs)
+        else:
+            out[...] = simulation_function(*args, **optional, **kwargs).to_numpy()
+
+    num_iteration_seed = (range(1, num_iterations), seed_sequences[1:])
+
+    if executor == "thread":
+        with ThreadPoolExecutor(max_workers) as pool:
+            # list makes sure every batch finished (and raises their errors)
+            list(pool.map(_simulate_into_slice, *num_iteration_seed))
+    else:
+        for num_iteration, seed_sequence in zip(*num_iteration_seed):
+            _simulate_into_slice(num_iteration, seed_sequence)
+
+    col_names = _create_column_names(num_cols * num_iterations, 0)
+    return pd.DataFrame(buffer, index=first_batch.index, columns=col_names, copy=False)
+
+
+def _map_in_order(
+    pool: Executor, function: Callable[..., T], *iterables: Iterable, window: int
+) -> Iterator[T]:
+
+    # like pool.map, but at most 'window' batches are running or waiting
+    # to be consumed, so memory stays bounded when the consumer is slower
+    futures = deque()
+
+    for parameters in zip(*iterables):
+        if len(futures) == window:
+            yield futures.popleft().result()
+
+        futures.append(pool.submit(function, *parameters))
+
+    while futures:
+        yield futures.popleft().result()
+
+
+def _generate_batches(
+    simulation_function: Callable[..., pd.DataFrame],
+    num_iterations: int,
+    func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame],
+    args: tuple,
+    kwargs: dict[str, Any],
+    executor: ExecutorType,
+    max_workers: int | None,
+    seed: Seed,
+) -> Iterator[pd.DataFrame]:
+
+    seed_sequences = spawn_seed_sequences(seed, num_iterations, "numpy")
+    num_iteration_seed = (range(num_iterations), seed_sequences)
+
+    # batches simulated ahead of the consumer when using a pool
+    window = 2 * (max_workers or os.cpu_count() or 1)
+
+    match executor:
+        case "serial":
+            for num_iteration, seed_sequence in zip(*num_iteration_seed):
+                yield _simulate_one_batch(
+                    simulation_function,
+                    func_after_simulation,
+                    num_iteration,
+                    seed_sequence,
+                    args,
+                    kwargs,
+                )
+
+        case "thread":
+
+            def _simulate_one_batch_in_thread(num_iteration, seed_sequence):
+                return _simulate_one_batch(
+                    simulation_function,
+                    func_after_simulation,
+                    num_iteration,
+                    seed_sequence,
+                    args,
+                    kwargs,
+                )
+
+            with ThreadPoolExecutor(max_workers) as pool:
+                yield from _map_in_order(
+                    pool,
+                    _simulate_one_batch_in_thread,
+                    *num_iteration_seed,
+                    window=window,
+                )
+
+        case "process":
+            initargs = (simulation_function, func_after_simulation, args, kwargs)
+
+            with ProcessPoolExecutor(
+                max_workers, initializer=_initialize_worker, initargs=initargs
+            ) as pool:
+                yield from _map_in_order(
+                    pool,
+                    _simulate_one_batch_in_worker,
+                    *num_iteration_seed,
+                    window=window,
+                )
+
+
+def iter_batches(
+    simulation_function: Callable[P, pd.DataFrame],
+    num_iterations: int,
+    func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame],
+    *args: P.args,
+    executor: ExecutorType = "serial",
+    max_workers: int | None = None,
+    seed: Seed = None,
+    **kwargs: P.kwargs,
+) -> Iterator[pd.DataFrame]:
+
+    """
+    Simulates a lot of tournaments in batches, yielding one batch at a time.
+
+    Batches are always yielded in order. Parameters are the same as
+    batch_simulate_tournaments_template's.
+
+    When using a pool, only a few batches (twice the number of workers) are
+    simulated ahead of the consumer, so memory does not grow with 'num_iterations'.
+    The pool is shut down once the iterator is exhausted or closed.
+
+    -----
+    Returns:
+        Iterator[pd.DataFrame]
+            i-th batch -> i-th simulated dataframe after 'func_after_simulation'.
+                Its columns are named after the simulations it contains.
+    """
+    if executor not in get_args(ExecutorType):
+        raise ValueError(f"Invalid executor: {executor}.")
+
+    return _generate_batches(
+        simulation_function,
+        num_iterations,
+        func_after_simulation,
+        args,
+        kwargs,
+        executor,
+        max_workers,
+        seed,
+    )
+
+
 def batch_simulate_tournaments_template(
     simulation_function: Callable[P, pd.DataFrame],
     num_iterations: int,
     func_after_simulation: Callable[[pd.DataFrame], pd.DataFrame],
     *args: P.args,
+    executor: ExecutorType = "serial",
+    max_workers: int | None = None,
+    seed: Seed = None,
+    batch_consumer: Callable[[Iterator[pd.DataFrame]], T] = concat_batches,
     **kwargs: P.kwargs,
-) -> pd.DataFrame:
+) -> T:
 
     """
     Template for simulating a lot of tournaments in batches.
@@ -26,9 +347,14 @@ def batch_simulate_tournaments_template(
     -----
     Parameters:
 
-        simulation_function: Callable[[*args, **kwargs], pd.DataFrame]
+        simulation_function: Callable[[*args, rng, **kwargs], pd.DataFrame]
             Simulation function.
 
+            If it accepts a keyword argument 'rng' (np.random.Generator), each
+            batch passes its own stream, which should be its only source of
+            randomness. Otherwise, it is called without it and results do not
+            depend on 'seed'.
+
         num_iterations: tuple[int, int]
             Number of iterations (number of batches).
 
@@ -38,6 +364,40 @@ def batch_simulate_tournaments_template(
         *args, **kwargs
             'simulation_function' parameters.
 
+        executor: Literal["serial", "thread", "process"] = "serial"
+            How batches are run.
+                "serial": one after the other in this process.
+                "thread": in a pool of threads.
+                "process": in a pool of processes.
+                    'simulation_function', 'func_after_simulation' and all
+                    parameters must be picklable (lambdas are not).
+
+            Results do not depend on it: columns are always in the same order
+            and each batch always uses the same random stream.
+
+        max_workers: int | None = None
+            Maximum number of threads or processes.
+            If None, concurrent.futures default is used.
+
+        seed: int | np.random.SeedSequence | np.random.Generator | None = None
+            Seed for the random streams. Each batch uses its own stream,
+            spawned from it.
+
+            If None, it is drawn from numpy's global random state.
+            If it is a np.random.Generator, the seed is drawn from it.
+
+        batch_consumer: Callable[[Iterator[pd.DataFrame]], T] = concat_batches
+            Receives an iterator over all batches (see iter_batches) and
+            returns the final result. It always runs in this process.
+
+            By default, batches are concatenated into a single dataframe.
+                iter -> returns the iterator itself, nothing is simulated
+                    until it is consumed.
+                reduce_batches(func, initial) -> folds batches into an accumulator.
+                npy_sink(directory, num_columns) -> writes batches to disk.
+                MeanVariance(), RankHistogram(), P2Quantiles() -> online statistics
+                    (see accumulators).
+
     -----
     Returns:
         pd.DataFrame
@@ -45,20 +405,43 @@ def batch_simulate_tournaments_template(
                 Index -> Index returned by simulation_function/func_after_simulated
                 Columns -> each column has data for a simulation
                     i-th simulation is named f"s{i}"
-    """
 
-    to_concat: list[pd.DataFrame] = []
+            If batch_consumer is not default, whatever it returns.
 
-    for num_iteration in range(num_iterations):
-
-        simulation = simulation_function(*args, **kwargs)
+    -----
+    Remark:
+        If 'func_after_simulation' is identity, 'batch_consumer' is concat_batches
+        and batches are not run in processes, a single array is allocated for all
+        simulations instead of concatenating batches.
 
-        # simulated dataframes in all iterations have the same size, so this works
-        num_cols = len(simulation.columns)
-        col_names = _create_column_names(num_cols, num_iteration)
-        simulation_correct_cols = simulation.set_axis(col_names, axis="columns")
+        If 'simulation_function' accepts an 'out' keyword argument (np.ndarray),
+        it should write its results into it; otherwise its results are copied.
+    """
+    if (
+        func_after_simulation is identity
+        and batch_consumer is concat_batches
+        and executor in ("serial", "thread")
+        and num_iterations > 0
+    ):
+        return _simulate_into_buffer(
+            simulation_function,
+            num_iterations,
+            args,
+            kwargs,
+            executor,
+            max_workers,
+            seed,
+        )
 
-        final_df = func_after_simulation(simulation_correct_cols)
-        to_concat.append(final_df)
+    batches = iter_batches(
+        simulation_function,
+        num_iterations,
+        func_after_simulation,
+        *args,
+        executor=executor,
+        max_workers=max_workers,
+        seed=seed,
+        **kwargs,
+    )
 
-    return pd.concat(to_concat, axis=1)
+    return batch_consumer(batches)
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Callable, Iterable
+
+import numpy as np
+import pandas as pd
+
+VALUES_FILE = "simulations.npy"
+LABELS_FILE = "labels.pkl"
+
+
+@dataclass(frozen=True)
+class NpySimulations:
+
+    """
+    Lazy handle to simulations stored by npy_sink.
+
+    Nothing is read until it is needed: values are memory-mapped, so only
+    the columns that are used are loaded.
+
+        directory: str | Path
+            Directory passed to npy_sink.
+    """
+
+    directory: str | Path
+
+    @cached_property
+    def values(self) -> np.memmap:
+        """
+        Read-only memory map -> Shape = [num_rows, num_simulations].
+
+        Stored column by column (Fortran order), so reading a few
+        simulations is cheap.
+        """
+        return np.load(Path(self.directory) / VALUES_FILE, mmap_mode="r")
+
+    @cached_property
+    def _labels(self) -> dict[str, pd.Index]:
+        return pd.read_pickle(Path(self.directory) / LABELS_FILE)
+
+    @property
+    def index(self) -> pd.Index:
+        """
+        Index shared by all batches.
+        """
+        return self._labels["index"]
+
+    @property
+    def columns(self) -> pd.Index:
+        """
+        Columns of all batches, in order.
+            By default, f"s{i}" for the i-th simulation.
+        """
+        return self._labels["columns"]
+
+    def to_frame(self, columns: slice | Iterable[int] | None = None) -> pd.DataFrame:
+
+        """
+        Load simulations into a dataframe.
+
+        ----
+        Parameters:
+
+            columns: slice | Iterable[int] | None = None
+                Positions of the simulations to be loaded.
+                If None, all of them are loaded.
+
+        ----
+        Returns:
+            pd.DataFrame
+                Same dataframe the default batch_consumer would have returned
+                (restricted to 'columns').
+        """
+        if columns is None:
+            columns = slice(None)
+        elif not isinstance(columns, slice):
+            columns = list(columns)
+
+        return pd.DataFrame(
+            np.array(self.values[:, columns]),
+            index=self.index,
+            columns=self.columns[columns],
+        )
+
+
+def npy_sink(
+    directory: str | Path, num_columns: int
+) -> Callable[[Iterable[pd.DataFrame]], NpySimulations]:
+
+    """
+    Creates a 'batch_consumer' that writes each batch straight into a
+    preallocated .npy file instead of keeping it in memory.
+
+    Batches must be numeric and have the same index. Compact winners
+    (compact=True) use a single byte per match.
+
+    -----
+    Parameters:
+
+        directory: str | Path
+            Directory in which simulations will be stored. Created if needed.
+                "simulations.npy" -> values (np.lib.format, Fortran order)
+                "labels.pkl" -> index and columns of the batches
+
+        num_columns: int
+            Total number of columns of all batches.
+                Example: num_iterations * num_simulations_per_iteration when
+                'func_after_simulation' is the default one.
+
+    -----
+    Returns:
+        Callable[[Iterable[pd.DataFrame]], NpySimulations]
+            'batch_consumer' returning a lazy handle to the stored simulations.
+            Use NpySimulations(directory) to open them again later.
+    """
+
+    def _consume_batches(batches: Iterable[pd.DataFrame]) -> NpySimulations:
+        path = Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+
+        values = None
+        columns = []
+
+        for batch in batches:
+            if values is None:
+                if batch.dtypes.eq(object).any():
+                    raise ValueError(
+                        "Only numeric batches can be stored, try compact=True."
+                    )
+
+                values = np.lib.format.open_memmap(
+                    path / VALUES_FILE,
+                    mode="w+",
+                    dtype=np.result_type(*batch.dtypes),
+                    shape=(len(batch), num_columns),
+                    fortran_order=True,
+                )
+                index = batch.index
+
+            written = len(columns)
+            end = written + len(batch.columns)
+
+            if end > num_columns or len(batch) != values.shape[0]:
+                raise ValueError(
+                    f"Batch with shape {batch.shape} does not fit in "
+                    f"{values.shape} after {written} columns."
+                )
+
+            values[:, written:end] = batch.to_numpy()
+            columns.extend(batch.columns)
+
+        if values is None:
+            raise ValueError("There are no batches to be stored.")
+
+        if len(columns) != num_columns:
+            raise ValueError(f"Expected {num_columns} columns, {len(columns)} written.")
+
+        values.flush()
+        del values
+
+        labels = {"index": index, "columns": pd.Index(columns)}
+        pd.to_pickle(labels, path / LABELS_FILE)
+
+        return NpySimulations(directory)
+
+    return _consume_batches
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Hashable, Sequence
+
+import numpy as np
+import pandas as pd
+
+from tournament_simulations.data_structures.utils import types
+
+from .simulate_functions import get_index_dtype, stack_probabilities
+
+
+@dataclass(frozen=True)
+class ResultCodes:
+
+    """
+    Lookup table shared by all compact simulations (compact=True).
+
+    Compact simulations store integer codes (usually np.int8) instead of
+    the results themselves: code i represents categories[i].
+
+        categories: tuple[Hashable, ...]
+            Possible results, in the same order used by the simulations.
+    """
+
+    categories: tuple[Hashable, ...]
+
+    @classmethod
+    def from_probabilities(
+        cls, id_to_probabilities: Sequence[types.Probability] | pd.Series
+    ) -> ResultCodes:
+
+        """
+        Create the lookup table used when simulating 'id_to_probabilities'.
+
+        ----
+        Parameters:
+
+            id_to_probabilities: Sequence[Probability] | pd.Series
+                Same probabilities passed to the simulation.
+        """
+        results, _ = stack_probabilities(id_to_probabilities)
+        return cls(tuple(results))
+
+    @property
+    def dtype(self) -> type[np.signedinteger]:
+        """
+        Integer dtype of the codes.
+        """
+        return get_index_dtype(len(self.categories))
+
+    def code(self, result: Hashable) -> int:
+        """
+        Integer code of 'result'.
+        """
+        return self.categories.index(result)
+
+    def to_labels(self, codes: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert a compact simulation into one containing the results themselves.
+        """
+        labels = np.asarray(self.categories, dtype=object)[codes.to_numpy()]
+        return pd.DataFrame(labels, index=codes.index, columns=codes.columns)
+
+    def to_codes(self, labels: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert a simulation containing results into a compact one.
+
+        Results which are not in self.categories are coded as -1.
+        """
+        categories = pd.Index(self.categories, tupleize_cols=False)
+        codes = categories.get_indexer(labels.to_numpy().ravel())
+        codes = codes.astype(self.dtype).reshape(labels.shape)
+        return pd.DataFrame(codes, index=labels.index, columns=labels.columns)
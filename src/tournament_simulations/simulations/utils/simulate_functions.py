@@ -1,7 +1,386 @@
+from typing import Hashable, Sequence
+
 import numpy as np
-from numpy.typing import NDArray
+import pandas as pd
 
 from tournament_simulations.data_structures.utils import types
+from tournament_simulations.utils.seeds import default_rng
+
+# number of (match, simulation) results simulated at once when only their
+# sum is needed, so memory does not grow with the number of matches
+CHUNK_SIZE = 2**16
+
+
+def get_index_dtype(num_results: int) -> type[np.signedinteger]:
+    """
+    Smallest signed integer dtype able to index 'num_results' results.
+    """
+
+    for dtype in (np.int8, np.int16, np.int32):
+        if num_results <= np.iinfo(dtype).max:
+            return dtype
+
+    return np.int64
+
+
+def stack_probabilities(
+    id_to_probabilities: Sequence[types.Probability] | pd.Series | pd.DataFrame,
+) -> tuple[list[Hashable], np.ndarray]:
+
+    """
+    Stacks the probabilities of all ids into a single matrix.
+
+    -----
+    Parameters:
+
+        id_to_probabilities: Sequence[Probability] | pd.Series | pd.DataFrame
+            Probabilities for each id.
+
+            Probabilities are a Mapping (must have .keys() attribute):
+                keys: possible results
+                values: probability for each possible result (float)
+
+            It can also be a probability matrix (pd.DataFrame), such as
+            Matches.probability_matrix_per_id: one column per result.
+
+    -----
+    Returns:
+        tuple[list[Hashable], np.ndarray]
+            Possible results (union of all keys, in order of appearance) and
+            probability matrix -> Shape = [num_ids, num_results].
+
+            If a result is missing for an id, its probability will be zero.
+    """
+    if isinstance(id_to_probabilities, pd.DataFrame):
+        return id_to_probabilities.columns.tolist(), id_to_probabilities.to_numpy(float)
+
+    results = list(
+        dict.fromkeys(
+            result
+            for probabilities in id_to_probabilities
+            for result in probabilities.keys()
+        )
+    )
+
+    matrix = np.array(
+        [
+            [probabilities.get(result, 0) for result in results]
+            for probabilities in id_to_probabilities
+        ],
+        dtype=float,
+    )
+
+    return results, matrix.reshape(len(id_to_probabilities), len(results))
+
+
+def simulate_result_indexes(
+    probabilities: np.ndarray,
+    num_simulations: int,
+    repeats: Sequence[int] | np.ndarray | None = None,
+    rng: np.random.Generator | None = None,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+
+    """
+    Simulates which result happened for each row of 'probabilities' by inverting
+    their cumulative distribution.
+
+    A single block of uniform numbers is drawn for all rows and simulations.
+
+    -----
+    Parameters:
+
+        probabilities: np.ndarray -> Shape = [num_rows, num_results]
+            Each row contains the probability of each result.
+
+        num_simulations: int
+            How many simulations should be made.
+
+        repeats: Sequence[int] | np.ndarray | None = None
+            How many times each row should be simulated.
+                Example: number of matches for each tournament.
+
+            If None, each row will be simulated once.
+
+        rng: np.random.Generator | None = None
+            Random number generator.
+            If None, a new one is seeded from numpy's global random state.
+
+        out: np.ndarray | None = None
+            If provided, results are written into it and it is returned.
+            It must have the returned shape and dtype.
+
+    -----
+    Returns:
+        np.ndarray -> Shape = [sum(repeats), num_simulations]
+            Index of the simulated result (column of 'probabilities').
+            Each column is a different simulation.
+    """
+    if np.any(probabilities < 0):
+        raise ValueError("Probabilities must be non-negative.")
+
+    cumulative = np.cumsum(probabilities, axis=1)
+
+    if not np.allclose(cumulative[:, -1:], 1):
+        raise ValueError("Probabilities do not sum to 1.")
+
+    if repeats is not None:
+        cumulative = np.repeat(cumulative, repeats, axis=0)
+
+    rng = default_rng(rng, "numpy")
+    uniforms = rng.random((cumulative.shape[0], num_simulations))
+
+    if out is None:
+        indexes = np.zeros(uniforms.shape, dtype=get_index_dtype(cumulative.shape[1]))
+    else:
+        indexes = out
+        indexes[...] = 0
+
+    # last column is ignored, so rounding errors never create an invalid index
+    for threshold in cumulative[:, :-1].T:
+        indexes += uniforms >= threshold[:, np.newaxis]
+
+    return indexes
+
+
+def simulate_winners_per_id(
+    id_to_probabilities: Sequence[types.ResultProbability] | pd.Series,
+    num_simulations: int,
+    num_matches: Sequence[int] | np.ndarray | None = None,
+    compact: bool = False,
+    rng: np.random.Generator | None = None,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+
+    """
+    Simulates winners 'num_simulations' times for all ids at once.
+
+    -----
+    Parameters:
+
+        id_to_probabilities: Sequence[Mapping[str, float]] | pd.Series
+            Probabilities of each result (string) for each id.
+            Must have .keys() attribute.
+
+        num_simulations: int
+            How many simulations should be made.
+
+        num_matches: Sequence[int] | np.ndarray | None = None
+            Number of matches to be simulated for each id.
+
+            If None, each id is a single match.
+
+        compact: bool = False
+            If True, results are returned as integer codes (usually np.int8)
+            instead of the results themselves.
+
+            Code i represents the i-th result of stack_probabilities, see
+            ResultCodes.from_probabilities.
+
+        rng: np.random.Generator | None = None
+            Random number generator.
+            If None, a new one is seeded from numpy's global random state.
+
+        out: np.ndarray | None = None
+            If provided, results are written into it and it is returned.
+            It must have the returned shape and dtype.
+
+    -----
+    Returns:
+        np.ndarray -> Shape = [sum(num_matches), num_simulations]
+            Each row has all simulations for a match.
+            Each column is a different simulation.
+    """
+    results, probabilities = stack_probabilities(id_to_probabilities)
+
+    if probabilities.size == 0:
+        dtype = get_index_dtype(len(results)) if compact else None
+        return np.empty((0, num_simulations), dtype=dtype)
+
+    if compact:
+        return simulate_result_indexes(
+            probabilities, num_simulations, num_matches, rng, out
+        )
+
+    indexes = simulate_result_indexes(probabilities, num_simulations, num_matches, rng)
+
+    if out is None:
+        return np.asarray(results)[indexes]
+
+    out[...] = np.asarray(results)[indexes]
+    return out
+
+
+def simulate_points_per_match_per_id(
+    id_to_probabilities: Sequence[types.PontuationProbability] | pd.Series,
+    num_simulations: int,
+    num_matches: Sequence[int] | np.ndarray | None = None,
+    rng: np.random.Generator | None = None,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+
+    """
+    Simulates points 'num_simulations' times for (home, away) teams
+    for all ids at once.
+
+    -----
+    Parameters:
+
+        id_to_probabilities: Sequence[Mapping[tuple[float, float], float]] | pd.Series
+            Mapping like (must have .keys() attribute) for each id:
+                (points gained by home team, points gained by away team): probability
+
+        num_simulations: int
+            How many simulations should be made.
+
+        num_matches: Sequence[int] | np.ndarray | None = None
+            Number of matches to be simulated for each id.
+
+            If None, each id is a single match.
+
+        rng: np.random.Generator | None = None
+            Random number generator.
+            If None, a new one is seeded from numpy's global random state.
+
+        out: np.ndarray | None = None
+            If provided, results are written into it and it is returned.
+            It must have the returned shape and dtype.
+
+    -----
+    Returns:
+        np.ndarray -> Shape = [2*sum(num_matches), num_simulations]
+            Each row has the points for a (team, match) pair.
+            Each column is a different simulation.
+    """
+    pontuations, probabilities = stack_probabilities(id_to_probabilities)
+
+    if probabilities.size == 0:
+        return np.empty((0, num_simulations))
+
+    indexes = simulate_result_indexes(probabilities, num_simulations, num_matches, rng)
+
+    if indexes.size == 0:
+        return np.empty((2 * indexes.shape[0], num_simulations))
+
+    points_table = np.array(pontuations)
+
+    # the desired result for a match isn't [home points, away points].
+    # it should be a column vector instead:
+    #                "points"
+    #    "team"
+    #   team 1:  [ home points,
+    #   team 2:    away points  ]
+    num_rows, num_cols = indexes.shape
+    points = out
+    if points is None:
+        points = np.empty((2 * num_rows, num_cols), dtype=points_table.dtype)
+
+    points[::2] = points_table[:, 0][indexes]
+    points[1::2] = points_table[:, 1][indexes]
+
+    return points
+
+
+def simulate_points_per_team_per_id(
+    id_to_probabilities: Sequence[types.PontuationProbability] | pd.Series,
+    num_simulations: int,
+    num_matches: Sequence[int] | np.ndarray | None,
+    home_codes: np.ndarray,
+    away_codes: np.ndarray,
+    num_teams: int,
+    rng: np.random.Generator | None = None,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+
+    """
+    Simulates total points each team gained 'num_simulations' times for
+    all ids at once.
+
+    Points per match are never stored: matches are simulated in chunks of
+    about CHUNK_SIZE results, which are summed into the teams' totals.
+    So memory depends on num_teams * num_simulations, not on the number
+    of matches.
+
+    -----
+    Parameters:
+
+        id_to_probabilities: Sequence[Mapping[tuple[float, float], float]] | pd.Series
+            Mapping like (must have .keys() attribute) for each id:
+                (points gained by home team, points gained by away team): probability
+
+        num_simulations: int
+            How many simulations should be made.
+
+        num_matches: Sequence[int] | np.ndarray | None
+            Number of matches to be simulated for each id.
+
+            If None, each id is a single match.
+
+        home_codes: np.ndarray -> Shape = [sum(num_matches)]
+            Integer code (from 0 to num_teams - 1) of each match's home team.
+
+        away_codes: np.ndarray -> Shape = [sum(num_matches)]
+            Integer code (from 0 to num_teams - 1) of each match's away team.
+
+        num_teams: int
+            Number of team codes.
+
+        rng: np.random.Generator | None = None
+            Random number generator.
+            If None, a new one is seeded from numpy's global random state.
+
+        out: np.ndarray | None = None
+            If provided, results are written into it and it is returned.
+            It must have the returned shape and dtype.
+
+    -----
+    Returns:
+        np.ndarray -> Shape = [num_teams, num_simulations]
+            Each row has the total points for a team code.
+            Each column is a different simulation.
+    """
+    pontuations, probabilities = stack_probabilities(id_to_probabilities)
+
+    if probabilities.size == 0:
+        if out is None:
+            return np.zeros((num_teams, num_simulations))
+
+        out[...] = 0
+        return out
+
+    if num_matches is not None:
+        probabilities = np.repeat(probabilities, num_matches, axis=0)
+
+    rng = default_rng(rng, "numpy")
+    points_table = np.array(pontuations)
+
+    # scatter-add: (team, simulation) pairs are flattened into a single bin number
+    simulation_number = np.arange(num_simulations)
+    num_bins = num_teams * num_simulations
+    points = np.zeros(num_bins)
+
+    # uniforms are drawn row by row, so chunks give the same results
+    # as simulating all matches at once
+    rows_per_chunk = max(1, CHUNK_SIZE // max(num_simulations, 1))
+
+    for start in range(0, len(probabilities), rows_per_chunk):
+        stop = start + rows_per_chunk
+        indexes = simulate_result_indexes(
+            probabilities[start:stop], num_simulations, rng=rng
+        )
+
+        for side, codes in enumerate((home_codes, away_codes)):
+            bins = codes[start:stop, np.newaxis] * num_simulations + simulation_number
+            side_points = points_table[:, side][indexes]
+            points += np.bincount(bins.ravel(), side_points.ravel(), minlength=num_bins)
+
+    points = points.reshape(num_teams, num_simulations)
+
+    if out is None:
+        return points.astype(points_table.dtype)
+
+    out[...] = points
+    return out
 
 
 def simulate_winners(
@@ -31,11 +410,7 @@ def simulate_winners(
             Each row has all simulations for a match.
             Each column is a different simulation.
     """
-    possible_results = list(probabilities.keys())
-    result_prob = [probabilities[key] for key in possible_results]
-    simul_shape = (num_matches, num_simulations)
-
-    return np.random.choice(possible_results, p=result_prob, size=simul_shape)
+    return simulate_winners_per_id([probabilities], num_simulations, [num_matches])
 
 
 def simulate_points_per_match(
@@ -66,23 +441,6 @@ def simulate_points_per_match(
             Each row has the points for a (team, match) pair.
             Each column is a different simulation.
     """
-    possible_pontuations = [key for key in probabilities.keys()]
-    pontuation_prob = [probabilities[key] for key in possible_pontuations]
-
-    # 'choice' doesn't work with 2d arrays, so we need to simulate 'indexes' instead
-    indexes = range(len(probabilities))
-    simul_shape = (num_matches, num_simulations)
-    index_simulation = np.random.choice(indexes, p=pontuation_prob, size=simul_shape)
-    points_simulations: NDArray = np.array(possible_pontuations)[index_simulation]
-
-    if points_simulations.size == 0:
-        return np.array([])
-    # transpose necessary since the desired result for a match isn't
-    # [home points, away points].
-
-    # it should be a column vector instead:
-    #                "points"
-    #    "team"
-    #   team 1:  [ home points,
-    #   team 2:    away points  ]
-    return np.vstack(points_simulations.transpose(0, 2, 1))  # type: ignore
+    return simulate_points_per_match_per_id(
+        [probabilities], num_simulations, [num_matches]
+    )
@@ -0,0 +1,102 @@
+import random
+from typing import Literal
+
+import numpy as np
+
+# anything np.random.SeedSequence accepts as entropy, or a generator to draw it from
+Seed = int | np.random.SeedSequence | np.random.Generator | None
+
+# global random state used when no seed (or generator) is given
+GlobalState = Literal["random", "numpy"]
+
+
+def entropy_from_global_state(global_state: GlobalState = "random") -> int:
+
+    """
+    Draws entropy from a global random state.
+
+    When no seed is given, generators are seeded from it, so random.seed(...)
+    (or np.random.seed(...)) still makes results reproducible.
+
+    ----
+    Parameters:
+
+        global_state: Literal["random", "numpy"] = "random"
+            "random": python's random module.
+            "numpy": numpy's legacy global state (np.random.seed).
+
+    ----
+    Returns:
+        int
+            Non-negative integer to seed a generator with.
+    """
+    if global_state == "numpy":
+        return int(np.random.randint(0, 2**63 - 1, dtype=np.int64))
+
+    return random.getrandbits(128)
+
+
+def default_rng(
+    rng: Seed = None, global_state: GlobalState = "random"
+) -> np.random.Generator:
+
+    """
+    Same as np.random.default_rng, but if 'rng' is None, the new generator is
+    seeded from 'global_state' (see entropy_from_global_state) instead of
+    fresh entropy.
+    """
+    if rng is None:
+        rng = entropy_from_global_state(global_state)
+
+    return np.random.default_rng(rng)
+
+
+def spawn_seed_sequences(
+    seed: Seed, num_streams: int, global_state: GlobalState = "random"
+) -> list[np.random.SeedSequence]:
+
+    """
+    Creates 'num_streams' independent seed sequences from 'seed'.
+
+    The i-th sequence only depends on 'seed' and i, so results are the same
+    regardless of the order (or the process) in which streams are used.
+
+    'seed' is never modified (unlike np.random.SeedSequence.spawn), so calling
+    it twice with the same seed sequence gives the same streams.
+
+    ----
+    Parameters:
+
+        seed: int | np.random.SeedSequence | np.random.Generator | None
+            Root seed.
+            If None, it is drawn from 'global_state' (see entropy_from_global_state).
+            If it is a np.random.Generator, it is drawn from it (advancing it).
+
+        num_streams: int
+            Number of seed sequences.
+
+        global_state: Literal["random", "numpy"] = "random"
+            Global random state used if 'seed' is None.
+
+    ----
+    Returns:
+        list[np.random.SeedSequence]
+            Use np.random.default_rng(sequence) to create a generator.
+    """
+    if seed is None:
+        seed = entropy_from_global_state(global_state)
+
+    if isinstance(seed, np.random.Generator):
+        seed = seed.integers(0, 2**63 - 1, size=2, dtype=np.int64).tolist()
+
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+
+    return [
+        np.random.SeedSequence(
+            seed.entropy,
+            spawn_key=(*seed.spawn_key, seed.n_children_spawned + i),
+            pool_size=seed.pool_size,
+        )
+        for i in range(num_streams)
+    ]